@@ -0,0 +1,1209 @@
+"""Asyncio clients for Jira, Bitbucket, and Confluence.
+
+``AsyncAtlassianAPI`` mirrors :class:`atlassian.client.AtlassianAPI` on top of
+``httpx.AsyncClient``: ``request()``, ``get()``, ``post()``, ``put()``, and
+``delete()`` are coroutines with the same return values and the same
+:class:`atlassian.error.APIError` semantics.
+
+``AsyncJira``, ``AsyncBitbucket``, and ``AsyncConfluence`` reuse the method
+sets of the synchronous clients. Methods that only build a path and payload
+are inherited unchanged and return awaitables; methods that combine several
+requests are reimplemented here as coroutines.
+
+The optional ``httpx`` dependency is installed with
+``pip install atlassian-api-py[async]``.
+
+Example:
+
+.. code-block:: python
+
+    import asyncio
+
+    from atlassian.aio import AsyncJira
+
+
+    async def main():
+        async with AsyncJira(url="https://jira.company.com", token="token") as jira:
+            issues = await asyncio.gather(*(jira.issue(key) for key in keys))
+
+    asyncio.run(main())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import deque
+from types import SimpleNamespace, TracebackType
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Iterable, NoReturn
+
+from atlassian import jsonlib
+from atlassian.cache import CachedResponse, HTTPCache, TTLCache
+from atlassian.bitbucket import Bitbucket, PullRequestCommentIndex
+from atlassian.client import RESPONSE_FORMATS, AtlassianAPI
+from atlassian.confluence import Confluence
+from atlassian.error import APIError
+from atlassian.jira import _WORKFLOW_FIELDS, FieldRegistry, Jira, _plain
+from atlassian.lazy import LazyNamespace
+from atlassian.logger import get_logger
+from atlassian.ratelimit import RateLimiter
+from atlassian.retry import RetryPolicy, RetryStats
+from atlassian.singleflight import SingleFlight
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+logger.disabled = True
+
+
+class AsyncAtlassianAPI:
+    """Asyncio HTTP client shared by the async Jira, Bitbucket, and Confluence clients.
+
+    Use it with ``async with`` or call :meth:`close` when done so that pooled
+    connections are released.
+
+    :ivar pool_maxsize: ``max_connections``; the default number of calls in
+        flight of :meth:`map` and other concurrent helpers.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        username: str | None = None,
+        password: str | None = None,
+        timeout: int = 60,
+        client: httpx.AsyncClient | None = None,
+        token: str | None = None,
+        verify: bool | str = True,
+        proxies: dict | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_connections: int = 100,
+        response_format: str = "namespace",
+        http_cache: HTTPCache | None = None,
+        metadata_cache: TTLCache | None = None,
+        single_flight: SingleFlight | None = None,
+    ) -> None:
+        """Create an asyncio client for an Atlassian REST API.
+
+        :param url: Base URL of the Atlassian product. Trailing slashes are
+            removed.
+        :type url: str
+        :param username: Username for basic authentication.
+        :type username: str, optional
+        :param password: Password for basic authentication.
+        :type password: str, optional
+        :param timeout: Request timeout in seconds.
+        :type timeout: int, optional
+        :param client: Existing ``httpx.AsyncClient`` to reuse. When omitted, a
+            new client is created with ``verify``, ``proxies``, and
+            ``max_connections`` applied.
+        :type client: httpx.AsyncClient, optional
+        :param token: Bearer token used to set the ``Authorization`` header.
+        :type token: str, optional
+        :param verify: SSL certificate verification, or a path to a CA bundle.
+        :type verify: bool or str, optional
+        :param proxies: Proxy URL for all requests, given as a mapping such as
+            ``{"https": "http://proxy.example.com:8080"}``.
+        :type proxies: dict, optional
+        :param retry: Retry policy applied to every request.
+        :type retry: RetryPolicy, optional
+        :param rate_limiter: Rate limiter consulted before every request. Waits
+            are performed with ``asyncio.sleep()``.
+        :type rate_limiter: RateLimiter, optional
+        :param max_connections: Maximum number of concurrent connections in
+            the pool of a newly created client, and the default concurrency of
+            :meth:`map`.
+        :type max_connections: int, optional
+        :param response_format: Default format of ``get()`` results:
+            ``namespace``, ``lazy``, ``dict``, or ``raw``.
+        :type response_format: str, optional
+        :param http_cache: Conditional request cache used by ``get()``.
+        :type http_cache: HTTPCache, optional
+        :param metadata_cache: In-memory cache for metadata lookups.
+        :type metadata_cache: TTLCache, optional
+        :param single_flight: Coalesces identical concurrent ``GET`` requests
+            into one request.
+        :type single_flight: SingleFlight, optional
+        :raises ValueError: If ``response_format`` is not supported.
+        :raises ImportError: If ``httpx`` is not installed and no client is
+            given.
+        """
+        self.url = url.strip("/")
+        self.username = username
+        self.password = password
+        self.timeout = int(timeout)
+        if response_format not in RESPONSE_FORMATS:
+            raise ValueError(f"Unsupported response_format {response_format!r}")
+        self.response_format = response_format
+        self.retry = retry
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.http_cache = http_cache
+        self.metadata_cache = metadata_cache
+        self.single_flight = single_flight
+        self.pool_maxsize = max_connections
+        if client is None:
+            if httpx is None:
+                raise ImportError(
+                    "The async clients require httpx. "
+                    "Install it with 'pip install atlassian-api-py[async]'."
+                )
+            proxy = None
+            if proxies:
+                proxy = proxies.get("https") or proxies.get("http")
+            client = httpx.AsyncClient(
+                verify=verify,
+                proxy=proxy,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                ),
+            )
+        self._client = client
+        if username and password:
+            self._client.auth = (username, password)
+        elif token is not None:
+            self._client.headers["Authorization"] = f"Bearer {token}"
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """Initialise the per-client state of the product client.
+
+        See :meth:`atlassian.client.AtlassianAPI._init_state`.
+        """
+        init = getattr(super(), "_init_state", None)
+        if init is not None:
+            init()
+
+    async def __aenter__(self) -> AsyncAtlassianAPI:
+        """Return the client for ``async with`` statement usage.
+
+        :return: The API instance.
+        :rtype: AsyncAtlassianAPI
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the client when leaving an ``async with`` block."""
+        await self.close()
+
+    def __enter__(self) -> AsyncAtlassianAPI:
+        """Reject synchronous ``with`` usage.
+
+        :raises TypeError: Always; use ``async with`` instead.
+        """
+        raise TypeError("Use 'async with' with asynchronous clients")
+
+    async def close(self) -> None:
+        """Close the underlying ``httpx.AsyncClient``."""
+        await self._client.aclose()
+
+    async def request(
+        self,
+        method: str = "GET",
+        path: str = "",
+        data: dict | None = None,
+        json: object | None = None,
+        params: dict | None = None,
+        headers: dict | None = None,
+    ) -> Any:
+        """Send an HTTP request through the configured client.
+
+        :param method: The HTTP method (e.g., "GET", "POST", "PUT", "DELETE").
+        :type method: str
+        :param path: Endpoint path appended to ``self.url``.
+        :type path: str
+        :param data: Form data or bytes to send in the request body.
+        :type data: dict or None
+        :param json: JSON payload to send in the request body.
+        :type json: object or None
+        :param params: Query string parameters.
+        :type params: dict or None
+        :param headers: Headers added to the client headers for this request.
+        :type headers: dict or None
+        :return: The HTTP response object.
+        :rtype: httpx.Response
+        :raises APIError: If the response status code is 4xx or 5xx after any
+            retries allowed by ``self.retry``.
+        """
+        url = self.url + path if path else self.url
+        if json is None or data is not None or jsonlib.BACKEND == "json":
+            body: dict = {"data": data, "json": json}
+        else:
+            body = {
+                "content": jsonlib.dumps(json),
+                "headers": {"Content-Type": "application/json"},
+            }
+        if headers:
+            body["headers"] = {**body.get("headers", {}), **headers}
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(path)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                response = await self._client.request(
+                    method, url, params=params, timeout=self.timeout, **body
+                )
+            except httpx.TransportError as e:
+                if self.retry is None or not self.retry.is_retryable(
+                    method, None, attempt
+                ):
+                    if attempt > 1:
+                        self.retry_stats.record_exhausted()
+                    raise
+                await self._backoff(None, self.retry.backoff(attempt), e)
+                continue
+            response.encoding = "utf-8"
+            logger.debug(
+                f"HTTP: {method} -> {response.status_code} {response.reason_phrase}"
+            )
+            if response.status_code < 400:
+                return response
+            if self.retry is not None and self.retry.is_retryable(
+                method, response.status_code, attempt
+            ):
+                delay = self.retry.wait_time(attempt, response.headers)
+                if delay is not None:
+                    await self._backoff(
+                        response.status_code, delay, response.reason_phrase
+                    )
+                    continue
+            if attempt > 1:
+                self.retry_stats.record_exhausted()
+            raise APIError(response.status_code, response.text)
+
+    async def _backoff(
+        self, status_code: int | None, delay: float, reason: object
+    ) -> None:
+        """Sleep before retrying a request and record the retry.
+
+        :param status_code: Status code that triggered the retry, or ``None``
+            for connection errors.
+        :type status_code: int or None
+        :param delay: Delay in seconds.
+        :type delay: float
+        :param reason: Response reason or exception used for logging.
+        :type reason: object
+        """
+        logger.debug(f"HTTP: retrying after {delay:.2f}s ({status_code} {reason})")
+        self.retry_stats.record_retry(status_code, delay)
+        await asyncio.sleep(delay)
+
+    async def get(
+        self,
+        path: str,
+        data: dict | None = None,
+        params: dict | None = None,
+        response_format: str | None = None,
+    ) -> Any:
+        """Send a ``GET`` request and parse the response like ``AtlassianAPI.get``.
+
+        :param path: Endpoint path appended to the base URL.
+        :type path: str
+        :param data: Optional request body data.
+        :type data: dict or None
+        :param params: Query string parameters.
+        :type params: dict or None
+        :param response_format: Override the client ``response_format`` for
+            this call: ``namespace``, ``lazy``, ``dict``, or ``raw``.
+        :type response_format: str, optional
+        :return: The decoded body, raw text when JSON parsing fails, or
+            ``None`` for empty responses.
+        :rtype: SimpleNamespace or LazyNamespace or dict or bytes or str or None
+        :raises APIError: If the response status code is 4xx or 5xx.
+        """
+        if self.single_flight is None or data is not None:
+            response = await self._send_get(path, data, params)
+        else:
+            key = HTTPCache.key(self.url + path, params, self._cache_identity())
+            response = await self.single_flight.do_async(
+                key, lambda: self._send_get(path, None, params)
+            )
+        return AtlassianAPI._get_response_handler(
+            response, response_format or self.response_format
+        )
+
+    async def _send_get(self, path: str, data: dict | None, params: dict | None) -> Any:
+        """Send a ``GET`` request, through ``http_cache`` when configured.
+
+        See :meth:`atlassian.client.AtlassianAPI._send_get`.
+        """
+        if self.http_cache is None or data is not None:
+            return await self.request("GET", path, data=data, params=params)
+        return await self._cached_get(self.http_cache, path, params)
+
+    async def _cached_get(
+        self, cache: HTTPCache, path: str, params: dict | None
+    ) -> Any:
+        """Send a conditional ``GET`` and serve ``304`` responses from the cache.
+
+        See :meth:`atlassian.client.AtlassianAPI._cached_get`.
+        """
+        key = cache.key(self.url + path, params, self._cache_identity())
+        validators = cache.validators(key)
+        response = await self.request("GET", path, params=params, headers=validators)
+        if response.status_code == 304:
+            cached: CachedResponse | None = cache.revalidated(key, response)
+            if cached is not None:
+                return cached
+            response = await self.request("GET", path, params=params)
+        cache.store(key, response)
+        return response
+
+    def _cache_identity(self) -> str:
+        """Return a digest identifying the credentials of the client.
+
+        See :meth:`atlassian.client.AtlassianAPI._cache_identity`.
+        """
+        if self.username:
+            credential = f"basic:{self.username}"
+        else:
+            credential = f"header:{self._client.headers.get('Authorization', '')}"
+        return hashlib.sha256(credential.encode("utf-8")).hexdigest()[:16]
+
+    async def post(
+        self,
+        path: str,
+        data: dict | None = None,
+        json: object | None = None,
+        params: dict | None = None,
+    ) -> dict | None:
+        """Send a ``POST`` request.
+
+        :return: Decoded JSON response, or ``None`` for empty/non-JSON responses.
+        :rtype: dict or None
+        :raises APIError: If the response status code is 4xx or 5xx.
+        """
+        response = await self.request("POST", path, data=data, json=json, params=params)
+        return AtlassianAPI._response_handler(response)
+
+    async def put(
+        self,
+        path: str,
+        data: dict | None = None,
+        json: object | None = None,
+        params: dict | None = None,
+    ) -> dict | None:
+        """Send a ``PUT`` request.
+
+        :return: Decoded JSON response, or ``None`` for empty/non-JSON responses.
+        :rtype: dict or None
+        :raises APIError: If the response status code is 4xx or 5xx.
+        """
+        response = await self.request("PUT", path, data=data, json=json, params=params)
+        return AtlassianAPI._response_handler(response)
+
+    async def delete(
+        self,
+        path: str,
+        data: dict | None = None,
+        json: object | None = None,
+        params: dict | None = None,
+    ) -> dict | None:
+        """Send a ``DELETE`` request.
+
+        :return: Decoded JSON response, or ``None`` for empty/non-JSON responses.
+        :rtype: dict or None
+        :raises APIError: If the response status code is 4xx or 5xx.
+        """
+        response = await self.request(
+            "DELETE", path, data=data, json=json, params=params
+        )
+        return AtlassianAPI._response_handler(response)
+
+    async def map(
+        self,
+        method: Callable[..., Any] | str,
+        args: Iterable[Any],
+        max_workers: int | None = None,
+    ) -> list:
+        """Await a client method for every item of ``args`` concurrently.
+
+        See :meth:`atlassian.client.AtlassianAPI.map`. ``max_workers`` limits
+        the number of calls in flight and defaults to ``pool_maxsize``. Each call
+        is started only when a slot is free, so ``args`` is consumed as calls
+        complete.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        workers = self.pool_maxsize if max_workers is None else max_workers
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        semaphore = asyncio.Semaphore(workers)
+
+        async def call(item: Any) -> Any:
+            try:
+                if isinstance(item, tuple):
+                    return await func(*item)
+                return await func(item)
+            except APIError as e:
+                return e
+            finally:
+                semaphore.release()
+
+        tasks: list[asyncio.Future] = []
+        try:
+            for item in args:
+                await semaphore.acquire()
+                tasks.append(asyncio.ensure_future(call(item)))
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+
+class AsyncJira(AsyncAtlassianAPI, Jira):  # type: ignore[misc]
+    """Asyncio client for Jira REST API operations.
+
+    Every :class:`atlassian.jira.Jira` method is available and must be
+    awaited, except :meth:`sync` and :meth:`mirror`.
+    """
+
+    def sync(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Reject incremental sync on an asynchronous client.
+
+        :raises TypeError: Always; :class:`atlassian.sync.JiraSync` needs a
+            synchronous :class:`atlassian.jira.Jira` client.
+        """
+        raise TypeError("sync() requires a synchronous Jira client")
+
+    def mirror(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Reject a local mirror on an asynchronous client.
+
+        :raises TypeError: Always; :class:`atlassian.mirror.JiraMirror` needs
+            a synchronous :class:`atlassian.jira.Jira` client.
+        """
+        raise TypeError("mirror() requires a synchronous Jira client")
+
+    async def search_issue_with_jql(  # type: ignore[override]
+        self,
+        jql: str,
+        max_result: int = 1000,
+        fields: list[str] | None = None,
+        concurrency: int = 1,
+    ) -> list:
+        """Search issues using JQL.
+
+        See :meth:`atlassian.jira.Jira.search_issue_with_jql`.
+        """
+        return [
+            issue
+            async for issue in self.iter_issues_with_jql(
+                jql, max_result, fields, concurrency=concurrency
+            )
+        ]
+
+    def iter_issues_with_jql(  # type: ignore[override]
+        self,
+        jql: str,
+        max_result: int = 1000,
+        fields: list[str] | None = None,
+        pages: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> AsyncIterator:
+        """Iterate over the issues matching a JQL query with ``async for``.
+
+        Parallel pages are fetched as tasks on the running event loop. See
+        :meth:`atlassian.jira.Jira.iter_issues_with_jql`.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        return self._iter_issues_with_jql(
+            jql, max_result, fields, pages, concurrency, ordered
+        )
+
+    async def _iter_issues_with_jql(  # type: ignore[override]
+        self,
+        jql: str,
+        max_result: int,
+        fields: list[str] | None,
+        pages: bool,
+        concurrency: int,
+        ordered: bool,
+    ) -> AsyncIterator:
+        """Iterate over the issues matching a JQL query with ``async for``.
+
+        See :meth:`iter_issues_with_jql`, which validates the arguments.
+        """
+        fields = await self._search_fields(fields)
+        response = await self._search_page(jql, 0, max_result, fields)
+        if "total" not in response:
+            return
+        total = response["total"]
+        max_results = response["maxResults"]
+        offsets = range(max_results, total, max_results) if max_results else range(0)
+        responses = self._search_pages_concurrently(
+            jql, offsets, max_result, fields, concurrency, ordered
+        )
+        try:
+            while True:
+                issues = response.get("issues") or []
+                if pages:
+                    yield issues
+                else:
+                    for issue in issues:
+                        yield issue
+                try:
+                    response = await responses.__anext__()
+                except StopAsyncIteration:
+                    return
+        finally:
+            await responses.aclose()
+
+    async def _search_fields(self, fields: list[str] | None) -> list[str] | None:  # type: ignore[override]
+        """Resolve the field names of a JQL search to field IDs.
+
+        See :meth:`atlassian.jira.Jira._search_fields`.
+        """
+        if fields is None or not self._needs_field_registry(fields):
+            return fields
+        return self._resolve_search_fields(fields, await self.field_registry())
+
+    async def field_registry(self, refresh: bool = False) -> FieldRegistry:  # type: ignore[override]
+        """Return the field metadata of this Jira, indexed by ID and name.
+
+        See :meth:`atlassian.jira.Jira.field_registry`.
+        """
+        if self._field_registry is None or refresh:
+            if refresh and self.metadata_cache is not None:
+                self.metadata_cache.invalidate("get_fields")
+            fields = await self.get_fields()  # type: ignore[misc]
+            self._field_registry = FieldRegistry(_plain(fields))
+        return self._field_registry
+
+    async def field_id(self, name: str) -> str:  # type: ignore[override]
+        """Return the ID of a field given its ID or name.
+
+        See :meth:`atlassian.jira.Jira.field_id`.
+        """
+        return (await self.field_registry()).field_id(name)
+
+    async def resolve_fields(self, fields: dict) -> dict:  # type: ignore[override]
+        """Return a ``fields`` payload keyed by field IDs.
+
+        See :meth:`atlassian.jira.Jira.resolve_fields`.
+        """
+        return (await self.field_registry()).resolve(fields)
+
+    async def transition_issue_by_name(  # type: ignore[override]
+        self, issue: str | dict, name: str
+    ) -> dict | None:
+        """Move an issue through the workflow transition with the given name.
+
+        See :meth:`atlassian.jira.Jira.transition_issue_by_name`.
+        """
+        if isinstance(issue, dict):
+            return await self._transition_in_state(
+                issue["key"], self._workflow_state(issue), name
+            )
+        response = self._checked_issue(
+            issue,
+            await self.get(
+                f"/rest/api/2/issue/{issue}",
+                params={"fields": ",".join(_WORKFLOW_FIELDS), "expand": "transitions"},
+                response_format="dict",
+            ),
+        )
+        state = self._workflow_state(response)
+        self._remember_transitions(state, response.get("transitions") or [])
+        return await self._transition_in_state(response["key"], state, name, fresh=True)
+
+    async def transition_issues_by_name(  # type: ignore[override]
+        self,
+        issues: Iterable[str | dict],
+        name: str,
+        max_workers: int | None = None,
+    ) -> list:
+        """Move many issues through the workflow transition with the given name.
+
+        See :meth:`atlassian.jira.Jira.transition_issues_by_name`.
+        """
+        issues = list(issues)
+        chunks = self._transition_lookup_chunks(issues)
+        lookups = await self.map(self._issue_states, chunks, max_workers)
+        targets = self._transition_targets(issues, chunks, lookups)
+        unknown = self._unknown_states(targets)
+        await self.map(self._load_transitions, unknown, max_workers)
+        calls = self._transition_calls(targets, name, unknown)
+        responses = await self.map(self._try_transition, calls, max_workers)
+        return self._transition_results(targets, responses)
+
+    async def _transition_in_state(  # type: ignore[override]
+        self, issue_key: str, state: tuple, name: str, fresh: bool = False
+    ) -> dict | None:
+        """Transition an issue whose workflow state is known.
+
+        See :meth:`atlassian.jira.Jira._transition_in_state`.
+        """
+        transition_id = self._cached_transition_id(state, name)
+        if transition_id is not None:
+            try:
+                return await self.issue_transition(issue_key, transition_id)  # type: ignore[misc]
+            except APIError as e:
+                if fresh or e.code != 400:
+                    raise
+        elif fresh:
+            raise self._unknown_transition(issue_key, state, name)
+        await self._load_transitions(issue_key, state)
+        transition_id = self._cached_transition_id(state, name)
+        if transition_id is None:
+            raise self._unknown_transition(issue_key, state, name)
+        return await self.issue_transition(issue_key, transition_id)  # type: ignore[misc]
+
+    async def _try_transition(
+        self, issue_key: str, state: tuple, name: str, fresh: bool
+    ) -> Any:
+        """Call :meth:`_transition_in_state`, returning a ``ValueError``."""
+        try:
+            return await self._transition_in_state(issue_key, state, name, fresh)
+        except ValueError as e:
+            return e
+
+    async def _load_transitions(self, issue_key: str, state: tuple) -> None:  # type: ignore[override]
+        """Request the transitions of an issue and cache them for its state.
+
+        See :meth:`atlassian.jira.Jira._load_transitions`.
+        """
+        url = f"/rest/api/2/issue/{issue_key}/transitions"
+        response = await self.get(url, response_format="dict") or {}
+        self._remember_transitions(state, response.get("transitions") or [])
+
+    async def _issue_states(self, keys: list[str]) -> dict[str, dict]:  # type: ignore[override]
+        """Return the issues with the given keys and their workflow fields.
+
+        See :meth:`atlassian.jira.Jira._issue_states`.
+        """
+        response = await self.post(
+            "/rest/api/2/search", json=self._issue_states_payload(keys)
+        )
+        return {issue["key"]: issue for issue in (response or {}).get("issues") or []}
+
+    async def create_issues_bulk(  # type: ignore[override]
+        self,
+        issues: Iterable[dict],
+        chunk_size: int | None = None,
+        max_workers: int | None = None,
+    ) -> list[dict | APIError | None]:
+        """Create many issues through ``/rest/api/2/issue/bulk``.
+
+        See :meth:`atlassian.jira.Jira.create_issues_bulk`.
+        """
+        chunks = self._bulk_create_chunks(issues, chunk_size)
+        responses = await self.map(self._create_issue_chunk, chunks, max_workers)
+        return self._bulk_create_results(chunks, responses)
+
+    async def _search_page(  # type: ignore[override]
+        self, jql: str, start_at: int, max_result: int, fields: list[str] | None
+    ) -> dict:
+        """Request one page of a JQL search.
+
+        See :meth:`atlassian.jira.Jira._search_page`.
+        """
+        payload = self._jql_payload(jql, start_at, max_result, fields)
+        return await self.post("/rest/api/2/search", json=payload) or {}
+
+    async def _search_pages_concurrently(  # type: ignore[override]
+        self,
+        jql: str,
+        offsets: Iterable[int],
+        max_result: int,
+        fields: list[str] | None,
+        concurrency: int,
+        ordered: bool,
+    ) -> AsyncGenerator[dict, None]:
+        """Request search pages as concurrent tasks.
+
+        With ``concurrency`` of 1 each page is requested only when the
+        previous one has been consumed. See
+        :meth:`atlassian.jira.Jira._search_pages_concurrently`.
+        """
+        remaining = iter(offsets)
+        if concurrency == 1:
+            for start_at in remaining:
+                yield await self._search_page(jql, start_at, max_result, fields)
+            return
+        pending: deque[asyncio.Task] = deque()
+
+        def submit() -> None:
+            start_at = next(remaining, None)
+            if start_at is not None:
+                pending.append(
+                    asyncio.ensure_future(
+                        self._search_page(jql, start_at, max_result, fields)
+                    )
+                )
+
+        try:
+            for _ in range(concurrency):
+                submit()
+            while pending:
+                if ordered:
+                    task = pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = done.pop()
+                    pending.remove(task)
+                response = await task
+                submit()
+                yield response
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncBitbucket(AsyncAtlassianAPI, Bitbucket):  # type: ignore[misc]
+    """Asyncio client for Bitbucket Server/Data Center REST API operations.
+
+    Every :class:`atlassian.bitbucket.Bitbucket` method is available and must
+    be awaited, except :meth:`crawl_repositories`.
+    """
+
+    def crawl_repositories(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Reject a repository crawl on an asynchronous client.
+
+        :raises TypeError: Always; :class:`atlassian.crawler.RepositoryCrawler`
+            needs a synchronous :class:`atlassian.bitbucket.Bitbucket` client.
+        """
+        raise TypeError("crawl_repositories() requires a synchronous Bitbucket client")
+
+    async def _get_paged(  # type: ignore[override]
+        self, url: str, params: dict, response_format: str | None = None
+    ) -> list:
+        """Collect all ``values`` from a paginated Bitbucket endpoint.
+
+        See :meth:`atlassian.bitbucket.Bitbucket._get_paged`.
+        """
+        return [
+            value
+            async for value in self.iter_paged(
+                url, params, response_format=response_format
+            )
+        ]
+
+    async def iter_paged(  # type: ignore[override]
+        self,
+        url: str,
+        params: dict | None = None,
+        response_format: str | None = None,
+        pages: bool = False,
+    ) -> AsyncIterator:
+        """Iterate over the ``values`` of a paginated endpoint with ``async for``.
+
+        The ``iter_*`` listing methods return this iterator. See
+        :meth:`atlassian.bitbucket.Bitbucket.iter_paged`.
+        """
+        params = dict(params or {})
+        limit = params.get("limit")
+        count = 0
+        while True:
+            page = self._page(
+                await self.get(url, params=params, response_format=response_format)
+            )
+            if page is None or (count == 0 and not page[0]):
+                return
+            values, is_last_page, next_page_start = page
+            count += len(values)
+            if pages:
+                yield values
+            else:
+                for value in values:
+                    yield value
+            if is_last_page:
+                return
+            if limit is not None:
+                params["limit"] = limit - count
+                if params["limit"] < 0:
+                    return
+            params["start"] = next_page_start
+
+    async def get_project_repo_name(self, project_key: str) -> list[str]:  # type: ignore[override]
+        """Return repository names for a Bitbucket project."""
+        return [value.name for value in await self.get_project_repo(project_key)]  # type: ignore[misc]
+
+    async def get_merged_branch(  # type: ignore[override]
+        self, project_key: str, repo_slug: str, start: int = 0, limit: int | None = None
+    ) -> list[str]:
+        """Return branch names that Bitbucket marks as merged."""
+        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/branches?base=refs/heads/master&details=true"
+        params = {}
+        if start:
+            params["start"] = start
+        if limit is not None:
+            params["limit"] = limit
+        branches = await self._get_paged(url, params=params)
+        return self._merged_branch_names(branches)
+
+    async def _find_pull_request(  # type: ignore[override]
+        self, project_key: str, repo_slug: str, pr_id: int
+    ) -> SimpleNamespace | LazyNamespace | dict | None:
+        """Return a pull request by ID, using the per-client cache.
+
+        See :meth:`atlassian.bitbucket.Bitbucket._find_pull_request`.
+        """
+        cached = self._cached_pull_request(project_key, repo_slug, pr_id)
+        if cached is not None:
+            return cached
+        try:
+            pr = await self.get_pull_request_overview(project_key, repo_slug, pr_id)  # type: ignore[misc]
+        except APIError as e:
+            if e.code == 404:
+                return None
+            raise
+        return self._cache_pull_request(project_key, repo_slug, pr_id, pr)
+
+    async def get_pull_request_destination_branch_name(  # type: ignore[override]
+        self, project_key: str, repo_slug: str, pr_id: int, limit: int = 0
+    ) -> str | None:
+        """Return the destination branch name for a pull request."""
+        self._warn_limit(limit)
+        return self._ref_display_id(
+            await self._find_pull_request(project_key, repo_slug, pr_id), "toRef"
+        )
+
+    async def get_pull_request_source_branch_name(  # type: ignore[override]
+        self, project_key: str, repo_slug: str, pr_id: int, limit: int = 0
+    ) -> str | None:
+        """Return the source branch name for a pull request."""
+        self._warn_limit(limit)
+        return self._ref_display_id(
+            await self._find_pull_request(project_key, repo_slug, pr_id), "fromRef"
+        )
+
+    async def get_pull_request_jira_key(  # type: ignore[override]
+        self, project_key: str, repo_slug: str, pr_id: int
+    ) -> str | None:
+        """Extract a Jira issue key from a pull request source branch name."""
+        return self._jira_key(
+            await self.get_pull_request_source_branch_name(
+                project_key, repo_slug, pr_id
+            )
+        )
+
+    async def get_pull_request_id(  # type: ignore[override]
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_state: str = "OPEN",
+        start: int = 0,
+        limit: int | None = None,
+    ) -> list[int]:
+        """Return pull request IDs for a repository and state."""
+        prs = await self.get_pull_request(  # type: ignore[misc]
+            project_key, repo_slug, pr_state=pr_state, start=start, limit=limit
+        )
+        return [pr.id for pr in prs]
+
+    async def get_branch_committer_info(  # type: ignore[override]
+        self,
+        project_key: str,
+        repo_slug: str,
+        branch_name: str,
+        start: int = 0,
+        limit: int | None = None,
+    ) -> list:
+        """Return committers for commits reachable from a branch."""
+        commits = await self.get_branch_commits(  # type: ignore[misc]
+            project_key, repo_slug, branch_name, start=start, limit=limit
+        )
+        return [commit.committer for commit in commits]
+
+    async def edit_pull_request_comments(  # type: ignore[override]
+        self, project_key: str, repo_slug: str, pr_id: int, edits: Iterable[dict]
+    ) -> list[dict | None]:
+        """Apply several comment edits to a pull request in one pass.
+
+        See :meth:`atlassian.bitbucket.Bitbucket.edit_pull_request_comments`.
+        """
+        edits = list(edits)
+        await self._refresh_comment_index(
+            project_key,
+            repo_slug,
+            pr_id,
+            [(edit["comment"], self._edit_exact(edit)) for edit in edits],
+        )
+        return [
+            await self._apply_comment_edit(
+                project_key, repo_slug, pr_id, edit, refresh=False
+            )
+            for edit in edits
+        ]
+
+    async def _find_comment_in_activities(  # type: ignore[override]
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        comment: str,
+        exact: bool = False,
+    ) -> dict | None:
+        """Find a comment in pull request activities by matching text."""
+        index = self._comment_index(project_key, repo_slug, pr_id)
+        if not index.stale:
+            found = index.find(comment, exact)
+            if found is not None:
+                return found
+        await self._refresh_comment_index(
+            project_key, repo_slug, pr_id, [(comment, exact)]
+        )
+        return index.find(comment, exact)
+
+    async def _refresh_comment_index(  # type: ignore[override]
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        expected: list[tuple[str, bool]] | None = None,
+    ) -> PullRequestCommentIndex:
+        """Bring the comment index of a pull request up to date.
+
+        See :meth:`atlassian.bitbucket.Bitbucket._refresh_comment_index`.
+        """
+        index = self._comment_index(project_key, repo_slug, pr_id)
+        if not index.stale:
+            activities = []
+            async for activity in self.iter_pull_request_activities(  # type: ignore[attr-defined]
+                project_key, repo_slug, pr_id
+            ):
+                if not index.is_new(activity):
+                    break
+                activities.append(activity)
+            index.add(activities)
+            if index.has_all(expected or []):
+                return index
+        index.rebuild(
+            await self.get_pull_request_activities(project_key, repo_slug, pr_id)  # type: ignore[misc]
+        )
+        return index
+
+    async def _apply_comment_edit(  # type: ignore[override]
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        edit: dict,
+        refresh: bool = True,
+    ) -> dict | None:
+        """Find the comment of one edit in the index and apply the edit.
+
+        See :meth:`atlassian.bitbucket.Bitbucket._apply_comment_edit`.
+        """
+        index = self._comment_index(project_key, repo_slug, pr_id)
+        exact = self._edit_exact(edit)
+        for attempt in (1, 2):
+            if refresh or attempt > 1:
+                found = await self._find_comment_in_activities(
+                    project_key, repo_slug, pr_id, edit["comment"], exact
+                )
+            else:
+                found = index.find(edit["comment"], exact)
+            if not found:
+                return None
+            try:
+                if edit.get("delete"):
+                    response = await self.delete(
+                        self._delete_comment_url(project_key, repo_slug, pr_id, found)
+                    )
+                    index.remove(found["id"])
+                else:
+                    response = await self.put(
+                        self._comment_url(project_key, repo_slug, pr_id, found["id"]),
+                        json=self._comment_payload(
+                            found,
+                            text=edit.get("text"),
+                            severity=edit.get("severity"),
+                            state=edit.get("state"),
+                        ),
+                    )
+                    index.update(found["id"], response)
+                return response
+            except APIError as e:
+                if attempt > 1 or e.code not in (404, 409):
+                    raise
+                index.stale = True
+        return None
+
+    async def _update_pull_request(  # type: ignore[override]
+        self, project_key: str, repo_slug: str, pr_id: int, changes: dict
+    ) -> dict | None:
+        """Apply changes to a pull request at its current version."""
+        pr = await self.get_pull_request_overview(project_key, repo_slug, pr_id)  # type: ignore[misc]
+        if pr is None or isinstance(pr, str):
+            return None
+        url = f"/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}"
+        try:
+            return await self.put(url, json={"version": pr.version, **changes})
+        finally:
+            self.clear_pull_request_cache(project_key, repo_slug, pr_id)
+
+
+class AsyncConfluence(AsyncAtlassianAPI, Confluence):  # type: ignore[misc]
+    """Asyncio client for Confluence REST API operations.
+
+    Every :class:`atlassian.confluence.Confluence` method is available and
+    must be awaited.
+    """
+
+    async def iter_child_pages(  # type: ignore[override]
+        self,
+        page_id: int | str,
+        expand: str | list[str] | None = None,
+        limit: int = 100,
+    ) -> AsyncIterator[dict]:
+        """Iterate over every child page of a page with ``async for``.
+
+        See :meth:`atlassian.confluence.Confluence.iter_child_pages`.
+        """
+        async for child in self._iter_child_pages(
+            page_id, self._expand_param(expand), limit
+        ):
+            yield child
+
+    async def _iter_child_pages(  # type: ignore[override]
+        self, page_id: int | str, expand: str | None, limit: int
+    ) -> AsyncIterator[dict]:
+        """Iterate over the child pages of a page, one request at a time.
+
+        See :meth:`atlassian.confluence.Confluence._iter_child_pages`.
+        """
+        url = f"/rest/api/content/{page_id}/child/page"
+        start = 0
+        while True:
+            params = self._child_page_params(expand, start, limit)
+            response = await self.get(url, params=params, response_format="dict")
+            response = response or {}
+            results = response.get("results") or []
+            for child in results:
+                yield child
+            if not results or "next" not in (response.get("_links") or {}):
+                return
+            start += len(results)
+
+    async def _list_child_pages(  # type: ignore[override]
+        self, page_id: int | str, expand: str | None, limit: int
+    ) -> list[dict]:
+        """Return all child pages of a page.
+
+        See :meth:`atlassian.confluence.Confluence._list_child_pages`.
+        """
+        return [child async for child in self._iter_child_pages(page_id, expand, limit)]
+
+    async def walk_page_tree(  # type: ignore[override]
+        self,
+        root_id: int | str,
+        expand: str | list[str] | None = None,
+        max_workers: int | None = None,
+        max_depth: int | None = None,
+        include_root: bool = True,
+        limit: int = 100,
+    ) -> AsyncIterator[tuple[int, dict]]:
+        """Iterate over the pages below a root page with ``async for``.
+
+        Listings run as concurrent tasks on the running event loop;
+        ``max_workers`` defaults to ``pool_maxsize``. See
+        :meth:`atlassian.confluence.Confluence.walk_page_tree`.
+        """
+        workers = self.pool_maxsize if max_workers is None else max_workers
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        params = self._expand_param(expand, "children.page")
+        if include_root:
+            root = await self.get(
+                f"/rest/api/content/{root_id}",
+                params={"expand": params},
+                response_format="dict",
+            )
+            yield 0, root
+            if not self._has_child_pages(root):
+                return
+        if max_depth is not None and max_depth < 1:
+            return
+        pending: deque[tuple[int | str, int]] = deque([(root_id, 1)])
+        running: dict[asyncio.Task, int] = {}
+        try:
+            while pending or running:
+                while pending and len(running) < workers:
+                    page_id, depth = pending.pop()
+                    task = asyncio.ensure_future(
+                        self._list_child_pages(page_id, params, limit)
+                    )
+                    running[task] = depth
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    depth = running.pop(task)
+                    children = task.result()
+                    if max_depth is None or depth < max_depth:
+                        pending.extend(
+                            (child["id"], depth + 1)
+                            for child in reversed(children)
+                            if self._has_child_pages(child)
+                        )
+                    for child in children:
+                        yield depth, child
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def update_content(  # type: ignore[override]
+        self,
+        page_id: int,
+        title: str,
+        body_value: str,
+        type: str = "page",
+        version: int | None = None,
+    ) -> dict | None:
+        """Update an existing Confluence content item.
+
+        See :meth:`atlassian.confluence.Confluence.update_content`.
+        """
+        if version is None:
+            current = await self.get(
+                f"/rest/api/content/{page_id}", params={"expand": "version"}
+            )
+            if isinstance(current, SimpleNamespace):
+                version = current.version.number + 1
+            else:
+                version = 1
+        url = f"/rest/api/content/{page_id}"
+        json = self._update_content_payload(title, body_value, type, version)
+        return await self.put(url, json=json)
+
+    async def upload_attachment(  # type: ignore[override]
+        self,
+        page_id: int,
+        filename: str,
+        file_data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> dict | None:
+        """Upload a file as an attachment to a page.
+
+        See :meth:`atlassian.confluence.Confluence.upload_attachment`.
+        """
+        url = f"{self.url}/rest/api/content/{page_id}/child/attachment"
+        response = await self._client.post(
+            url,
+            files={"file": (filename, file_data, content_type)},
+            data={"comment": ""},
+            headers={"X-Atlassian-Token": "nocheck"},
+            timeout=self.timeout,
+        )
+        response.encoding = "utf-8"
+        if response.status_code >= 400:
+            raise APIError(response.status_code, response.text)
+        return AtlassianAPI._response_handler(response)  # type: ignore[arg-type]
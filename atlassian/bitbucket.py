@@ -1,14 +1,151 @@
 from __future__ import annotations
 
+import os
 import re
+import threading
+import time
+import warnings
+from collections import OrderedDict
 from types import SimpleNamespace
+from typing import Iterable, Iterator
 
+from atlassian.cache import memoize
 from atlassian.client import AtlassianAPI
+from atlassian.crawler import RepositoryCrawler
+from atlassian.error import APIError
+from atlassian.lazy import LazyNamespace
 from atlassian.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class PullRequestCommentIndex:
+    """Comments of one pull request, indexed from its activity stream.
+
+    ``Bitbucket`` keeps one index per pull request so that comment lookups by
+    text do not download every activity page again. Comments are kept in
+    activity order, newest first, so a lookup returns the same comment as a
+    scan of the activities would. The index is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index that must be built before use."""
+        self.comments: list[dict] = []
+        self.last_activity_id: int | None = None
+        self.stale = True
+        self._lock = threading.Lock()
+
+    def rebuild(self, activities: Iterable) -> None:
+        """Replace the index with the comments of all activities.
+
+        :param activities: Every activity of the pull request, newest first.
+        :type activities: Iterable
+        """
+        activities = list(activities)
+        with self._lock:
+            self.comments = []
+            self.last_activity_id = None
+            self._add(activities)
+            self.stale = False
+
+    def add(self, activities: Iterable) -> None:
+        """Add activities newer than the ones already indexed.
+
+        :param activities: New activities, newest first.
+        :type activities: Iterable
+        """
+        activities = list(activities)
+        with self._lock:
+            self._add(activities)
+
+    def _add(self, activities: list) -> None:
+        """Prepend the comments of ``activities``. Requires the lock."""
+        known = {comment["id"] for comment in self.comments}
+        comments = []
+        for activity in activities:
+            activity_id = getattr(activity, "id", None)
+            if isinstance(activity_id, int) and (
+                self.last_activity_id is None or activity_id > self.last_activity_id
+            ):
+                self.last_activity_id = activity_id
+            record = Bitbucket._comment_record(activity)
+            if record is not None and record["id"] not in known:
+                comments.append(record)
+                known.add(record["id"])
+        self.comments[:0] = comments
+
+    def is_new(self, activity: object) -> bool:
+        """Return whether ``activity`` is newer than the indexed activities.
+
+        :param activity: Pull request activity.
+        :type activity: object
+        :return: ``True`` when the activity has not been indexed yet.
+        :rtype: bool
+        """
+        activity_id = getattr(activity, "id", None)
+        if self.last_activity_id is None or not isinstance(activity_id, int):
+            return True
+        return activity_id > self.last_activity_id
+
+    def find(self, comment: str, exact: bool = False) -> dict | None:
+        """Return the newest comment whose text matches ``comment``.
+
+        :param comment: Text to search for.
+        :type comment: str
+        :param exact: Require the whole text to match instead of a substring.
+        :type exact: bool, optional
+        :return: A copy of the comment with keys ``id``, ``version``,
+            ``text``, ``severity``, and ``state``, or ``None``.
+        :rtype: dict or None
+        """
+        with self._lock:
+            for record in self.comments:
+                text = record["text"]
+                if comment == text if exact else comment in text:
+                    return dict(record)
+        return None
+
+    def has_all(self, lookups: Iterable[tuple[str, bool]]) -> bool:
+        """Return whether every lookup finds a comment.
+
+        :param lookups: ``(comment, exact)`` pairs as passed to :meth:`find`.
+        :type lookups: Iterable[tuple[str, bool]]
+        :return: ``True`` when no lookup comes back empty.
+        :rtype: bool
+        """
+        return all(self.find(comment, exact) is not None for comment, exact in lookups)
+
+    def update(self, comment_id: int, response: object) -> None:
+        """Apply the response of a comment update to the index.
+
+        When the response does not contain the new version, the index is
+        marked stale so that the next lookup rebuilds it.
+
+        :param comment_id: The ID of the updated comment.
+        :type comment_id: int
+        :param response: Decoded response of the update request.
+        :type response: object
+        """
+        with self._lock:
+            if not isinstance(response, dict) or "version" not in response:
+                self.stale = True
+                return
+            for record in self.comments:
+                if record["id"] == comment_id:
+                    for key in ("version", "text", "severity", "state"):
+                        if key in response:
+                            record[key] = response[key]
+
+    def remove(self, comment_id: int) -> None:
+        """Drop a deleted comment from the index.
+
+        :param comment_id: The ID of the deleted comment.
+        :type comment_id: int
+        """
+        with self._lock:
+            self.comments = [c for c in self.comments if c["id"] != comment_id]
+
+
 class Bitbucket(AtlassianAPI):
     """Client for Bitbucket Server/Data Center REST API operations.
 
@@ -20,37 +157,215 @@ class Bitbucket(AtlassianAPI):
         `Bitbucket REST API Documentation <https://docs.atlassian.com/bitbucket-server/rest/7.12.1/bitbucket-rest.html>`_
     """
 
-    def _get_paged(self, url: str, params: dict) -> list:
+    #: Number of pull requests kept by :meth:`_find_pull_request`. Set to
+    #: ``0`` to always fetch pull requests from the server.
+    pull_request_cache_size = 128
+    #: Seconds a cached pull request is used before it is fetched again, so
+    #: pull requests retargeted elsewhere are picked up. ``None`` keeps them
+    #: until they are evicted or cleared.
+    pull_request_cache_ttl: float | None = 300
+    #: Number of pull requests whose comment index is kept.
+    comment_index_size = 32
+
+    def _init_state(self) -> None:
+        """Create the pull request cache, the comment indexes, and their locks."""
+        super()._init_state()
+        self._pull_request_lock = threading.Lock()
+        self._pull_requests: OrderedDict[tuple, tuple[float | None, object]] = (
+            OrderedDict()
+        )
+        self._comment_index_lock = threading.Lock()
+        self._comment_indexes: OrderedDict[tuple, PullRequestCommentIndex] = (
+            OrderedDict()
+        )
+
+    def _get_paged(
+        self, url: str, params: dict, response_format: str | None = None
+    ) -> list:
         """Collect all ``values`` from a paginated Bitbucket endpoint.
 
         :param url: Endpoint path to request.
         :type url: str
         :param params: Query parameters for pagination.
         :type params: dict
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``. Lazy views and plain
+            dictionaries avoid building a ``SimpleNamespace`` per object on
+            large listings.
+        :type response_format: str, optional
         :return: Combined values from each page. Returns an empty list when the
             response is missing ``values`` or cannot be parsed.
         :rtype: list
         """
-        response = self.get(url, params=params)
-        if (
-            not isinstance(response, SimpleNamespace)
-            or not hasattr(response, "values")
-            or not response.values
-        ):
-            return []
-        values = response.values
+        return list(self.iter_paged(url, params, response_format=response_format))
+
+    def iter_paged(
+        self,
+        url: str,
+        params: dict | None = None,
+        response_format: str | None = None,
+        pages: bool = False,
+    ) -> Iterator:
+        """Iterate over the ``values`` of a paginated Bitbucket endpoint.
+
+        Each page is requested only when the previous one has been consumed,
+        so breaking out of the loop stops paging.
+
+        .. code-block:: python
+
+            for commit in bitbucket.iter_paged(
+                "/rest/api/latest/projects/PROJ/repos/repo/commits"
+            ):
+                print(commit.displayId)
+
+        :param url: Endpoint path to request.
+        :type url: str
+        :param params: Query parameters. ``start`` sets the first item and
+            ``limit`` the approximate number of items to return.
+        :type params: dict, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :param pages: Yield the ``values`` list of each page instead of single
+            values.
+        :type pages: bool, optional
+        :return: Iterator over values, or over pages when ``pages`` is true.
+            Iteration stops when a response is missing ``values`` or cannot be
+            parsed.
+        :rtype: Iterator
+        """
+        params = dict(params or {})
         limit = params.get("limit")
-        while not response.isLastPage:
+        count = 0
+        while True:
+            page = self._page(
+                self.get(url, params=params, response_format=response_format)
+            )
+            if page is None or (count == 0 and not page[0]):
+                return
+            values, is_last_page, next_page_start = page
+            count += len(values)
+            if pages:
+                yield values
+            else:
+                yield from values
+            if is_last_page:
+                return
             if limit is not None:
-                params["limit"] = limit - len(values)
+                params["limit"] = limit - count
                 if params["limit"] < 0:
-                    break
-            params["start"] = response.nextPageStart
-            response = self.get(url, params=params)
-            if not isinstance(response, SimpleNamespace):
-                break
-            values += response.values or []
-        return values
+                    return
+            params["start"] = next_page_start
+
+    @staticmethod
+    def _paging_params(start: int | None, limit: int | None) -> dict:
+        """Build the ``start`` and ``limit`` query parameters of a listing.
+
+        :param start: The starting index, omitted when ``0`` or ``None``.
+        :type start: int or None
+        :param limit: The maximum number of results, omitted when ``None``.
+        :type limit: int or None
+        :return: Query parameters.
+        :rtype: dict
+        """
+        params: dict = {}
+        if start:
+            params["start"] = start
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    @staticmethod
+    def _page(response: object) -> tuple[list, bool, int | None] | None:
+        """Read the values and paging state of one Bitbucket page.
+
+        :param response: Page decoded as ``SimpleNamespace``,
+            ``LazyNamespace``, or ``dict``.
+        :type response: object
+        :return: ``(values, isLastPage, nextPageStart)``, or ``None`` when the
+            response is not a page.
+        :rtype: tuple or None
+        """
+        if isinstance(response, (SimpleNamespace, LazyNamespace)):
+            page = vars(response)
+        elif isinstance(response, dict):
+            page = response
+        else:
+            return None
+        if "values" not in page:
+            return None
+        return (
+            page["values"] or [],
+            page.get("isLastPage", True),
+            page.get("nextPageStart"),
+        )
+
+    def iter_projects(
+        self,
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over the projects visible to the current user page by page.
+
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over project objects.
+        :rtype: Iterator
+        """
+        params = self._paging_params(start, limit)
+        return self.iter_paged(
+            "/rest/api/latest/projects", params, response_format=response_format
+        )
+
+    def crawl_repositories(
+        self,
+        projects: Iterable[str] | None = None,
+        max_workers: int | None = None,
+        checkpoint: str | os.PathLike | None = None,
+        branches: bool = True,
+        tags: bool = True,
+    ) -> RepositoryCrawler:
+        """Inventory repositories with their branches and tags concurrently.
+
+        Iterate the returned crawler to receive one record per repository as
+        soon as its branches and tags are listed:
+
+        .. code-block:: python
+
+            crawler = bitbucket.crawl_repositories(checkpoint="inventory.jsonl")
+            for record in crawler:
+                save(record["project"], record["slug"], record["branches"])
+            print(crawler.stats["branches"].throughput)
+
+        See :class:`atlassian.crawler.RepositoryCrawler` for the record layout
+        and checkpoint behavior.
+
+        :param projects: Project keys to crawl. Defaults to every project
+            visible to the client.
+        :type projects: Iterable[str], optional
+        :param max_workers: Number of concurrent listings. Defaults to the
+            connection pool size.
+        :type max_workers: int, optional
+        :param checkpoint: File recording completed repositories, so an
+            interrupted crawl resumes where it stopped.
+        :type checkpoint: str or os.PathLike, optional
+        :param branches: List the branches of each repository.
+        :type branches: bool, optional
+        :param tags: List the tags of each repository.
+        :type tags: bool, optional
+        :return: Repository crawler.
+        :rtype: RepositoryCrawler
+        :raises ValueError: If ``max_workers`` is less than ``1``.
+        """
+        return RepositoryCrawler(
+            self, projects, max_workers, checkpoint, branches=branches, tags=tags
+        )
 
     def get_project_repo(
         self, project_key: str, start: int = 0, limit: int | None = None
@@ -67,13 +382,34 @@ class Bitbucket(AtlassianAPI):
         :rtype: list
         """
         url = f"/rest/api/latest/projects/{project_key}/repos/"
-        params = {}
-        if start:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         return self._get_paged(url, params=params)
 
+    def iter_project_repo(
+        self,
+        project_key: str,
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over repositories in a Bitbucket project page by page.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over repository objects.
+        :rtype: Iterator
+        """
+        url = f"/rest/api/latest/projects/{project_key}/repos/"
+        params = self._paging_params(start, limit)
+        return self.iter_paged(url, params, response_format=response_format)
+
     def get_project_repo_name(self, project_key: str) -> list[str]:
         """Return repository names for a Bitbucket project.
 
@@ -121,13 +457,37 @@ class Bitbucket(AtlassianAPI):
         :rtype: list
         """
         url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/branches"
-        params = {}
-        if start:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         return self._get_paged(url, params=params)
 
+    def iter_repo_branch(
+        self,
+        project_key: str,
+        repo_slug: str,
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over branches in a repository page by page.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over branch objects.
+        :rtype: Iterator
+        """
+        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/branches"
+        params = self._paging_params(start, limit)
+        return self.iter_paged(url, params, response_format=response_format)
+
     def create_branch(
         self, project_key: str, repo_slug: str, branch_name: str, start_point: str
     ) -> dict | None:
@@ -187,13 +547,19 @@ class Bitbucket(AtlassianAPI):
         :rtype: list
         """
         url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/branches?base=refs/heads/master&details=true"
-        params = {}
-        if start:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         branches = self._get_paged(url, params=params)
+        return self._merged_branch_names(branches)
+
+    @staticmethod
+    def _merged_branch_names(branches: list) -> list[str]:
+        """Return display names of branches whose metadata marks them merged.
 
+        :param branches: Branch objects requested with ``details=true``.
+        :type branches: list
+        :return: Merged branch display names.
+        :rtype: list
+        """
         merged_branch = []
         for branch in branches:
             pull_request = [
@@ -242,13 +608,40 @@ class Bitbucket(AtlassianAPI):
         :rtype: list
         """
         url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/commits/?until={branch_name}"
-        params = {}
-        if start:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         return self._get_paged(url, params=params)
 
+    def iter_branch_commits(
+        self,
+        project_key: str,
+        repo_slug: str,
+        branch_name: str,
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over commits reachable from a branch page by page.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param branch_name: The name of the branch.
+        :type branch_name: str
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over commit objects.
+        :rtype: Iterator
+        """
+        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/commits/?until={branch_name}"
+        params = self._paging_params(start, limit)
+        return self.iter_paged(url, params, response_format=response_format)
+
     def get_pull_request(
         self,
         project_key: str,
@@ -275,13 +668,40 @@ class Bitbucket(AtlassianAPI):
         :rtype: list
         """
         url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests?state={pr_state}"
-        params = {}
-        if start:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         return self._get_paged(url, params=params)
 
+    def iter_pull_request(
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_state: str = "ALL",
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over pull requests for a repository page by page.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_state: The state of the pull request (default: ALL).
+        :type pr_state: str, optional
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over pull request objects.
+        :rtype: Iterator
+        """
+        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests?state={pr_state}"
+        params = self._paging_params(start, limit)
+        return self.iter_paged(url, params, response_format=response_format)
+
     def get_pull_request_destination_branch_name(
         self, project_key: str, repo_slug: str, pr_id: int, limit: int = 0
     ) -> str | None:
@@ -293,22 +713,17 @@ class Bitbucket(AtlassianAPI):
         :type repo_slug: str
         :param pr_id: The ID of the pull request.
         :type pr_id: int
-        :return: Destination branch name, or ``None`` when the pull request is
-            not found in the searched pages.
+        :param limit: Deprecated and ignored; the pull request is fetched by
+            ID.
+        :type limit: int, optional
+        :return: Destination branch name, or ``None`` when the pull request
+            does not exist.
         :rtype: str or None
         """
-        max_attempts = 100
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            limit += 25
-            prs = self.get_pull_request(project_key, repo_slug, limit=limit)
-            if not prs:
-                return None
-            for pr in prs:
-                if pr.id == int(pr_id):
-                    return pr.toRef.displayId
-        return None
+        self._warn_limit(limit)
+        return self._ref_display_id(
+            self._find_pull_request(project_key, repo_slug, pr_id), "toRef"
+        )
 
     def get_pull_request_source_branch_name(
         self, project_key: str, repo_slug: str, pr_id: int, limit: int = 0
@@ -321,22 +736,172 @@ class Bitbucket(AtlassianAPI):
         :type repo_slug: str
         :param pr_id: The ID of the pull request.
         :type pr_id: int
-        :return: Source branch name, or ``None`` when the pull request is not
-            found in the searched pages.
+        :param limit: Deprecated and ignored; the pull request is fetched by
+            ID.
+        :type limit: int, optional
+        :return: Source branch name, or ``None`` when the pull request does not
+            exist.
+        :rtype: str or None
+        """
+        self._warn_limit(limit)
+        return self._ref_display_id(
+            self._find_pull_request(project_key, repo_slug, pr_id), "fromRef"
+        )
+
+    @staticmethod
+    def _warn_limit(limit: int) -> None:
+        """Warn that the ``limit`` of the branch name helpers is ignored.
+
+        :param limit: Value passed by the caller.
+        :type limit: int
+        """
+        if limit:
+            warnings.warn(
+                "The limit argument is deprecated and ignored; pull requests "
+                "are fetched by ID.",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+    @staticmethod
+    def _ref_display_id(pr: object, ref: str) -> str | None:
+        """Return the ``displayId`` of a ref of a pull request.
+
+        :param pr: Pull request as a namespace, lazy view, or dictionary.
+        :type pr: object
+        :param ref: ``fromRef`` or ``toRef``.
+        :type ref: str
+        :return: Branch name, or ``None`` when there is no pull request.
         :rtype: str or None
         """
-        max_attempts = 100
-        attempts = 0
-        while attempts < max_attempts:
-            attempts += 1
-            limit += 25
-            prs = self.get_pull_request(project_key, repo_slug, limit=limit)
-            if not prs:
+        if pr is None:
+            return None
+        if isinstance(pr, dict):
+            return pr[ref]["displayId"]
+        return getattr(pr, ref).displayId
+
+    def _find_pull_request(
+        self, project_key: str, repo_slug: str, pr_id: int
+    ) -> SimpleNamespace | LazyNamespace | dict | None:
+        """Return a pull request by ID, using the per-client cache.
+
+        The pull request is fetched with a single
+        :meth:`get_pull_request_overview` request and kept in a small LRU
+        cache of :attr:`pull_request_cache_size` entries for
+        :attr:`pull_request_cache_ttl` seconds, so resolving the source
+        branch, destination branch, and Jira key of one pull request costs one
+        round trip.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :return: The pull request in the client's response format, or
+            ``None`` when it does not exist.
+        :rtype: SimpleNamespace or LazyNamespace or dict or None
+        :raises APIError: If Bitbucket responds with an error other than
+            ``404``.
+        """
+        cached = self._cached_pull_request(project_key, repo_slug, pr_id)
+        if cached is not None:
+            return cached
+        try:
+            pr = self.get_pull_request_overview(project_key, repo_slug, pr_id)
+        except APIError as e:
+            if e.code == 404:
                 return None
-            for pr in prs:
-                if pr.id == int(pr_id):
-                    return pr.fromRef.displayId
-        return None
+            raise
+        return self._cache_pull_request(project_key, repo_slug, pr_id, pr)
+
+    def _cached_pull_request(
+        self, project_key: str, repo_slug: str, pr_id: int
+    ) -> SimpleNamespace | LazyNamespace | dict | None:
+        """Return a cached pull request and mark it as recently used.
+
+        Expired entries are dropped.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :return: The cached pull request, or ``None``.
+        :rtype: SimpleNamespace or LazyNamespace or dict or None
+        """
+        key = (project_key, repo_slug, int(pr_id))
+        with self._pull_request_lock:
+            entry = self._pull_requests.get(key)
+            if entry is None:
+                return None
+            expires, pr = entry
+            if expires is not None and time.monotonic() >= expires:
+                del self._pull_requests[key]
+                return None
+            self._pull_requests.move_to_end(key)
+            return pr  # type: ignore[return-value]
+
+    def _cache_pull_request(
+        self, project_key: str, repo_slug: str, pr_id: int, pr: object
+    ) -> SimpleNamespace | LazyNamespace | dict | None:
+        """Store a fetched pull request in the cache.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param pr: Response of :meth:`get_pull_request_overview`.
+        :type pr: object
+        :return: The pull request, or ``None`` when the response is not a
+            pull request.
+        :rtype: SimpleNamespace or LazyNamespace or dict or None
+        """
+        if not isinstance(pr, (SimpleNamespace, LazyNamespace, dict)):
+            return None
+        if self.pull_request_cache_size > 0:
+            key = (project_key, repo_slug, int(pr_id))
+            ttl = self.pull_request_cache_ttl
+            expires = None if ttl is None else time.monotonic() + ttl
+            with self._pull_request_lock:
+                cache = self._pull_requests
+                cache[key] = (expires, pr)
+                cache.move_to_end(key)
+                while len(cache) > self.pull_request_cache_size:
+                    cache.popitem(last=False)
+        return pr
+
+    def clear_pull_request_cache(
+        self,
+        project_key: str | None = None,
+        repo_slug: str | None = None,
+        pr_id: int | None = None,
+    ) -> None:
+        """Drop cached pull requests.
+
+        Pull requests changed through this client are dropped automatically;
+        call this after they may have been changed elsewhere, for example when
+        a pull request was retargeted in the web UI.
+
+        :param project_key: Only drop pull requests of this project.
+        :type project_key: str, optional
+        :param repo_slug: Only drop pull requests of this repository.
+        :type repo_slug: str, optional
+        :param pr_id: Only drop this pull request.
+        :type pr_id: int, optional
+        """
+        with self._pull_request_lock:
+            cache = self._pull_requests
+            for key in list(cache):
+                if (
+                    (project_key is None or key[0] == project_key)
+                    and (repo_slug is None or key[1] == repo_slug)
+                    and (pr_id is None or key[2] == int(pr_id))
+                ):
+                    del cache[key]
 
     def get_pull_request_jira_key(
         self, project_key: str, repo_slug: str, pr_id: int
@@ -356,9 +921,20 @@ class Bitbucket(AtlassianAPI):
         source_branch_name = self.get_pull_request_source_branch_name(
             project_key, repo_slug, pr_id
         )
-        if source_branch_name is None:
+        return self._jira_key(source_branch_name)
+
+    @staticmethod
+    def _jira_key(branch_name: str | None) -> str | None:
+        """Return the first ``PROJECT-123`` style key in a branch name.
+
+        :param branch_name: Branch name to search.
+        :type branch_name: str or None
+        :return: The Jira issue key, or ``None`` when no key is found.
+        :rtype: str or None
+        """
+        if branch_name is None:
             return None
-        match = re.search(r"[A-Z]+-[0-9]+", source_branch_name)
+        match = re.search(r"[A-Z]+-[0-9]+", branch_name)
         if match is None:
             return None
         return match.group()
@@ -510,13 +1086,40 @@ class Bitbucket(AtlassianAPI):
         :rtype: list
         """
         url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/activities"
-        params = {}
-        if start:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         return self._get_paged(url, params=params)
 
+    def iter_pull_request_activities(
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over activity entries for a pull request page by page.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over activity objects.
+        :rtype: Iterator
+        """
+        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/activities"
+        params = self._paging_params(start, limit)
+        return self.iter_paged(url, params, response_format=response_format)
+
     def get_pull_request_merge(
         self, project_key: str, repo_slug: str, pr_id: int
     ) -> SimpleNamespace | str | None:
@@ -676,28 +1279,9 @@ class Bitbucket(AtlassianAPI):
             found or Bitbucket returns no body.
         :rtype: dict or None
         """
-        activities = self.get_pull_request_activities(project_key, repo_slug, pr_id)
-        comment_id = version = severity = state = None
-        for activity in activities:
-            try:
-                if old_comment in activity.comment.text:
-                    comment_id = activity.comment.id
-                    version = activity.comment.version
-                    severity = activity.comment.severity
-                    state = activity.comment.state
-                    break
-            except AttributeError as e:
-                logger.error(e)
-        if not comment_id:
-            return None
-        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{comment_id}"
-        payload = {
-            "version": version,
-            "text": new_comment,
-            "severity": severity,
-            "state": state,
-        }
-        return self.put(url, json=payload)
+        return self._update_found_comment(
+            project_key, repo_slug, pr_id, old_comment, text=new_comment
+        )
 
     def delete_pull_request_comment(
         self, project_key: str, repo_slug: str, pr_id: int, comment: str
@@ -716,30 +1300,95 @@ class Bitbucket(AtlassianAPI):
             found or Bitbucket returns no body.
         :rtype: dict or None
         """
-        activities = self.get_pull_request_activities(project_key, repo_slug, pr_id)
-        comment_id = version = None
-        for activity in activities:
-            try:
-                if comment == activity.comment.text:
-                    comment_id = activity.comment.id
-                    version = activity.comment.version
-                    break
-            except AttributeError as e:
-                logger.error(e)
-        if not comment_id:
-            return None
-        url = (
-            f"/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{comment_id}"
-            f"?version={version}"
+        return self._apply_comment_edit(
+            project_key, repo_slug, pr_id, {"comment": comment, "delete": True}
         )
-        return self.delete(url)
+
+    @staticmethod
+    def _delete_comment_url(
+        project_key: str, repo_slug: str, pr_id: int, found: dict
+    ) -> str:
+        """Return the REST path that deletes a comment at its current version.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param found: Comment details with ``id`` and ``version`` keys.
+        :type found: dict
+        :return: Comment deletion path.
+        :rtype: str
+        """
+        return (
+            f"/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{found['id']}"
+            f"?version={found['version']}"
+        )
+
+    def edit_pull_request_comments(
+        self, project_key: str, repo_slug: str, pr_id: int, edits: Iterable[dict]
+    ) -> list[dict | None]:
+        """Apply several comment edits to a pull request in one pass.
+
+        The comment index of the pull request is refreshed once, then each
+        edit is matched against it and applied. Each edit is a dict with:
+
+        * ``comment`` -- text to search for (required).
+        * ``exact`` -- match the whole text instead of a substring.
+        * ``text``, ``severity``, ``state`` -- new values; omitted values are
+          kept.
+        * ``delete`` -- delete the comment instead of updating it.
+
+        .. code-block:: python
+
+            bitbucket.edit_pull_request_comments("PROJ", "repo", 42, [
+                {"comment": "Coverage: 81%", "text": "Coverage: 84%"},
+                {"comment": "Build failed", "state": "RESOLVED"},
+                {"comment": "Outdated note", "exact": True, "delete": True},
+            ])
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param edits: Edits to apply, in order.
+        :type edits: Iterable[dict]
+        :return: One decoded API response per edit, or ``None`` for edits
+            whose comment is not found or when Bitbucket returns no body.
+        :rtype: list
+        """
+        edits = list(edits)
+        self._refresh_comment_index(
+            project_key,
+            repo_slug,
+            pr_id,
+            [(edit["comment"], self._edit_exact(edit)) for edit in edits],
+        )
+        return [
+            self._apply_comment_edit(project_key, repo_slug, pr_id, edit, refresh=False)
+            for edit in edits
+        ]
 
     def _find_comment_in_activities(
-        self, project_key: str, repo_slug: str, pr_id: int, comment: str
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        comment: str,
+        exact: bool = False,
     ) -> dict | None:
         """
         Find a comment in pull request activities by matching text.
 
+        The comments are looked up in the pull request comment index. The
+        index downloads every activity on first use; afterwards a lookup that
+        finds nothing reads the activities added since the last refresh, and
+        if the comment is still missing, for example because its text was
+        edited elsewhere, rebuilds the index from all activities once.
+
         :param project_key: The key of the project.
         :type project_key: str
         :param repo_slug: The slug of the repository.
@@ -748,25 +1397,326 @@ class Bitbucket(AtlassianAPI):
         :type pr_id: int
         :param comment: The comment text to search for (substring match).
         :type comment: str
+        :param exact: Require the whole text to match instead of a substring.
+        :type exact: bool, optional
+        :return: A dict with keys ``id``, ``version``, ``text``, ``severity``, and
+            ``state`` when found, or ``None`` if no matching comment exists.
+        :rtype: dict | None
+        """
+        index = self._comment_index(project_key, repo_slug, pr_id)
+        if not index.stale:
+            found = index.find(comment, exact)
+            if found is not None:
+                return found
+        self._refresh_comment_index(project_key, repo_slug, pr_id, [(comment, exact)])
+        return index.find(comment, exact)
+
+    def _refresh_comment_index(
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        expected: list[tuple[str, bool]] | None = None,
+    ) -> PullRequestCommentIndex:
+        """Bring the comment index of a pull request up to date.
+
+        A stale index is rebuilt from all activities. Otherwise only the
+        activities newer than the indexed ones are read; activities are
+        returned newest first, so paging stops at the first known activity.
+        Comments edited elsewhere keep their old text in the index, so when
+        an ``expected`` comment is still missing after that, the index is
+        rebuilt once.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param expected: ``(comment, exact)`` lookups the caller is about to
+            make.
+        :type expected: list[tuple[str, bool]], optional
+        :return: The refreshed index.
+        :rtype: PullRequestCommentIndex
+        """
+        index = self._comment_index(project_key, repo_slug, pr_id)
+        if not index.stale:
+            activities = []
+            for activity in self.iter_pull_request_activities(
+                project_key, repo_slug, pr_id
+            ):
+                if not index.is_new(activity):
+                    break
+                activities.append(activity)
+            index.add(activities)
+            if index.has_all(expected or []):
+                return index
+        index.rebuild(self.get_pull_request_activities(project_key, repo_slug, pr_id))
+        return index
+
+    @staticmethod
+    def _edit_exact(edit: dict) -> bool:
+        """Return whether a comment edit matches the whole comment text.
+
+        :param edit: Edit as described in :meth:`edit_pull_request_comments`.
+        :type edit: dict
+        :return: The ``exact`` option, which defaults to ``True`` for deletes.
+        :rtype: bool
+        """
+        return edit.get("exact", bool(edit.get("delete")))
+
+    def _comment_index(
+        self, project_key: str, repo_slug: str, pr_id: int
+    ) -> PullRequestCommentIndex:
+        """Return the comment index of a pull request, creating it if needed.
+
+        At most :attr:`comment_index_size` indexes are kept; the least
+        recently used one is dropped first.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :return: The comment index.
+        :rtype: PullRequestCommentIndex
+        """
+        key = (project_key, repo_slug, int(pr_id))
+        with self._comment_index_lock:
+            indexes = self._comment_indexes
+            index = indexes.get(key)
+            if index is None:
+                index = indexes[key] = PullRequestCommentIndex()
+            indexes.move_to_end(key)
+            while len(indexes) > max(self.comment_index_size, 1):
+                indexes.popitem(last=False)
+            return index
+
+    def clear_comment_index(
+        self,
+        project_key: str | None = None,
+        repo_slug: str | None = None,
+        pr_id: int | None = None,
+    ) -> None:
+        """Drop pull request comment indexes.
+
+        Indexes recover from comments changed elsewhere by rebuilding when a
+        lookup finds nothing or Bitbucket rejects an update with ``404`` or
+        ``409``. Clear them to free memory or force a rebuild.
+
+        :param project_key: Only drop indexes of this project.
+        :type project_key: str, optional
+        :param repo_slug: Only drop indexes of this repository.
+        :type repo_slug: str, optional
+        :param pr_id: Only drop the index of this pull request.
+        :type pr_id: int, optional
+        """
+        with self._comment_index_lock:
+            indexes = self._comment_indexes
+            for key in list(indexes):
+                if (
+                    (project_key is None or key[0] == project_key)
+                    and (repo_slug is None or key[1] == repo_slug)
+                    and (pr_id is None or key[2] == int(pr_id))
+                ):
+                    del indexes[key]
+
+    @staticmethod
+    def _comment_record(activity: object) -> dict | None:
+        """Return the comment of an activity as an index record.
+
+        :param activity: Pull request activity.
+        :type activity: object
+        :return: A dict with keys ``id``, ``version``, ``text``, ``severity``,
+            and ``state``, or ``None`` when the activity has no comment.
+        :rtype: dict or None
+        """
+        comment = getattr(activity, "comment", None)
+        if comment is None:
+            return None
+        try:
+            return {
+                "id": comment.id,
+                "version": comment.version,
+                "text": comment.text,
+                "severity": getattr(comment, "severity", None),
+                "state": getattr(comment, "state", None),
+            }
+        except AttributeError as e:
+            logger.error("Could not read comment from activity %s: %s", activity, e)
+            return None
+
+    @staticmethod
+    def _match_comment(
+        activities: list, comment: str, exact: bool = False
+    ) -> dict | None:
+        """Return the first comment in ``activities`` that matches ``comment``.
+
+        :param activities: Pull request activity objects.
+        :type activities: list
+        :param comment: The comment text to search for.
+        :type comment: str
+        :param exact: Require the whole text to match instead of a substring.
+        :type exact: bool, optional
         :return: A dict with keys ``id``, ``version``, ``text``, ``severity``, and
             ``state`` when found, or ``None`` if no matching comment exists.
         :rtype: dict | None
         """
-        activities = self.get_pull_request_activities(project_key, repo_slug, pr_id)
         for activity in activities:
+            record = Bitbucket._comment_record(activity)
+            if record is None:
+                continue
+            text = record["text"]
+            if comment == text if exact else comment in text:
+                return record
+        return None
+
+    def _update_found_comment(
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        comment: str,
+        text: str | None = None,
+        severity: str | None = None,
+        state: str | None = None,
+    ) -> dict | None:
+        """Find a pull request comment by text and change its content or status.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param comment: Comment text to search for (substring match).
+        :type comment: str
+        :param text: New text. Keeps the current text when omitted.
+        :type text: str, optional
+        :param severity: New severity. Keeps the current severity when omitted.
+        :type severity: str, optional
+        :param state: New state. Keeps the current state when omitted.
+        :type state: str, optional
+        :return: Decoded API response, or ``None`` when no matching comment is
+            found or Bitbucket returns no body.
+        :rtype: dict or None
+        """
+        edit = {"comment": comment, "text": text, "severity": severity, "state": state}
+        return self._apply_comment_edit(project_key, repo_slug, pr_id, edit)
+
+    def _apply_comment_edit(
+        self,
+        project_key: str,
+        repo_slug: str,
+        pr_id: int,
+        edit: dict,
+        refresh: bool = True,
+    ) -> dict | None:
+        """Find the comment of one edit in the index and apply the edit.
+
+        When Bitbucket rejects the request with ``404`` or ``409`` because
+        the comment was changed or deleted elsewhere, the index is rebuilt
+        and the edit is retried once.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param edit: Edit as described in :meth:`edit_pull_request_comments`.
+        :type edit: dict
+        :param refresh: Refresh the index when the comment is not found.
+        :type refresh: bool, optional
+        :return: Decoded API response, or ``None`` when no matching comment is
+            found or Bitbucket returns no body.
+        :rtype: dict or None
+        :raises APIError: If the request fails for another reason or fails
+            again after the retry.
+        """
+        index = self._comment_index(project_key, repo_slug, pr_id)
+        exact = self._edit_exact(edit)
+        for attempt in (1, 2):
+            if refresh or attempt > 1:
+                found = self._find_comment_in_activities(
+                    project_key, repo_slug, pr_id, edit["comment"], exact
+                )
+            else:
+                found = index.find(edit["comment"], exact)
+            if not found:
+                return None
             try:
-                if comment in activity.comment.text:
-                    return {
-                        "id": activity.comment.id,
-                        "version": activity.comment.version,
-                        "text": activity.comment.text,
-                        "severity": activity.comment.severity,
-                        "state": activity.comment.state,
-                    }
-            except AttributeError as e:
-                logger.error("Could not read comment from activity %s: %s", activity, e)
+                if edit.get("delete"):
+                    response = self.delete(
+                        self._delete_comment_url(project_key, repo_slug, pr_id, found)
+                    )
+                    index.remove(found["id"])
+                else:
+                    response = self.put(
+                        self._comment_url(project_key, repo_slug, pr_id, found["id"]),
+                        json=self._comment_payload(
+                            found,
+                            text=edit.get("text"),
+                            severity=edit.get("severity"),
+                            state=edit.get("state"),
+                        ),
+                    )
+                    index.update(found["id"], response)
+                return response
+            except APIError as e:
+                if attempt > 1 or e.code not in (404, 409):
+                    raise
+                index.stale = True
         return None
 
+    @staticmethod
+    def _comment_url(
+        project_key: str, repo_slug: str, pr_id: int, comment_id: int
+    ) -> str:
+        """Return the REST path of a pull request comment.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param comment_id: The ID of the comment.
+        :type comment_id: int
+        :return: Comment path.
+        :rtype: str
+        """
+        return f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{comment_id}"
+
+    @staticmethod
+    def _comment_payload(
+        found: dict,
+        text: str | None = None,
+        severity: str | None = None,
+        state: str | None = None,
+    ) -> dict:
+        """Build the payload that updates a comment found in the activities.
+
+        :param found: Comment details returned by
+            :meth:`_find_comment_in_activities`.
+        :type found: dict
+        :param text: New text. Keeps the current text when omitted.
+        :type text: str, optional
+        :param severity: New severity. Keeps the current severity when omitted.
+        :type severity: str, optional
+        :param state: New state. Keeps the current state when omitted.
+        :type state: str, optional
+        :return: Comment update payload.
+        :rtype: dict
+        """
+        return {
+            "version": found["version"],
+            "text": found["text"] if text is None else text,
+            "severity": found["severity"] if severity is None else severity,
+            "state": found["state"] if state is None else state,
+        }
+
     def resolve_pull_request_comment(
         self, project_key: str, repo_slug: str, pr_id: int, comment: str
     ) -> dict | None:
@@ -784,17 +1734,9 @@ class Bitbucket(AtlassianAPI):
             found or Bitbucket returns no body.
         :rtype: dict or None
         """
-        found = self._find_comment_in_activities(project_key, repo_slug, pr_id, comment)
-        if not found:
-            return None
-        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{found['id']}"
-        payload = {
-            "version": found["version"],
-            "text": found["text"],
-            "severity": found["severity"],
-            "state": "RESOLVED",
-        }
-        return self.put(url, json=payload)
+        return self._update_found_comment(
+            project_key, repo_slug, pr_id, comment, state="RESOLVED"
+        )
 
     def reopen_pull_request_comment(
         self, project_key: str, repo_slug: str, pr_id: int, comment: str
@@ -813,17 +1755,9 @@ class Bitbucket(AtlassianAPI):
             found or Bitbucket returns no body.
         :rtype: dict or None
         """
-        found = self._find_comment_in_activities(project_key, repo_slug, pr_id, comment)
-        if not found:
-            return None
-        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{found['id']}"
-        payload = {
-            "version": found["version"],
-            "text": found["text"],
-            "severity": found["severity"],
-            "state": "OPEN",
-        }
-        return self.put(url, json=payload)
+        return self._update_found_comment(
+            project_key, repo_slug, pr_id, comment, state="OPEN"
+        )
 
     def convert_comment_to_task(
         self, project_key: str, repo_slug: str, pr_id: int, comment: str
@@ -842,17 +1776,9 @@ class Bitbucket(AtlassianAPI):
             found or Bitbucket returns no body.
         :rtype: dict or None
         """
-        found = self._find_comment_in_activities(project_key, repo_slug, pr_id, comment)
-        if not found:
-            return None
-        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{found['id']}"
-        payload = {
-            "version": found["version"],
-            "text": found["text"],
-            "severity": "BLOCKER",
-            "state": found["state"],
-        }
-        return self.put(url, json=payload)
+        return self._update_found_comment(
+            project_key, repo_slug, pr_id, comment, severity="BLOCKER"
+        )
 
     def convert_task_to_comment(
         self, project_key: str, repo_slug: str, pr_id: int, comment: str
@@ -871,17 +1797,9 @@ class Bitbucket(AtlassianAPI):
             found or Bitbucket returns no body.
         :rtype: dict or None
         """
-        found = self._find_comment_in_activities(project_key, repo_slug, pr_id, comment)
-        if not found:
-            return None
-        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}/comments/{found['id']}"
-        payload = {
-            "version": found["version"],
-            "text": found["text"],
-            "severity": "NORMAL",
-            "state": found["state"],
-        }
-        return self.put(url, json=payload)
+        return self._update_found_comment(
+            project_key, repo_slug, pr_id, comment, severity="NORMAL"
+        )
 
     def get_file_change_history(
         self,
@@ -913,13 +1831,46 @@ class Bitbucket(AtlassianAPI):
             f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/commits?followRenames=true&path={file_path}&"
             f"until=refs%2Fheads%2F{branch_name}&start=0&avatarSize=32"
         )
-        params = {}
-        if start:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         return self._get_paged(url, params=params)
 
+    def iter_file_change_history(
+        self,
+        project_key: str,
+        repo_slug: str,
+        branch_name: str,
+        file_path: str,
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over the commit history of a file on a branch page by page.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param branch_name: The name of the branch.
+        :type branch_name: str
+        :param file_path: The path of the file.
+        :type file_path: str
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over commit history objects.
+        :rtype: Iterator
+        """
+        url = (
+            f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/commits?followRenames=true&path={file_path}&"
+            f"until=refs%2Fheads%2F{branch_name}&start=0&avatarSize=32"
+        )
+        params = self._paging_params(start, limit)
+        return self.iter_paged(url, params, response_format=response_format)
+
     def get_file_content(
         self, project_key: str, repo_slug: str, branch_name: str, file_path: str
     ) -> SimpleNamespace | str | None:
@@ -989,6 +1940,7 @@ class Bitbucket(AtlassianAPI):
         }
         return self.post(url, json=payload)
 
+    @memoize
     def get_user(self, user_slug: str) -> SimpleNamespace | str | None:
         """Return Bitbucket user information by user slug.
 
@@ -1048,12 +2000,9 @@ class Bitbucket(AtlassianAPI):
             be loaded or Bitbucket returns no body.
         :rtype: dict or None
         """
-        pr = self.get_pull_request_overview(project_key, repo_slug, pr_id)
-        if pr is None or isinstance(pr, str):
-            return None
-        url = f"/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}"
-        payload = {"version": pr.version, "description": new_description}
-        return self.put(url, json=payload)
+        return self._update_pull_request(
+            project_key, repo_slug, pr_id, {"description": new_description}
+        )
 
     def update_pull_request_title(
         self, project_key: str, repo_slug: str, pr_id: int, new_title: str
@@ -1072,12 +2021,9 @@ class Bitbucket(AtlassianAPI):
             be loaded or Bitbucket returns no body.
         :rtype: dict or None
         """
-        pr = self.get_pull_request_overview(project_key, repo_slug, pr_id)
-        if pr is None or isinstance(pr, str):
-            return None
-        url = f"/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}"
-        payload = {"version": pr.version, "title": new_title}
-        return self.put(url, json=payload)
+        return self._update_pull_request(
+            project_key, repo_slug, pr_id, {"title": new_title}
+        )
 
     def update_pull_request_reviewers(
         self, project_key: str, repo_slug: str, pr_id: int, reviewers: list
@@ -1096,12 +2042,9 @@ class Bitbucket(AtlassianAPI):
             be loaded or Bitbucket returns no body.
         :rtype: dict or None
         """
-        pr = self.get_pull_request_overview(project_key, repo_slug, pr_id)
-        if pr is None or isinstance(pr, str):
-            return None
-        url = f"/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}"
-        payload = {"version": pr.version, "reviewers": reviewers}
-        return self.put(url, json=payload)
+        return self._update_pull_request(
+            project_key, repo_slug, pr_id, {"reviewers": reviewers}
+        )
 
     def update_pull_request_destination(
         self, project_key: str, repo_slug: str, pr_id: int, new_destination: str
@@ -1120,15 +2063,39 @@ class Bitbucket(AtlassianAPI):
             be loaded or Bitbucket returns no body.
         :rtype: dict or None
         """
+        return self._update_pull_request(
+            project_key,
+            repo_slug,
+            pr_id,
+            {"destination": {"branch": {"name": new_destination}}},
+        )
+
+    def _update_pull_request(
+        self, project_key: str, repo_slug: str, pr_id: int, changes: dict
+    ) -> dict | None:
+        """Apply changes to a pull request at its current version.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param pr_id: The ID of the pull request.
+        :type pr_id: int
+        :param changes: Pull request fields to send with the current version.
+        :type changes: dict
+        :return: Decoded API response, or ``None`` when the pull request cannot
+            be loaded or Bitbucket returns no body.
+        :rtype: dict or None
+        """
         pr = self.get_pull_request_overview(project_key, repo_slug, pr_id)
         if pr is None or isinstance(pr, str):
             return None
         url = f"/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests/{pr_id}"
-        payload = {
-            "version": pr.version,
-            "destination": {"branch": {"name": new_destination}},
-        }
-        return self.put(url, json=payload)
+        payload = {"version": pr.version, **changes}
+        try:
+            return self.put(url, json=payload)
+        finally:
+            self.clear_pull_request_cache(project_key, repo_slug, pr_id)
 
     def create_pull_request(
         self,
@@ -1234,13 +2201,37 @@ class Bitbucket(AtlassianAPI):
         :rtype: list
         """
         url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/tags"
-        params: dict = {}
-        if start is not None and start > 0:
-            params["start"] = start
-        if limit is not None:
-            params["limit"] = limit
+        params = self._paging_params(start, limit)
         return self._get_paged(url, params=params)
 
+    def iter_tags(
+        self,
+        project_key: str,
+        repo_slug: str,
+        start: int = 0,
+        limit: int | None = None,
+        response_format: str | None = None,
+    ) -> Iterator:
+        """Iterate over tags for a repository page by page.
+
+        :param project_key: The key of the project.
+        :type project_key: str
+        :param repo_slug: The slug of the repository.
+        :type repo_slug: str
+        :param start: The starting index for pagination (optional).
+        :type start: int, optional
+        :param limit: The maximum number of results to return (optional).
+        :type limit: int, optional
+        :param response_format: ``namespace``, ``lazy``, or ``dict``. Defaults
+            to the client ``response_format``.
+        :type response_format: str, optional
+        :return: Iterator over tag objects.
+        :rtype: Iterator
+        """
+        url = f"/rest/api/latest/projects/{project_key}/repos/{repo_slug}/tags"
+        params = self._paging_params(start, limit)
+        return self.iter_paged(url, params, response_format=response_format)
+
     def create_tag(
         self,
         project_key: str,
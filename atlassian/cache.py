@@ -0,0 +1,841 @@
+"""Response caching for ``AtlassianAPI.get()`` and metadata lookups.
+
+``HTTPCache`` keeps the bodies of ``GET`` responses that carry an ``ETag`` or
+``Last-Modified`` validator. Later requests for the same resource send
+``If-None-Match``/``If-Modified-Since``; when the server answers
+``304 Not Modified`` the cached body is decoded instead of downloading it
+again. Every request still reaches the server, so cached data is never stale.
+
+Example:
+
+.. code-block:: python
+
+    from atlassian import Jira
+    from atlassian.cache import HTTPCache
+
+    jira = Jira(url="https://jira.company.com", token="token", http_cache=HTTPCache())
+    jira.get_project("PROJ")
+    jira.get_project("PROJ")  # 304 Not Modified, served from the cache
+    print(jira.http_cache.stats)
+
+``TTLCache`` memoizes lookups of rarely changing metadata such as projects,
+versions, users, and spaces in memory. Repeated calls are answered without a
+request until their time to live expires:
+
+.. code-block:: python
+
+    from atlassian.cache import TTLCache
+
+    cache = TTLCache(ttl=300, ttls={"get_projects": 3600})
+    jira = Jira(url="https://jira.company.com", token="token", metadata_cache=cache)
+    jira.get_versions("PROJ")
+    jira.get_versions("PROJ")  # no request
+    cache.invalidate("get_versions", "PROJ")
+
+``SQLiteCache`` offers the same interface backed by a database file, so the
+cached metadata survives process restarts:
+
+.. code-block:: python
+
+    from atlassian.cache import SQLiteCache
+
+    jira = Jira(
+        url="https://jira.company.com",
+        token="token",
+        metadata_cache=SQLiteCache("~/.cache/atlassian.sqlite3"),
+    )
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Mapping, Tuple, TypeVar, cast
+
+from . import jsonlib
+from .lazy import LazyNamespace, wrap
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CacheStats:
+    """Thread-safe counters describing how a cache was used.
+
+    :ivar hits: Number of requests served from the cache.
+    :ivar misses: Number of requests that downloaded a full body.
+    :ivar evictions: Number of entries dropped to respect the size limits.
+    :ivar bytes_saved: Total size of the bodies served from the cache.
+    """
+
+    def __init__(self) -> None:
+        """Create empty counters."""
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+    def record_hit(self, size: int = 0) -> None:
+        """Count a request served from the cache.
+
+        :param size: Size of the served body in bytes.
+        :type size: int, optional
+        """
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += size
+
+    def record_miss(self) -> None:
+        """Count a request that was not served from the cache."""
+        with self._lock:
+            self.misses += 1
+
+    def record_eviction(self) -> None:
+        """Count an entry dropped from the cache."""
+        with self._lock:
+            self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of requests served from the cache.
+
+        :return: Hits divided by hits and misses, or ``0.0`` before any request.
+        :rtype: float
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        """Reset every counter to zero."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.bytes_saved = 0
+
+    def __repr__(self) -> str:
+        """Return a compact summary of the counters.
+
+        :return: Counter summary.
+        :rtype: str
+        """
+        return (
+            f"{type(self).__name__}(hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, bytes_saved={self.bytes_saved})"
+        )
+
+
+class CachedResponse:
+    """Response replayed from a cache.
+
+    It provides the attributes that ``AtlassianAPI._get_response_handler()``
+    reads, so cached bodies are decoded exactly like fresh ones.
+
+    :param content: Response body.
+    :type content: bytes
+    :param headers: Response headers.
+    :type headers: Mapping[str, str], optional
+    :param status_code: HTTP status code of the original response.
+    :type status_code: int, optional
+    """
+
+    def __init__(
+        self,
+        content: bytes,
+        headers: Mapping[str, str] | None = None,
+        status_code: int = 200,
+    ) -> None:
+        """Create a response from a cached body."""
+        self.content = content
+        self.headers = dict(headers or {})
+        self.status_code = status_code
+        self.encoding = "utf-8"
+
+    @property
+    def text(self) -> str:
+        """Return the body decoded as UTF-8.
+
+        :return: Response text.
+        :rtype: str
+        """
+        return self.content.decode(self.encoding, errors="replace")
+
+
+class _Entry:
+    """Cached body of one resource with its validators."""
+
+    __slots__ = ("content", "headers", "etag", "last_modified")
+
+    def __init__(
+        self,
+        content: bytes,
+        headers: dict,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        self.content = content
+        self.headers = headers
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class HTTPCache:
+    """Thread-safe LRU cache of ``GET`` bodies revalidated with the server.
+
+    Only ``200`` responses with an ``ETag`` or ``Last-Modified`` header and
+    without ``Cache-Control: no-store`` are stored. Entries are keyed by the
+    authenticated identity, URL, and query parameters, so a cache may be
+    shared by clients that log in as different users. The least recently used
+    entries are dropped once ``max_entries`` or ``max_bytes`` is exceeded.
+
+    Cached bodies are decoded again on every hit, so callers may modify the
+    returned objects freely.
+
+    :param max_entries: Maximum number of cached resources.
+    :type max_entries: int, optional
+    :param max_bytes: Maximum total size of the cached bodies. Unlimited when
+        omitted.
+    :type max_bytes: int, optional
+    :raises ValueError: If a limit is not positive.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int | None = None) -> None:
+        """Create an empty cache."""
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, params: Mapping | None = None, identity: str = "") -> CacheKey:
+        """Return the cache key of a request.
+
+        :param url: Full request URL.
+        :type url: str
+        :param params: Query string parameters.
+        :type params: Mapping, optional
+        :param identity: Authenticated identity of the client.
+        :type identity: str, optional
+        :return: Hashable key that ignores the order of ``params``.
+        :rtype: tuple
+        """
+        items = tuple(
+            sorted(
+                (str(name), str(value))
+                for name, value in (params or {}).items()
+                if value is not None
+            )
+        )
+        return identity, url, items
+
+    def validators(self, key: CacheKey) -> dict:
+        """Return the conditional request headers for a cached resource.
+
+        :param key: Cache key from :meth:`key`.
+        :type key: tuple
+        :return: ``If-None-Match`` and/or ``If-Modified-Since`` headers, or an
+            empty dict when the resource is not cached.
+        :rtype: dict
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return {}
+            headers = {}
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+            return headers
+
+    def revalidated(self, key: CacheKey, response: Any) -> CachedResponse | None:
+        """Return the cached response confirmed by a ``304 Not Modified``.
+
+        Validators sent with the ``304`` response replace the stored ones.
+
+        :param key: Cache key from :meth:`key`.
+        :type key: tuple
+        :param response: The ``304`` response.
+        :type response: requests.Response or httpx.Response
+        :return: The cached response, or ``None`` when the entry was evicted
+            after its validators were sent.
+        :rtype: CachedResponse or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            entry.etag = response.headers.get("ETag", entry.etag)
+            entry.last_modified = response.headers.get(
+                "Last-Modified", entry.last_modified
+            )
+            content, headers = entry.content, entry.headers
+        self.stats.record_hit(len(content))
+        return CachedResponse(content, headers)
+
+    def store(self, key: CacheKey, response: Any) -> bool:
+        """Record a downloaded response and cache it when it has validators.
+
+        :param key: Cache key from :meth:`key`.
+        :type key: tuple
+        :param response: Response of the request.
+        :type response: requests.Response or httpx.Response
+        :return: ``True`` when the response was cached.
+        :rtype: bool
+        """
+        self.stats.record_miss()
+        headers = response.headers
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        cacheable = (
+            response.status_code == 200
+            and (etag is not None or last_modified is not None)
+            and "no-store" not in headers.get("Cache-Control", "").lower()
+        )
+        content = response.content if cacheable else b""
+        if self.max_bytes is not None and len(content) > self.max_bytes:
+            cacheable = False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.content)
+            if not cacheable:
+                return False
+            self._entries[key] = _Entry(
+                content,
+                {"Content-Type": headers.get("Content-Type", "application/json")},
+                etag,
+                last_modified,
+            )
+            self._size += len(content)
+            evicted = self._evict()
+        for _ in range(evicted):
+            self.stats.record_eviction()
+        return True
+
+    def _evict(self) -> int:
+        """Drop least recently used entries over the limits. Requires the lock.
+
+        :return: Number of dropped entries.
+        :rtype: int
+        """
+        evicted = 0
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._size > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._size -= len(entry.content)
+            evicted += 1
+        return evicted
+
+    def invalidate(self, url_prefix: str | None = None) -> int:
+        """Drop cached resources.
+
+        :param url_prefix: Only drop resources whose URL starts with this
+            prefix. Drops everything when omitted.
+        :type url_prefix: str, optional
+        :return: Number of dropped entries.
+        :rtype: int
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if url_prefix is None or key[1].startswith(url_prefix)
+            ]
+            for key in keys:
+                self._size -= len(self._entries.pop(key).content)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached resource and reset the statistics."""
+        self.invalidate()
+        self.stats.reset()
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached bodies in bytes.
+
+        :return: Cached bytes.
+        :rtype: int
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        """Return the number of cached resources.
+
+        :return: Entry count.
+        :rtype: int
+        """
+        return len(self._entries)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a time to live.
+
+    Product clients store the results of methods decorated with
+    :func:`memoize` here. Entries are keyed by method name first, so every
+    method can have its own time to live and can be invalidated on its own.
+
+    :param ttl: Default time to live of an entry in seconds.
+    :type ttl: float, optional
+    :param max_entries: Maximum number of cached results. The least recently
+        used entry is dropped first.
+    :type max_entries: int, optional
+    :param ttls: Time to live per method name, for example
+        ``{"get_projects": 3600}``. A time to live of ``0`` disables caching
+        for that method.
+    :type ttls: Mapping[str, float], optional
+    :raises ValueError: If a limit is negative or ``max_entries`` is not
+        positive.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        max_entries: int = 1024,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        """Create an empty cache."""
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl < 0 or any(value < 0 for value in (ttls or {}).values()):
+            raise ValueError("ttl must not be negative")
+        self.ttl = float(ttl)
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, method: str) -> float:
+        """Return the time to live of a method's results.
+
+        :param method: Method name.
+        :type method: str
+        :return: Time to live in seconds.
+        :rtype: float
+        """
+        return self.ttls.get(method, self.ttl)
+
+    def lookup(self, key: tuple) -> tuple[bool, Any]:
+        """Return a cached result.
+
+        :param key: Key whose first item is the method name.
+        :type key: tuple
+        :return: ``(True, value)`` for a live entry, otherwise
+            ``(False, None)``.
+        :rtype: tuple
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                found = True
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                found = False
+        if found:
+            self.stats.record_hit()
+            return True, entry[1]  # type: ignore[index]
+        self.stats.record_miss()
+        return False, None
+
+    def store(self, key: tuple, value: Any) -> None:
+        """Cache a result for the time to live of its method.
+
+        :param key: Key whose first item is the method name.
+        :type key: tuple
+        :param value: Result to cache.
+        :type value: object
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        for _ in range(evicted):
+            self.stats.record_eviction()
+
+    def invalidate(self, method: str | None = None, *args: Any) -> int:
+        """Drop cached results.
+
+        :param method: Only drop results of this method. Drops everything
+            when omitted.
+        :type method: str, optional
+        :param args: Only drop results of calls whose leading positional
+            arguments equal these, for example a project key.
+        :type args: object
+        :return: Number of dropped entries.
+        :rtype: int
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if method is None or (key[0] == method and key[4][: len(args)] == args)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the statistics."""
+        self.invalidate()
+        self.stats.reset()
+
+    def __len__(self) -> int:
+        """Return the number of cached results, including expired ones.
+
+        :return: Entry count.
+        :rtype: int
+        """
+        return len(self._entries)
+
+
+def memoize(func: F) -> F:
+    """Cache the results of a client method in the client ``metadata_cache``.
+
+    Results are cached per client credentials, base URL, response format, and
+    arguments. Without a ``metadata_cache`` the method is called unchanged.
+    Cached results are shared between callers; treat them as read-only.
+
+    Async clients inherit decorated methods: their coroutines are awaited
+    before the result is cached, and hits are returned as coroutines.
+
+    :param func: Client method to cache.
+    :type func: callable
+    :return: The caching method.
+    :rtype: callable
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        cache = getattr(self, "metadata_cache", None)
+        if cache is None:
+            return func(self, *args, **kwargs)
+        key = (
+            name,
+            self._cache_identity(),
+            self.url,
+            self.response_format,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            found, value = cache.lookup(key)
+        except TypeError:
+            return func(self, *args, **kwargs)
+        if found:
+            if inspect.iscoroutinefunction(self.get):
+                return _resolved(value)
+            return value
+        result = func(self, *args, **kwargs)
+        if inspect.isawaitable(result):
+            return _store_result(cache, key, result)
+        cache.store(key, result)
+        return result
+
+    return cast(F, wrapper)
+
+
+def invalidates(*methods: str) -> Callable[[F], F]:
+    """Drop cached results of ``methods`` after a client method succeeds.
+
+    Cached results whose first argument equals the first argument of the
+    call, typically a project or space key, are dropped.
+
+    :param methods: Names of :func:`memoize` methods made stale by the call.
+    :type methods: str
+    :return: Decorator for the changing method.
+    :rtype: callable
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            result = func(self, *args, **kwargs)
+            cache = getattr(self, "metadata_cache", None)
+            if cache is None:
+                return result
+            scope = args[:1]
+            if inspect.isawaitable(result):
+                return _invalidate_after(cache, methods, scope, result)
+            for method in methods:
+                cache.invalidate(method, *scope)
+            return result
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+async def _resolved(value: Any) -> Any:
+    """Return ``value`` from a coroutine for async callers."""
+    return value
+
+
+async def _store_result(cache: TTLCache, key: tuple, awaitable: Awaitable) -> Any:
+    """Await a result and cache it."""
+    value = await awaitable
+    cache.store(key, value)
+    return value
+
+
+async def _invalidate_after(
+    cache: TTLCache, methods: tuple, scope: tuple, awaitable: Awaitable
+) -> Any:
+    """Await a result and drop the cached results it made stale."""
+    value = await awaitable
+    for method in methods:
+        cache.invalidate(method, *scope)
+    return value
+
+
+class SQLiteCache:
+    """Persistent cache of memoized results in a SQLite database file.
+
+    A drop-in replacement for :class:`TTLCache` as a client's
+    ``metadata_cache`` whose entries survive process restarts, so short-lived
+    jobs start with warm metadata. Results are stored as JSON and decoded in
+    the response format they were requested in. Results that cannot be
+    represented as JSON, such as ``raw`` bytes, are not stored.
+
+    The database uses write-ahead logging and waits for locks held by other
+    writers, so several processes and threads may share one file. Entries
+    expire after their method's time to live; once ``max_entries`` is
+    exceeded, the least recently used entries are deleted.
+
+    :param path: Database file. Created when missing.
+    :type path: str or os.PathLike
+    :param ttl: Default time to live of an entry in seconds.
+    :type ttl: float, optional
+    :param max_entries: Maximum number of stored results.
+    :type max_entries: int, optional
+    :param ttls: Time to live per method name. ``0`` disables storing results
+        of that method.
+    :type ttls: Mapping[str, float], optional
+    :param timeout: Seconds to wait for a lock held by another connection.
+    :type timeout: float, optional
+    :raises ValueError: If a limit is negative or ``max_entries`` is not
+        positive.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: float = 3600,
+        max_entries: int = 10000,
+        ttls: Mapping[str, float] | None = None,
+        timeout: float = 30,
+    ) -> None:
+        """Open or create the database."""
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl < 0 or any(value < 0 for value in (ttls or {}).values()):
+            raise ValueError("ttl must not be negative")
+        self.path = os.path.expanduser(os.fspath(path))
+        self.ttl = float(ttl)
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.stats = CacheStats()
+        self._local = threading.local()
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, method TEXT NOT NULL, args TEXT NOT NULL, "
+                "value TEXT NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS entries_method ON entries (method)")
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current thread and process.
+
+        :return: Open connection in autocommit mode.
+        :rtype: sqlite3.Connection
+        """
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def ttl_for(self, method: str) -> float:
+        """Return the time to live of a method's results.
+
+        :param method: Method name.
+        :type method: str
+        :return: Time to live in seconds.
+        :rtype: float
+        """
+        return self.ttls.get(method, self.ttl)
+
+    @staticmethod
+    def _serialize_key(key: tuple) -> str:
+        """Return the text form of a :func:`memoize` key."""
+        return json.dumps(key, default=repr, separators=(",", ":"))
+
+    def lookup(self, key: tuple) -> tuple[bool, Any]:
+        """Return a stored result.
+
+        :param key: Key whose first item is the method name and fourth item
+            the response format.
+        :type key: tuple
+        :return: ``(True, value)`` for a live entry, otherwise
+            ``(False, None)``.
+        :rtype: tuple
+        """
+        text_key = self._serialize_key(key)
+        now = time.time()
+        db = self._connect()
+        row = db.execute(
+            "SELECT value FROM entries WHERE key = ? AND expires > ?", (text_key, now)
+        ).fetchone()
+        if row is None:
+            self.stats.record_miss()
+            return False, None
+        db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, text_key))
+        self.stats.record_hit(len(row[0]))
+        return True, _decode_result(row[0], key[3])
+
+    def store(self, key: tuple, value: Any) -> None:
+        """Store a result for the time to live of its method.
+
+        :param key: Key whose first item is the method name.
+        :type key: tuple
+        :param value: Result to store.
+        :type value: object
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+        try:
+            text = json.dumps(value, default=_encode_namespace)
+        except (TypeError, ValueError):
+            return
+        now = time.time()
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self._serialize_key(key),
+                    key[0],
+                    json.dumps(key[4], default=repr),
+                    text,
+                    now + ttl,
+                    now,
+                ),
+            )
+            db.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+            evicted = db.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries "
+                "ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        for _ in range(max(evicted, 0)):
+            self.stats.record_eviction()
+
+    def invalidate(self, method: str | None = None, *args: Any) -> int:
+        """Delete stored results.
+
+        :param method: Only delete results of this method. Deletes everything
+            when omitted.
+        :type method: str, optional
+        :param args: Only delete results of calls whose leading positional
+            arguments equal these.
+        :type args: object
+        :return: Number of deleted entries.
+        :rtype: int
+        """
+        db = self._connect()
+        if method is None:
+            return db.execute("DELETE FROM entries").rowcount
+        if not args:
+            return db.execute(
+                "DELETE FROM entries WHERE method = ?", (method,)
+            ).rowcount
+        prefix = json.loads(json.dumps(args, default=repr))
+        keys = [
+            (key,)
+            for key, stored in db.execute(
+                "SELECT key, args FROM entries WHERE method = ?", (method,)
+            )
+            if json.loads(stored)[: len(prefix)] == prefix
+        ]
+        db.executemany("DELETE FROM entries WHERE key = ?", keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Delete every stored result and reset the statistics."""
+        self.invalidate()
+        self.stats.reset()
+
+    def close(self) -> None:
+        """Close the connection of the current thread."""
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def __len__(self) -> int:
+        """Return the number of stored results, including expired ones.
+
+        :return: Entry count.
+        :rtype: int
+        """
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def _encode_namespace(value: Any) -> Any:
+    """Convert response objects for ``json.dumps``."""
+    if isinstance(value, SimpleNamespace):
+        return vars(value)
+    if isinstance(value, LazyNamespace):
+        return value._asdict()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode_result(text: str, response_format: str) -> Any:
+    """Decode a stored result in the response format it was requested in."""
+    if response_format == "namespace":
+        return jsonlib.loads(text, object_hook=lambda d: SimpleNamespace(**d))
+    if response_format == "lazy":
+        return wrap(jsonlib.loads(text))
+    return jsonlib.loads(text)
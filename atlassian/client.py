@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+import hashlib
 import requests  # type: ignore
-import json
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import SimpleNamespace, TracebackType
+from typing import Any, Callable, Iterable
+from . import jsonlib
+from .cache import CachedResponse, HTTPCache, TTLCache
 from .error import APIError
+from .lazy import LazyNamespace, wrap
 from .logger import get_logger
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, RetryStats
+from .singleflight import SingleFlight
 
 logger = get_logger(__name__)
 logger.disabled = True
 
+RESPONSE_FORMATS = ("namespace", "lazy", "dict", "raw")
+
 
 class AtlassianAPI:
     """Base HTTP client shared by Jira, Bitbucket, and Confluence clients.
@@ -17,11 +29,29 @@ class AtlassianAPI:
     bearer token, appends endpoint paths to the configured base URL, and raises
     :class:`atlassian.error.APIError` for HTTP ``4xx`` and ``5xx`` responses.
 
-    ``get()`` parses JSON into nested ``SimpleNamespace`` objects. Mutating
-    helpers return decoded JSON dictionaries when available.
+    ``get()`` parses JSON into nested ``SimpleNamespace`` objects by default;
+    pass ``response_format="lazy"`` for read-only views that are built on
+    attribute access, or ``"dict"`` or ``"raw"`` to skip the conversion, either
+    to the client or to a single call. Mutating helpers return decoded JSON
+    dictionaries when available.
+
+    When a :class:`atlassian.retry.RetryPolicy` is configured, rate limited
+    and transient gateway failures are retried before ``APIError`` is raised.
+    A shared :class:`atlassian.ratelimit.RateLimiter` throttles requests on the
+    client side before they are sent. An :class:`atlassian.cache.HTTPCache`
+    revalidates ``GET`` responses with ``ETag``/``Last-Modified`` headers and
+    reuses their bodies when the server answers ``304 Not Modified``, and an
+    :class:`atlassian.cache.TTLCache` answers repeated metadata lookups from
+    memory. A :class:`atlassian.singleflight.SingleFlight` lets concurrent
+    identical ``GET`` requests share one response.
+
+    :ivar pool_maxsize: Maximum number of connections kept per host; the
+        default number of workers of :meth:`map` and other concurrent helpers.
     """
 
     default_headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    default_pool_connections = 10
+    default_pool_maxsize = 32
 
     def __init__(
         self,
@@ -33,6 +63,15 @@ class AtlassianAPI:
         token: str | None = None,
         verify: bool | str = True,
         proxies: dict | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        response_format: str = "namespace",
+        http_cache: HTTPCache | None = None,
+        metadata_cache: TTLCache | None = None,
+        single_flight: SingleFlight | None = None,
     ) -> None:
         """Create a client session for an Atlassian REST API.
 
@@ -59,15 +98,71 @@ class AtlassianAPI:
         :param proxies: Dictionary mapping protocol names to proxy URLs, for
             example ``{"https": "http://proxy.example.com:8080"}``.
         :type proxies: dict, optional
+        :param retry: Retry policy applied to every request. When omitted,
+            failed requests raise ``APIError`` immediately.
+        :type retry: RetryPolicy, optional
+        :param rate_limiter: Rate limiter consulted before every request. The
+            same limiter may be shared by several clients and threads.
+        :type rate_limiter: RateLimiter, optional
+        :param pool_connections: Number of per-host connection pools kept by
+            the HTTP adapter. Defaults to ``default_pool_connections``.
+        :type pool_connections: int, optional
+        :param pool_maxsize: Maximum number of keep-alive connections kept per
+            host. Size it to the number of threads sharing the client.
+            Defaults to ``default_pool_maxsize``.
+        :type pool_maxsize: int, optional
+        :param pool_block: Block when every pooled connection is in use instead
+            of opening a temporary extra connection. Defaults to ``False``.
+        :type pool_block: bool, optional
+        :param response_format: Default format of ``get()`` results:
+            ``namespace`` (nested ``SimpleNamespace``), ``lazy``
+            (:class:`atlassian.lazy.LazyNamespace` views), ``dict`` (plain
+            decoded JSON), or ``raw`` (body bytes). Convenience methods that read
+            attributes from responses expect the default ``namespace``.
+        :type response_format: str, optional
+        :param http_cache: Conditional request cache used by ``get()``. The
+            same cache may be shared by several clients and threads.
+        :type http_cache: HTTPCache, optional
+        :param metadata_cache: In-memory cache for lookups of rarely changing
+            metadata, such as projects, versions, users, and spaces. May be
+            shared by several clients and threads.
+        :type metadata_cache: TTLCache, optional
+        :param single_flight: Coalesces identical ``GET`` requests sent by
+            concurrent threads into one request. May be shared by several
+            clients.
+        :type single_flight: SingleFlight, optional
+        :raises ValueError: If ``response_format`` is not supported.
+
+        Pool options are applied to newly created sessions. For a session
+        passed through ``session`` they are applied only when given
+        explicitly, so existing adapters are otherwise left untouched, and
+        ``pool_maxsize`` defaults to ``default_pool_maxsize``.
         """
         self.url = url.strip("/")
         self.username = username
         self.password = password
         self.timeout = int(timeout)
+        if response_format not in RESPONSE_FORMATS:
+            raise ValueError(f"Unsupported response_format {response_format!r}")
+        self.response_format = response_format
+        self.retry = retry
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.http_cache = http_cache
+        self.metadata_cache = metadata_cache
+        self.single_flight = single_flight
         if session is None:
             self._session = requests.Session()
         else:
             self._session = session
+        self.pool_maxsize = (
+            self.default_pool_maxsize if pool_maxsize is None else pool_maxsize
+        )
+        if session is None or any(
+            option is not None
+            for option in (pool_connections, pool_maxsize, pool_block)
+        ):
+            self._mount_adapter(pool_connections, pool_maxsize, pool_block)
         self._session.verify = verify
         if proxies is not None:
             self._session.proxies.update(proxies)
@@ -78,6 +173,14 @@ class AtlassianAPI:
                 logger.error(e)
         elif token is not None:
             self._create_token_session(token)
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """Initialise per-client caches and locks.
+
+        Called at the end of ``__init__`` by the synchronous and asynchronous
+        clients. Product clients extend it and call ``super()._init_state()``.
+        """
 
     def __enter__(self) -> AtlassianAPI:
         """Return the client for ``with`` statement usage.
@@ -104,6 +207,33 @@ class AtlassianAPI:
         """
         self.close()
 
+    def _mount_adapter(
+        self,
+        pool_connections: int | None,
+        pool_maxsize: int | None,
+        pool_block: bool | None,
+    ) -> None:
+        """Mount an HTTP adapter with the requested connection pool sizing.
+
+        :param pool_connections: Number of per-host connection pools.
+        :type pool_connections: int or None
+        :param pool_maxsize: Maximum number of connections kept per host.
+        :type pool_maxsize: int or None
+        :param pool_block: Block when the pool is exhausted.
+        :type pool_block: bool or None
+        """
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=(
+                self.default_pool_connections
+                if pool_connections is None
+                else pool_connections
+            ),
+            pool_maxsize=self.pool_maxsize,
+            pool_block=bool(pool_block),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
     def _create_basic_session(self, username: str, password: str) -> None:
         """Apply username/password authentication to the current session.
 
@@ -151,6 +281,46 @@ class AtlassianAPI:
             logger.error(e)
             return None
 
+    @staticmethod
+    def _get_response_handler(
+        response: requests.Response | CachedResponse,
+        response_format: str = "namespace",
+    ) -> SimpleNamespace | LazyNamespace | dict | list | bytes | str | None:
+        """Decode a ``GET`` response body in the requested format.
+
+        :param response: The HTTP response object.
+        :type response: requests.Response or CachedResponse
+        :param response_format: ``namespace`` for nested ``SimpleNamespace``
+            objects, ``lazy`` for read-only views created on attribute access,
+            ``dict`` for plain decoded JSON, or ``raw`` for the undecoded body
+            bytes.
+        :type response_format: str, optional
+        :return: The decoded body, raw text when JSON parsing fails, or
+            ``None`` for empty responses.
+        :rtype: SimpleNamespace or LazyNamespace or dict or list or bytes or str
+            or None
+        :raises ValueError: If ``response_format`` is not supported.
+        """
+        if response_format not in RESPONSE_FORMATS:
+            raise ValueError(
+                f"Unsupported response_format {response_format!r}; "
+                f"expected one of {', '.join(RESPONSE_FORMATS)}"
+            )
+        if response_format == "raw":
+            return response.content or None
+        text = response.text
+        if not text:
+            return None
+        try:
+            if response_format == "dict":
+                return jsonlib.loads(text)
+            if response_format == "lazy":
+                return wrap(jsonlib.loads(text))
+            return jsonlib.loads(text, object_hook=lambda d: SimpleNamespace(**d))
+        except Exception as e:
+            logger.error(e)
+            return text
+
     def close(self) -> None:
         """Close the underlying ``requests.Session``."""
         self._session.close()
@@ -162,6 +332,7 @@ class AtlassianAPI:
         data: dict | None = None,
         json: object | None = None,
         params: dict | None = None,
+        headers: dict | None = None,
     ) -> requests.Response:
         """Send an HTTP request through the configured session.
 
@@ -172,38 +343,108 @@ class AtlassianAPI:
         :type path: str
         :param data: Form data or bytes to send in the request body.
         :type data: dict or None
-        :param json: JSON payload to send in the request body.
+        :param json: JSON payload to send in the request body. It is encoded
+            with :mod:`atlassian.jsonlib` when a fast JSON backend is
+            installed and ``data`` is not given.
         :type json: object or None
         :param params: Query string parameters.
         :type params: dict or None
+        :param headers: Headers added to the session headers for this request.
+        :type headers: dict or None
         :return: The HTTP response object.
         :rtype: requests.Response
-        :raises APIError: If the response status code is 4xx or 5xx.
+        :raises APIError: If the response status code is 4xx or 5xx after any
+            retries allowed by ``self.retry``.
         """
         if path:
             url = self.url + path
         else:
             url = self.url
-        response = self._session.request(
-            method=method,
-            url=url,
-            data=data,
-            json=json,
-            params=params,
-            timeout=self.timeout,
-        )
-        response.encoding = "utf-8"
-        logger.debug(f"HTTP: {method} -> {response.status_code} {response.reason}")
-        if response.status_code >= 400:
+        body = self._request_body(data, json)
+        if headers:
+            body["headers"] = {**body.get("headers", {}), **headers}
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path)
+            try:
+                response = self._session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    timeout=self.timeout,
+                    **body,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if self.retry is None or not self.retry.is_retryable(
+                    method, None, attempt
+                ):
+                    if attempt > 1:
+                        self.retry_stats.record_exhausted()
+                    raise
+                self._backoff(None, self.retry.backoff(attempt), e)
+                continue
+            response.encoding = "utf-8"
+            logger.debug(f"HTTP: {method} -> {response.status_code} {response.reason}")
+            if response.status_code < 400:
+                return response
+            if self.retry is not None and self.retry.is_retryable(
+                method, response.status_code, attempt
+            ):
+                delay = self.retry.wait_time(attempt, response.headers)
+                if delay is not None:
+                    self._backoff(response.status_code, delay, response.reason)
+                    continue
+            if attempt > 1:
+                self.retry_stats.record_exhausted()
             raise APIError(response.status_code, response.text)
-        return response
+
+    @staticmethod
+    def _request_body(data: object | None, json: object | None) -> dict:
+        """Return the body arguments of a request.
+
+        ``json`` payloads are pre-encoded when :mod:`atlassian.jsonlib` uses
+        a fast backend; otherwise they are passed through unchanged.
+
+        :param data: Form data or bytes to send in the request body.
+        :type data: object or None
+        :param json: JSON payload to send in the request body.
+        :type json: object or None
+        :return: Keyword arguments with ``data``, ``json``, and, for encoded
+            payloads, ``headers``.
+        :rtype: dict
+        """
+        if json is None or data is not None or jsonlib.BACKEND == "json":
+            return {"data": data, "json": json}
+        return {
+            "data": jsonlib.dumps(json),
+            "json": None,
+            "headers": {"Content-Type": "application/json"},
+        }
+
+    def _backoff(self, status_code: int | None, delay: float, reason: object) -> None:
+        """Sleep before retrying a request and record the retry.
+
+        :param status_code: Status code that triggered the retry, or ``None``
+            for connection errors.
+        :type status_code: int or None
+        :param delay: Delay in seconds.
+        :type delay: float
+        :param reason: Response reason or exception used for logging.
+        :type reason: object
+        """
+        logger.debug(f"HTTP: retrying after {delay:.2f}s ({status_code} {reason})")
+        self.retry_stats.record_retry(status_code, delay)
+        time.sleep(delay)
 
     def get(
         self,
         path: str,
         data: dict | None = None,
         params: dict | None = None,
-    ) -> SimpleNamespace | str | None:
+        response_format: str | None = None,
+    ) -> Any:
         """Send a ``GET`` request and parse the response for script-friendly use.
 
         :param path: Endpoint path appended to the base URL.
@@ -212,21 +453,88 @@ class AtlassianAPI:
         :type data: dict or None
         :param params: Query string parameters.
         :type params: dict or None
-        :return: A nested ``SimpleNamespace`` for JSON responses, raw text when
-            JSON parsing fails, or ``None`` for empty responses.
-        :rtype: SimpleNamespace or str or None
+        :param response_format: Override the client ``response_format`` for
+            this call: ``namespace``, ``lazy``, ``dict``, or ``raw``.
+        :type response_format: str, optional
+        :return: A nested ``SimpleNamespace`` (or ``LazyNamespace``/``dict``/
+            ``bytes``, depending on ``response_format``) for JSON responses,
+            raw text when JSON parsing fails, or ``None`` for empty responses.
+        :rtype: SimpleNamespace or LazyNamespace or dict or bytes or str or None
         :raises APIError: If the response status code is 4xx or 5xx.
         """
-        response = self.request("GET", path, data=data, params=params)
-        if not response.text:
-            return None
-        try:
-            text = response.text
-            result = json.loads(text, object_hook=lambda d: SimpleNamespace(**d))
-            return result
-        except Exception as e:
-            logger.error(e)
-            return response.text
+        if self.single_flight is None or data is not None:
+            response = self._send_get(path, data, params)
+        else:
+            key = HTTPCache.key(self.url + path, params, self._cache_identity())
+            response = self.single_flight.do(
+                key, lambda: self._send_get(path, None, params)
+            )
+        return self._get_response_handler(
+            response, response_format or self.response_format
+        )
+
+    def _send_get(
+        self, path: str, data: dict | None, params: dict | None
+    ) -> requests.Response | CachedResponse:
+        """Send a ``GET`` request, through ``http_cache`` when configured.
+
+        :param path: Endpoint path appended to the base URL.
+        :type path: str
+        :param data: Optional request body data. Requests with a body bypass
+            the cache.
+        :type data: dict or None
+        :param params: Query string parameters.
+        :type params: dict or None
+        :return: The downloaded or the cached response.
+        :rtype: requests.Response or CachedResponse
+        :raises APIError: If the response status code is 4xx or 5xx.
+        """
+        if self.http_cache is None or data is not None:
+            return self.request("GET", path, data=data, params=params)
+        return self._cached_get(self.http_cache, path, params)
+
+    def _cached_get(
+        self, cache: HTTPCache, path: str, params: dict | None
+    ) -> requests.Response | CachedResponse:
+        """Send a conditional ``GET`` and serve ``304`` responses from the cache.
+
+        :param cache: The cache to consult and update.
+        :type cache: HTTPCache
+        :param path: Endpoint path appended to the base URL.
+        :type path: str
+        :param params: Query string parameters.
+        :type params: dict or None
+        :return: The downloaded or the cached response.
+        :rtype: requests.Response or CachedResponse
+        :raises APIError: If the response status code is 4xx or 5xx.
+        """
+        key = cache.key(self.url + path, params, self._cache_identity())
+        validators = cache.validators(key)
+        response = self.request("GET", path, params=params, headers=validators)
+        if response.status_code == 304:
+            cached = cache.revalidated(key, response)
+            if cached is not None:
+                return cached
+            response = self.request("GET", path, params=params)
+        cache.store(key, response)
+        return response
+
+    def _cache_identity(self) -> str:
+        """Return a digest identifying the credentials of the client.
+
+        Cache keys include it so that a cache shared by clients that log in as
+        different users never serves one user's data to another.
+
+        :return: Hex digest of the username or ``Authorization`` header, or an
+            empty string for anonymous clients.
+        :rtype: str
+        """
+        auth = self._session.auth
+        if isinstance(auth, tuple) and auth:
+            credential = f"basic:{auth[0]}"
+        else:
+            credential = f"header:{self._session.headers.get('Authorization', '')!r}"
+        return hashlib.sha256(credential.encode("utf-8")).hexdigest()[:16]
 
     def post(
         self,
@@ -299,3 +607,61 @@ class AtlassianAPI:
         """
         response = self.request("DELETE", path, data=data, json=json, params=params)
         return self._response_handler(response)
+
+    def map(
+        self,
+        method: Callable[..., Any] | str,
+        args: Iterable[Any],
+        max_workers: int | None = None,
+    ) -> list:
+        """Call a client method for every item of ``args`` on a thread pool.
+
+        Items that are tuples are unpacked as positional arguments; any other
+        item is passed as the only argument. Results are returned in input
+        order. A call that raises :class:`atlassian.error.APIError` does not
+        stop the batch: the error is returned in place of its result. Calls
+        share this client's session and go through its retry policy and rate
+        limiter.
+
+        .. code-block:: python
+
+            issues = jira.map(jira.issue, ["TEST-1", "TEST-2", "TEST-3"])
+            jira.map("update_issue_label", [("TEST-1", ["qa"]), ("TEST-2", ["qa"])])
+            failed = [r for r in issues if isinstance(r, APIError)]
+
+        :param method: Bound method, or the name of a method of this client.
+        :type method: callable or str
+        :param args: Arguments of each call.
+        :type args: Iterable
+        :param max_workers: Number of concurrent calls. Defaults to
+            ``pool_maxsize``, so workers never wait for a connection.
+        :type max_workers: int, optional
+        :return: One result or ``APIError`` per item, in input order.
+        :rtype: list
+        :raises ValueError: If ``max_workers`` is less than ``1``.
+        """
+        func = getattr(self, method) if isinstance(method, str) else method
+        workers = self.pool_maxsize if max_workers is None else max_workers
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        def call(item: Any) -> Any:
+            try:
+                return func(*item) if isinstance(item, tuple) else func(item)
+            except APIError as e:
+                return e
+
+        results = []
+        pending: deque[Future] = deque()
+        with ThreadPoolExecutor(workers, thread_name_prefix="atlassian-map") as pool:
+            try:
+                for item in args:
+                    pending.append(pool.submit(call, item))
+                    if len(pending) >= 2 * workers:
+                        results.append(pending.popleft().result())
+                while pending:
+                    results.append(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+        return results
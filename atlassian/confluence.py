@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Any
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Generator, Iterator
 from types import SimpleNamespace
 
+from atlassian.cache import memoize
 from atlassian.client import AtlassianAPI
 from atlassian.logger import get_logger
 
@@ -105,7 +108,27 @@ class Confluence(AtlassianAPI):
             else:
                 version = 1
         url = f"/rest/api/content/{page_id}"
-        json = {
+        json = self._update_content_payload(title, body_value, type, version)
+        return self.put(url, json=json)
+
+    @staticmethod
+    def _update_content_payload(
+        title: str, body_value: str, type: str, version: int
+    ) -> dict:
+        """Build the request body that updates a content item.
+
+        :param title: The new title of the content.
+        :type title: str
+        :param body_value: New body content in Confluence storage format.
+        :type body_value: str
+        :param type: Content type, for example ``page``.
+        :type type: str
+        :param version: Version number to submit.
+        :type version: int
+        :return: Content update payload.
+        :rtype: dict
+        """
+        return {
             "version": {"number": version},
             "title": f"{title}",
             "type": f"{type}",
@@ -113,7 +136,6 @@ class Confluence(AtlassianAPI):
                 "storage": {"value": f"{body_value}", "representation": "storage"}
             },
         }
-        return self.put(url, json=json)
 
     def delete_content(self, page_id: int) -> dict | None:
         """Delete content from Confluence by content ID.
@@ -167,6 +189,7 @@ class Confluence(AtlassianAPI):
         params: dict[str, Any] = {"start": start, "limit": limit}
         return self.get(url, params=params)
 
+    @memoize
     def get_space(self, space_key: str) -> SimpleNamespace | str | None:
         """Return a Confluence space by space key.
 
@@ -247,6 +270,196 @@ class Confluence(AtlassianAPI):
         params: dict[str, Any] = {"start": start, "limit": limit}
         return self.get(url, params=params)
 
+    def iter_child_pages(
+        self,
+        page_id: int | str,
+        expand: str | list[str] | None = None,
+        limit: int = 100,
+    ) -> Iterator[dict]:
+        """Yield every child page of a page, requesting further pages as needed.
+
+        Paging follows the ``next`` link of each response, so it also works
+        when Confluence returns fewer results than ``limit``, as it does for
+        expanded bodies.
+
+        :param page_id: The ID of the parent page.
+        :type page_id: int or str
+        :param expand: Properties to expand in the same request, for example
+            ``"body.storage,version"`` or ``["body.storage", "version"]``.
+        :type expand: str or list[str], optional
+        :param limit: Children requested per request (default 100).
+        :type limit: int, optional
+        :return: Iterator over child pages as dictionaries.
+        :rtype: Iterator[dict]
+        """
+        yield from self._iter_child_pages(page_id, self._expand_param(expand), limit)
+
+    def _iter_child_pages(
+        self, page_id: int | str, expand: str | None, limit: int
+    ) -> Iterator[dict]:
+        """Yield the child pages of a page, one listing request at a time.
+
+        :param page_id: The ID of the parent page.
+        :type page_id: int or str
+        :param expand: Comma-separated properties to expand, or ``None``.
+        :type expand: str or None
+        :param limit: Children requested per request.
+        :type limit: int
+        :return: Iterator over child pages as dictionaries.
+        :rtype: Iterator[dict]
+        """
+        url = f"/rest/api/content/{page_id}/child/page"
+        start = 0
+        while True:
+            params = self._child_page_params(expand, start, limit)
+            response = self.get(url, params=params, response_format="dict") or {}
+            results = response.get("results") or []
+            yield from results
+            if not results or "next" not in (response.get("_links") or {}):
+                return
+            start += len(results)
+
+    def _list_child_pages(
+        self, page_id: int | str, expand: str | None, limit: int
+    ) -> list[dict]:
+        """Return all child pages of a page.
+
+        See :meth:`_iter_child_pages`.
+
+        :return: Child pages as dictionaries.
+        :rtype: list[dict]
+        """
+        return list(self._iter_child_pages(page_id, expand, limit))
+
+    @staticmethod
+    def _child_page_params(expand: str | None, start: int, limit: int) -> dict:
+        """Build the query parameters of one child page listing request.
+
+        :return: Query parameters.
+        :rtype: dict
+        """
+        params: dict[str, Any] = {"start": start, "limit": limit}
+        if expand:
+            params["expand"] = expand
+        return params
+
+    @staticmethod
+    def _expand_param(expand: str | list[str] | None, *extra: str) -> str | None:
+        """Join properties to expand into the ``expand`` query parameter.
+
+        :param expand: Comma-separated string or list of properties.
+        :type expand: str or list[str] or None
+        :param extra: Further properties, added unless already present.
+        :type extra: str
+        :return: Comma-separated properties, or ``None`` when there are none.
+        :rtype: str or None
+        """
+        if isinstance(expand, str):
+            expand = expand.split(",")
+        names = [name.strip() for name in expand or [] if name.strip()]
+        names += [name for name in extra if name not in names]
+        return ",".join(names) or None
+
+    @staticmethod
+    def _has_child_pages(page: dict) -> bool:
+        """Return whether a page may have children worth listing.
+
+        :param page: Page fetched with ``children.page`` expanded.
+        :type page: dict
+        :return: ``False`` only when the expansion shows no children.
+        :rtype: bool
+        """
+        children = (page.get("children") or {}).get("page")
+        if not isinstance(children, dict):
+            return True
+        return bool(children.get("results") or children.get("size"))
+
+    def walk_page_tree(
+        self,
+        root_id: int | str,
+        expand: str | list[str] | None = None,
+        max_workers: int | None = None,
+        max_depth: int | None = None,
+        include_root: bool = True,
+        limit: int = 100,
+    ) -> Generator[tuple[int, dict], None, None]:
+        """Yield every page below a root page together with its depth.
+
+        The children of up to ``max_workers`` pages are listed concurrently,
+        each listing paged through completely, and pages are yielded as soon
+        as the listing of their parent completes. Every page comes after its
+        parent; siblings keep their order, but pages of different branches
+        interleave. Listings use ``children.page`` expansion so that pages
+        without children need no request of their own.
+
+        Pass ``expand`` to receive bodies or versions with the listings
+        instead of calling :meth:`get_content_by_id` for every page. Closing
+        the generator cancels listings that have not started yet.
+
+        :param root_id: The ID of the root page.
+        :type root_id: int or str
+        :param expand: Properties to expand for every page, for example
+            ``"body.storage,version"``.
+        :type expand: str or list[str], optional
+        :param max_workers: Maximum number of listings in flight. Defaults to
+            ``pool_maxsize``.
+        :type max_workers: int, optional
+        :param max_depth: Deepest level to yield, the root being 0. Defaults
+            to the whole tree.
+        :type max_depth: int, optional
+        :param include_root: Yield the root page first, at depth 0.
+        :type include_root: bool, optional
+        :param limit: Children requested per listing request (default 100).
+        :type limit: int, optional
+        :return: Generator over ``(depth, page)`` tuples with pages as
+            dictionaries.
+        :rtype: Generator[tuple[int, dict], None, None]
+        :raises APIError: If a request fails. The walk stops.
+        """
+        workers = self.pool_maxsize if max_workers is None else max_workers
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        params = self._expand_param(expand, "children.page")
+        if include_root:
+            root = self.get(
+                f"/rest/api/content/{root_id}",
+                params={"expand": params},
+                response_format="dict",
+            )
+            yield 0, root
+            if not self._has_child_pages(root):
+                return
+        if max_depth is not None and max_depth < 1:
+            return
+        pending: deque[tuple[int | str, int]] = deque([(root_id, 1)])
+        running: dict[Future, int] = {}
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="confluence-tree"
+        ) as executor:
+            try:
+                while pending or running:
+                    while pending and len(running) < workers:
+                        page_id, depth = pending.pop()
+                        future = executor.submit(
+                            self._list_child_pages, page_id, params, limit
+                        )
+                        running[future] = depth
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        depth = running.pop(future)
+                        children = future.result()
+                        if max_depth is None or depth < max_depth:
+                            pending.extend(
+                                (child["id"], depth + 1)
+                                for child in reversed(children)
+                                if self._has_child_pages(child)
+                            )
+                        for child in children:
+                            yield depth, child
+            finally:
+                for future in running:
+                    future.cancel()
+
     def get_attachments(self, page_id: int) -> SimpleNamespace | str | None:
         """Return attachments for a page.
 
@@ -0,0 +1,426 @@
+"""Concurrent inventory of Bitbucket repositories.
+
+``RepositoryCrawler`` walks projects, their repositories, and the branches
+and tags of every repository on a thread pool and yields one record per
+repository as soon as its listings are complete. Completed repositories can
+be appended to a checkpoint file, so a crawl that was interrupted resumes
+where it stopped. Per-stage counters report how fast each stage progresses.
+
+Example:
+
+.. code-block:: python
+
+    from atlassian import Bitbucket
+
+    bitbucket = Bitbucket(url="https://bitbucket.company.com", token="token")
+    crawler = bitbucket.crawl_repositories(checkpoint="inventory.checkpoint")
+    for record in crawler:
+        print(record["project"], record["slug"], len(record["branches"]))
+    print(crawler.stats)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from atlassian.error import APIError
+from atlassian.logger import get_logger
+
+if TYPE_CHECKING:
+    from atlassian.bitbucket import Bitbucket
+
+logger = get_logger(__name__)
+
+
+class StageStats:
+    """Progress counters of one crawl stage.
+
+    :ivar calls: Number of listings requested, including failed ones.
+    :ivar items: Number of values the listings returned.
+    :ivar errors: Number of listings that failed with ``APIError``.
+    :ivar busy: Seconds spent in listings of this stage, summed over workers.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Create counters for the stage ``name``."""
+        self.name = name
+        self.calls = 0
+        self.items = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.started: float | None = None
+        self.finished: float | None = None
+        self._lock = threading.Lock()
+
+    def record(self, started: float, items: int, error: bool = False) -> None:
+        """Count a finished listing.
+
+        :param started: ``time.monotonic()`` when the listing started.
+        :type started: float
+        :param items: Number of values returned.
+        :type items: int
+        :param error: Whether the listing failed.
+        :type error: bool, optional
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.calls += 1
+            self.items += items
+            self.errors += int(error)
+            self.busy += now - started
+            if self.started is None or started < self.started:
+                self.started = started
+            self.finished = now
+
+    @property
+    def elapsed(self) -> float:
+        """Wall-clock seconds between the first start and the last finish.
+
+        :return: Elapsed seconds, ``0.0`` before the first listing finished.
+        :rtype: float
+        """
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Values returned per wall-clock second.
+
+        :return: Items per second, ``0.0`` before any time elapsed.
+        :rtype: float
+        """
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        """Return a compact summary of the counters.
+
+        :return: Counter summary.
+        :rtype: str
+        """
+        return (
+            f"{type(self).__name__}({self.name}: calls={self.calls}, "
+            f"items={self.items}, errors={self.errors}, "
+            f"elapsed={self.elapsed:.2f}s, throughput={self.throughput:.1f}/s)"
+        )
+
+
+class RepositoryCrawler:
+    """Inventory of Bitbucket repositories with their branches and tags.
+
+    Iterating the crawler yields one record per repository:
+
+    .. code-block:: python
+
+        {
+            "project": "PROJ",
+            "slug": "repo",
+            "repo": {...},  # repository as listed in the project
+            "branches": [...],
+            "tags": [...],
+            "errors": {"tags": APIError(...)},  # listings that failed
+        }
+
+    The repository listing of a project already contains the repository
+    metadata, so no request per repository is needed for it. Branch and tag
+    listings run on a pool of ``max_workers`` threads that share the client
+    session; records are yielded in completion order. Values are plain
+    dictionaries.
+
+    When the repository listing of a project fails, a record with ``slug``
+    and ``repo`` set to ``None`` and the error under ``errors["repos"]`` is
+    yielded for the project instead. Such projects are not checkpointed, so a
+    resumed crawl lists them again.
+
+    With a ``checkpoint`` file, every repository is recorded after its record
+    has been consumed, and projects once all their repositories have been
+    consumed. A new crawler with the same file skips them. Delete the file to
+    start over.
+
+    Create crawlers with :meth:`atlassian.bitbucket.Bitbucket.crawl_repositories`.
+    Use a synchronous client.
+
+    :param bitbucket: Client used to list projects and repositories.
+    :type bitbucket: Bitbucket
+    :param projects: Project keys to crawl. Defaults to every project visible
+        to the client.
+    :type projects: Iterable[str], optional
+    :param max_workers: Number of concurrent listings. Defaults to the
+        ``pool_maxsize`` of the client.
+    :type max_workers: int, optional
+    :param checkpoint: File recording completed repositories and projects.
+    :type checkpoint: str or os.PathLike, optional
+    :param branches: List the branches of each repository.
+    :type branches: bool, optional
+    :param tags: List the tags of each repository.
+    :type tags: bool, optional
+    :ivar stats: :class:`StageStats` per stage: ``projects``, ``repos``,
+        ``branches``, and ``tags``.
+    :raises ValueError: If ``max_workers`` is less than ``1``.
+    """
+
+    def __init__(
+        self,
+        bitbucket: Bitbucket,
+        projects: Iterable[str] | None = None,
+        max_workers: int | None = None,
+        checkpoint: str | os.PathLike | None = None,
+        branches: bool = True,
+        tags: bool = True,
+    ) -> None:
+        """Create a crawler; nothing is requested until iteration starts."""
+        workers = bitbucket.pool_maxsize if max_workers is None else max_workers
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.bitbucket = bitbucket
+        self.projects = list(projects) if projects is not None else None
+        self.max_workers = workers
+        self.checkpoint = (
+            os.path.expanduser(os.fspath(checkpoint))
+            if checkpoint is not None
+            else None
+        )
+        self.listings = [
+            stage
+            for stage, wanted in (("branches", branches), ("tags", tags))
+            if wanted
+        ]
+        self.stats = {
+            stage: StageStats(stage)
+            for stage in ("projects", "repos", "branches", "tags")
+        }
+
+    def __iter__(self) -> Iterator[dict]:
+        """Crawl and yield repository records as they complete.
+
+        :return: Iterator over repository records.
+        :rtype: Iterator[dict]
+        """
+        done_projects, done_repos = self._read_checkpoint()
+        projects = self.projects
+        if projects is None:
+            projects = self._timed("projects", self._list_projects)
+            if isinstance(projects, APIError):
+                raise projects
+        log = self._open_checkpoint()
+        try:
+            yield from self._crawl(
+                [p for p in projects if p not in done_projects], done_repos, log
+            )
+        finally:
+            if log is not None:
+                log.close()
+
+    def _crawl(
+        self, projects: list[str], done_repos: set[tuple[str, str]], log: IO | None
+    ) -> Iterator[dict]:
+        """Run the listings of ``projects`` and yield completed records.
+
+        :param projects: Keys of the projects to crawl.
+        :type projects: list[str]
+        :param done_repos: ``(project, slug)`` of repositories to skip.
+        :type done_repos: set
+        :param log: Open checkpoint file, or ``None``.
+        :type log: IO or None
+        :return: Iterator over repository records.
+        :rtype: Iterator[dict]
+        """
+        queue: deque[tuple] = deque(("repos", key) for key in projects)
+        running: dict[Future, tuple] = {}
+        records: dict[tuple[str, str], dict] = {}
+        waiting: dict[tuple[str, str], int] = {}
+        open_repos = {key: 0 for key in projects}
+        with ThreadPoolExecutor(
+            self.max_workers, thread_name_prefix="bitbucket-crawl"
+        ) as pool:
+            try:
+                while queue or running:
+                    while queue and len(running) < self.max_workers:
+                        task = queue.popleft()
+                        running[pool.submit(self._run, task)] = task
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    ready = []
+                    for future in done:
+                        task = running.pop(future)
+                        result = future.result()
+                        if task[0] == "repos":
+                            project = task[1]
+                            if isinstance(result, APIError):
+                                logger.debug(
+                                    f"Listing repos of {project} failed: {result}"
+                                )
+                                del open_repos[project]
+                                yield self._project_error(project, result)
+                                continue
+                            for repo in result:
+                                repo_key = (project, repo["slug"])
+                                if repo_key in done_repos:
+                                    continue
+                                open_repos[project] += 1
+                                records[repo_key] = self._record(project, repo)
+                                waiting[repo_key] = len(self.listings)
+                                # Listings of known repositories go first, so
+                                # records complete early and stay few.
+                                for stage in reversed(self.listings):
+                                    queue.appendleft((stage, project, repo["slug"]))
+                                if not self.listings:
+                                    ready.append(repo_key)
+                            if open_repos[project] == 0:
+                                self._project_done(project, open_repos, log)
+                        else:
+                            stage, project, slug = task
+                            record = records[(project, slug)]
+                            if isinstance(result, APIError):
+                                record["errors"][stage] = result
+                            else:
+                                record[stage] = result
+                            waiting[(project, slug)] -= 1
+                            if waiting[(project, slug)] == 0:
+                                ready.append((project, slug))
+                    for repo_key in ready:
+                        del waiting[repo_key]
+                        yield records.pop(repo_key)
+                        self._repo_done(repo_key, open_repos, log)
+            finally:
+                for future in running:
+                    future.cancel()
+
+    def _run(self, task: tuple) -> Any:
+        """Run one listing task and count it in its stage.
+
+        :param task: ``("repos", project)`` or ``(stage, project, slug)``.
+        :type task: tuple
+        :return: Listed values, or the ``APIError`` that stopped the listing.
+        :rtype: list or APIError
+        """
+        stage, *args = task
+        listings: dict[str, Callable[..., Iterator]] = {
+            "repos": self.bitbucket.iter_project_repo,
+            "branches": self.bitbucket.iter_repo_branch,
+            "tags": self.bitbucket.iter_tags,
+        }
+        listing = listings[stage]
+        return self._timed(stage, lambda: list(listing(*args, response_format="dict")))
+
+    def _timed(self, stage: str, listing: Callable[[], list]) -> Any:
+        """Run a listing and record it in the counters of ``stage``.
+
+        :param stage: Stage name.
+        :type stage: str
+        :param listing: Function returning the listed values.
+        :type listing: callable
+        :return: Listed values, or the ``APIError`` that stopped the listing.
+        :rtype: list or APIError
+        """
+        started = time.monotonic()
+        try:
+            values = listing()
+        except APIError as e:
+            self.stats[stage].record(started, 0, error=True)
+            return e
+        self.stats[stage].record(started, len(values))
+        return values
+
+    def _list_projects(self) -> list[str]:
+        """Return the keys of every project visible to the client."""
+        projects = self.bitbucket.iter_projects(response_format="dict")
+        return [project["key"] for project in projects]
+
+    @staticmethod
+    def _record(project: str, repo: dict) -> dict:
+        """Return the record of a repository before its listings ran."""
+        return {
+            "project": project,
+            "slug": repo["slug"],
+            "repo": repo,
+            "branches": [],
+            "tags": [],
+            "errors": {},
+        }
+
+    @staticmethod
+    def _project_error(project: str, error: APIError) -> dict:
+        """Return the record of a project whose repositories could not be listed."""
+        return {
+            "project": project,
+            "slug": None,
+            "repo": None,
+            "branches": [],
+            "tags": [],
+            "errors": {"repos": error},
+        }
+
+    def _repo_done(
+        self, repo_key: tuple[str, str], open_repos: dict[str, int], log: IO | None
+    ) -> None:
+        """Checkpoint a consumed repository and, if it was the last, its project."""
+        project = repo_key[0]
+        self._write_checkpoint(log, {"repo": list(repo_key)})
+        open_repos[project] -= 1
+        if open_repos[project] == 0:
+            self._project_done(project, open_repos, log)
+
+    def _project_done(
+        self, project: str, open_repos: dict[str, int], log: IO | None
+    ) -> None:
+        """Checkpoint a project whose repositories were all consumed."""
+        del open_repos[project]
+        self._write_checkpoint(log, {"project": project})
+
+    def _open_checkpoint(self) -> IO | None:
+        """Open the checkpoint file for appending.
+
+        A line cut short by a crash is terminated first, so that new entries
+        start on a line of their own.
+
+        :return: Open file, or ``None`` without a checkpoint.
+        :rtype: IO or None
+        """
+        if self.checkpoint is None:
+            return None
+        truncated = False
+        if os.path.exists(self.checkpoint) and os.path.getsize(self.checkpoint):
+            with open(self.checkpoint, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                truncated = f.read(1) != b"\n"
+        log = open(self.checkpoint, "a", encoding="utf-8")
+        if truncated:
+            log.write("\n")
+        return log
+
+    @staticmethod
+    def _write_checkpoint(log: IO | None, entry: dict) -> None:
+        """Append an entry to the checkpoint file."""
+        if log is not None:
+            log.write(json.dumps(entry) + "\n")
+            log.flush()
+
+    def _read_checkpoint(self) -> tuple[set[str], set[tuple[str, str]]]:
+        """Return the projects and repositories completed by earlier crawls.
+
+        A line cut short by a crash is ignored.
+
+        :return: Project keys and ``(project, slug)`` pairs.
+        :rtype: tuple[set, set]
+        """
+        projects: set[str] = set()
+        repos: set[tuple[str, str]] = set()
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return projects, repos
+        with open(self.checkpoint, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "project" in entry:
+                    projects.add(entry["project"])
+                elif "repo" in entry:
+                    repos.add(tuple(entry["repo"]))
+        return projects, repos
@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+import inspect
+import itertools
+import os
+import re
+import threading
 import warnings
-from types import SimpleNamespace
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import SimpleNamespace, TracebackType
+from typing import Any, Awaitable, Generator, Iterable, Iterator
 
+from atlassian import jsonlib
+from atlassian.cache import invalidates, memoize
 from atlassian.client import AtlassianAPI
+from atlassian.error import APIError
+from atlassian.lazy import LazyNamespace
 from atlassian.logger import get_logger
+from atlassian.mirror import JiraMirror
+from atlassian.sync import JiraSync
 
 logger = get_logger(__name__)
 
+#: Search ``fields`` entries that are sent without loading field metadata:
+#: ``customfield_NNNNN``, lower camel case system field IDs such as
+#: ``fixVersions``, and the ``*all``/``*navigable`` selectors, optionally
+#: excluded with ``-``.
+_FIELD_ID = re.compile(r"-?(customfield_\d+|[a-z][A-Za-z0-9]*|\*all|\*navigable)")
+
+#: Fields that select the workflow transitions available to an issue.
+_WORKFLOW_FIELDS = ("project", "issuetype", "status")
+
 
 class Jira(AtlassianAPI):
     """Client for Jira REST API operations.
@@ -21,6 +44,14 @@ class Jira(AtlassianAPI):
         `Jira REST API Documentation <https://docs.atlassian.com/software/jira/docs/api/REST/7.6.1/>`_
     """
 
+    def _init_state(self) -> None:
+        """Create the field registry, the transition cache, and their locks."""
+        super()._init_state()
+        self._field_registry: FieldRegistry | None = None
+        self._field_registry_lock = threading.Lock()
+        self._transitions: dict[tuple, dict[str, str]] = {}
+        self._transitions_lock = threading.Lock()
+
     def issue(self, issue_key: str) -> SimpleNamespace | str | None:
         """Return a Jira issue by key.
 
@@ -62,7 +93,15 @@ class Jira(AtlassianAPI):
         :return: Decoded API response, or ``None`` when Jira returns no body.
         :rtype: dict or None
         """
-        url = f"/rest/api/2/issue/{issue_key}"
+        return self._edit_issue(
+            issue_key, self._label_payload(add_labels, remove_labels)
+        )
+
+    @staticmethod
+    def _label_payload(
+        add_labels: list[str] | None, remove_labels: list[str] | None
+    ) -> dict:
+        """Return the edit payload of :meth:`update_issue_label`."""
         add_labels_list = []
         remove_labels_list = []
         if add_labels is not None:
@@ -81,7 +120,7 @@ class Jira(AtlassianAPI):
             label_data = {"update": {"labels": add_labels_list}}
         elif remove_labels:
             label_data = {"update": {"labels": remove_labels_list}}
-        return self.put(url, json=label_data)
+        return label_data
 
     def update_issue_component(
         self,
@@ -100,7 +139,15 @@ class Jira(AtlassianAPI):
         :return: Decoded API response, or ``None`` when Jira returns no body.
         :rtype: dict or None
         """
-        url = f"/rest/api/2/issue/{issue_key}"
+        return self._edit_issue(
+            issue_key, self._component_payload(add_components, remove_components)
+        )
+
+    @staticmethod
+    def _component_payload(
+        add_components: list[str] | None, remove_components: list[str] | None
+    ) -> dict:
+        """Return the edit payload of :meth:`update_issue_component`."""
         add_component_list = []
         remove_component_list = []
         if add_components is not None:
@@ -120,7 +167,7 @@ class Jira(AtlassianAPI):
             component_data = {"update": {"components": add_component_list}}
         elif remove_components:
             component_data = {"update": {"components": remove_component_list}}
-        return self.put(url, json=component_data)
+        return component_data
 
     def update_issue_description(
         self, issue_key: str, new_description: str
@@ -134,9 +181,7 @@ class Jira(AtlassianAPI):
         :return: Decoded API response, or ``None`` when Jira returns no body.
         :rtype: dict or None
         """
-        url = f"/rest/api/2/issue/{issue_key}"
-        json = {"fields": {"description": new_description}}
-        return self.put(url, json=json)
+        return self._edit_issue(issue_key, {"fields": {"description": new_description}})
 
     def update_field(
         self,
@@ -158,14 +203,17 @@ class Jira(AtlassianAPI):
         :return: Decoded API response, or ``None`` when Jira returns no body.
         :rtype: dict or None
         """
-        url = f"/rest/api/2/issue/{issue_key}"
+        return self._edit_issue(issue_key, self._field_payload(field_name, add, remove))
+
+    @staticmethod
+    def _field_payload(field_name: str, add: str | None, remove: str | None) -> dict:
+        """Return the edit payload of :meth:`update_field`."""
         element = []
         if add:
             element.append({"add": {"name": add}})
         if remove:
             element.append({"remove": {"name": remove}})
-        json = {"update": {field_name: element}}
-        return self.put(url, json=json)
+        return {"update": {field_name: element}}
 
     def add_issue_comment(
         self, issue_key: str, content: str | None = None
@@ -250,6 +298,168 @@ class Jira(AtlassianAPI):
             data["update"] = update
         return self.post(url, json=data)
 
+    def edit(self, issue_key: str) -> IssueEdit:
+        """Collect several edits of an issue and send them in one request.
+
+        The edit methods of the returned object take the arguments of the
+        matching :class:`Jira` methods without ``issue_key``. Their payloads
+        are merged and sent in a single ``PUT`` when the ``with`` block ends:
+
+        .. code-block:: python
+
+            with jira.edit("TEST-1") as edit:
+                edit.update_issue_label(add_labels=["triaged"])
+                edit.update_issue_component(add_components=["API"])
+                edit.update_issue_description("Updated by automation.")
+                edit.update_custom_field("customfield_10002", 3)
+
+        :param issue_key: The key of the issue to update.
+        :type issue_key: str
+        :return: Edit collector; its ``response`` holds the decoded response
+            after the block.
+        :rtype: IssueEdit
+        """
+        return IssueEdit(self, issue_key)
+
+    def buffered_edits(self, max_workers: int | None = None) -> IssueEditBuffer:
+        """Collect edits of many issues and send one request per issue.
+
+        The edit methods of the returned buffer take the same arguments as
+        the matching :class:`Jira` methods. Edits of the same issue are
+        merged, and the issues are updated concurrently when the ``with``
+        block ends or :meth:`IssueEditBuffer.flush` is called:
+
+        .. code-block:: python
+
+            with jira.buffered_edits() as edits:
+                for key in keys:
+                    edits.update_issue_label(key, add_labels=["release-1.2"])
+                    edits.update_field(key, "fixVersions", add="1.2")
+
+        :param max_workers: Number of issues updated concurrently. Defaults
+            to the connection pool size.
+        :type max_workers: int, optional
+        :return: Edit buffer.
+        :rtype: IssueEditBuffer
+        """
+        return IssueEditBuffer(self, max_workers)
+
+    #: Maximum number of issues Jira accepts per bulk create request.
+    bulk_create_chunk_size = 50
+
+    def create_issues_bulk(
+        self,
+        issues: Iterable[dict],
+        chunk_size: int | None = None,
+        max_workers: int | None = None,
+    ) -> list[dict | APIError | None]:
+        """Create many issues through ``/rest/api/2/issue/bulk``.
+
+        The issues are sent in chunks of ``chunk_size`` and the chunks are
+        created concurrently with :meth:`map`. Jira creates the valid issues
+        of a chunk even when others fail, so the result is reported per issue.
+
+        .. code-block:: python
+
+            results = jira.create_issues_bulk(
+                {"project": {"key": "PROJ"}, "summary": title, "issuetype": {"name": "Task"}}
+                for title in titles
+            )
+            failed = [r for r in results if isinstance(r, APIError)]
+
+        :param issues: Jira ``fields`` payloads, as for :meth:`create_issue`.
+            Pass ``{"fields": ..., "update": ...}`` to include an update
+            payload.
+        :type issues: Iterable[dict]
+        :param chunk_size: Issues per request. Defaults to
+            :attr:`bulk_create_chunk_size`, the Jira default limit.
+        :type chunk_size: int, optional
+        :param max_workers: Number of chunks created concurrently. Defaults
+            to the connection pool size.
+        :type max_workers: int, optional
+        :return: One entry per input, in input order: the created issue
+            (``id``, ``key``, ``self``), an ``APIError`` describing why it was
+            not created, or ``None`` if Jira did not report it.
+        :rtype: list
+        :raises ValueError: If ``chunk_size`` is less than ``1``.
+        """
+        chunks = self._bulk_create_chunks(issues, chunk_size)
+        responses = self.map(self._create_issue_chunk, chunks, max_workers)
+        return self._bulk_create_results(chunks, responses)
+
+    def _bulk_create_chunks(
+        self, issues: Iterable[dict], chunk_size: int | None
+    ) -> list[list[dict]]:
+        """Split bulk create payloads into request-sized ``issueUpdates`` lists.
+
+        :param issues: Jira ``fields`` payloads or ``issueUpdates`` entries.
+        :type issues: Iterable[dict]
+        :param chunk_size: Issues per request, or ``None`` for the default.
+        :type chunk_size: int or None
+        :return: ``issueUpdates`` entries per request.
+        :rtype: list[list[dict]]
+        :raises ValueError: If ``chunk_size`` is less than ``1``.
+        """
+        size = self.bulk_create_chunk_size if chunk_size is None else chunk_size
+        if size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        updates = [
+            issue if "fields" in issue else {"fields": issue} for issue in issues
+        ]
+        return [updates[i : i + size] for i in range(0, len(updates), size)]
+
+    def _create_issue_chunk(self, chunk: list[dict]) -> dict | None:
+        """Send one bulk create request.
+
+        :param chunk: ``issueUpdates`` entries.
+        :type chunk: list[dict]
+        :return: Decoded API response, or ``None`` when Jira returns no body.
+        :rtype: dict or None
+        """
+        return self.post("/rest/api/2/issue/bulk", json={"issueUpdates": chunk})
+
+    @staticmethod
+    def _bulk_create_results(
+        chunks: list[list[dict]], responses: list
+    ) -> list[dict | APIError | None]:
+        """Map bulk create responses back to the issues of each chunk.
+
+        Jira lists the created issues in request order and reports failures
+        with their ``failedElementNumber``. When every issue of a chunk fails,
+        Jira answers ``400`` with the same error list in the body.
+
+        :param chunks: ``issueUpdates`` entries per request.
+        :type chunks: list[list[dict]]
+        :param responses: Response or ``APIError`` per request.
+        :type responses: list
+        :return: One entry per issue, in input order.
+        :rtype: list
+        """
+        results: list[dict | APIError | None] = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, APIError):
+                try:
+                    body = jsonlib.loads(response.message)
+                except ValueError:
+                    body = None
+                if not isinstance(body, dict) or not body.get("errors"):
+                    results.extend(response for _ in chunk)
+                    continue
+                response = body
+            response = response or {}
+            failed = {
+                error.get("failedElementNumber"): APIError(
+                    error.get("status"), _bulk_error_message(error)
+                )
+                for error in response.get("errors", [])
+            }
+            created = iter(response.get("issues", []))
+            results.extend(
+                failed[index] if index in failed else next(created, None)
+                for index in range(len(chunk))
+            )
+        return results
+
     # TODO: replace by create_issue, will remove it in the future
     def create_task(
         self,
@@ -393,15 +603,33 @@ class Jira(AtlassianAPI):
         :rtype: dict or None
         :raises AttributeError: If more than two ``field_args`` are provided.
         """
-        url = f"/rest/api/2/issue/{issue_key}"
+        return self._edit_issue(
+            issue_key, self._custom_field_payload(field_id, *field_args)
+        )
+
+    @staticmethod
+    def _custom_field_payload(field_id: str, *field_args: object) -> dict:
+        """Return the edit payload of :meth:`update_custom_field`.
+
+        :raises AttributeError: If more than two ``field_args`` are provided.
+        """
         if len(field_args) == 1:
-            json = {"fields": {field_id: field_args[0]}}
-        elif len(field_args) == 2:
-            json = {"fields": {field_id: {field_args[0]: field_args[1]}}}
-        else:
-            raise AttributeError("Not support field_args length > 2")
+            return {"fields": {field_id: field_args[0]}}
+        if len(field_args) == 2:
+            return {"fields": {field_id: {field_args[0]: field_args[1]}}}
+        raise AttributeError("Not support field_args length > 2")
 
-        return self.put(url, json=json)
+    def _edit_issue(self, issue_key: str, payload: dict) -> dict | None:
+        """Send an edit payload to ``/rest/api/2/issue/{issue_key}``.
+
+        :param issue_key: The key of the issue to update.
+        :type issue_key: str
+        :param payload: Jira edit payload with ``fields`` and/or ``update``.
+        :type payload: dict
+        :return: Decoded API response, or ``None`` when Jira returns no body.
+        :rtype: dict or None
+        """
+        return self.put(f"/rest/api/2/issue/{issue_key}", json=payload)
 
     def assign_issue(self, issue_key: str, assignee: str | None = None) -> dict | None:
         """Assign an issue to a user or unassign it.
@@ -466,60 +694,780 @@ class Jira(AtlassianAPI):
         url = f"/rest/api/2/issue/{issue_id}/transitions"
         return self.get(url)
 
+    #: Number of issue keys whose workflow state is requested per search by
+    #: :meth:`transition_issues_by_name`.
+    transition_lookup_chunk_size = 100
+
+    def transition_issue_by_name(self, issue: str | dict, name: str) -> dict | None:
+        """Move an issue through the workflow transition with the given name.
+
+        Transition IDs are cached per project, issue type, and status, the
+        inputs that determine the transitions of a workflow. Given an issue
+        key, the issue state and its transitions are requested in one call.
+        Given an issue from a search that returned the ``project``,
+        ``issuetype``, and ``status`` fields, a cached transition is used
+        without any lookup.
+
+        If Jira rejects a cached transition with ``400``, for example because
+        the workflow changed, the transitions are requested again and the
+        transition is retried once.
+
+        :param issue: Issue key, or issue with ``key`` and ``fields``.
+        :type issue: str or dict
+        :param name: Transition name, or the name of its target status.
+            Matched case-insensitively.
+        :type name: str
+        :return: Decoded API response, or ``None`` when Jira returns no body.
+        :rtype: dict or None
+        :raises ValueError: If the issue has no transition with this name, or
+            Jira returns no issue for the key.
+        """
+        if isinstance(issue, dict):
+            return self._transition_in_state(
+                issue["key"], self._workflow_state(issue), name
+            )
+        response = self._checked_issue(
+            issue,
+            self.get(
+                f"/rest/api/2/issue/{issue}",
+                params={"fields": ",".join(_WORKFLOW_FIELDS), "expand": "transitions"},
+                response_format="dict",
+            ),
+        )
+        state = self._workflow_state(response)
+        self._remember_transitions(state, response.get("transitions") or [])
+        return self._transition_in_state(response["key"], state, name, fresh=True)
+
+    def transition_issues_by_name(
+        self,
+        issues: Iterable[str | dict],
+        name: str,
+        max_workers: int | None = None,
+    ) -> list:
+        """Move many issues through the workflow transition with the given name.
+
+        The workflow state of issues given by key is requested with searches
+        of :attr:`transition_lookup_chunk_size` keys, transitions are looked
+        up once per distinct project, issue type, and status, and the issues
+        are transitioned concurrently with :meth:`map`. Issues from a search
+        that returned the ``project``, ``issuetype``, and ``status`` fields
+        need no state lookup:
+
+        .. code-block:: python
+
+            issues = jira.iter_issues_with_jql(
+                "fixVersion = 1.2 AND status = Resolved",
+                fields=["project", "issuetype", "status"],
+            )
+            results = jira.transition_issues_by_name(issues, "Close")
+
+        :param issues: Issue keys, or issues with ``key`` and ``fields``.
+        :type issues: Iterable[str or dict]
+        :param name: Transition name, or the name of its target status.
+        :type name: str
+        :param max_workers: Number of concurrent requests. Defaults to the
+            connection pool size.
+        :type max_workers: int, optional
+        :return: One decoded response, ``APIError``, or ``ValueError`` per
+            issue, in input order. Issues that do not exist get an
+            ``APIError`` with code ``404``; issues without the transition get
+            a ``ValueError``.
+        :rtype: list
+        """
+        issues = list(issues)
+        chunks = self._transition_lookup_chunks(issues)
+        lookups = self.map(self._issue_states, chunks, max_workers)
+        targets = self._transition_targets(issues, chunks, lookups)
+        unknown = self._unknown_states(targets)
+        self.map(self._load_transitions, unknown, max_workers)
+        calls = self._transition_calls(targets, name, unknown)
+        return self._transition_results(
+            targets, self.map(self._try_transition, calls, max_workers)
+        )
+
+    def clear_transition_cache(self) -> None:
+        """Drop the transition IDs cached by :meth:`transition_issue_by_name`."""
+        with self._transitions_lock:
+            self._transitions.clear()
+
+    def _transition_in_state(
+        self, issue_key: str, state: tuple, name: str, fresh: bool = False
+    ) -> dict | None:
+        """Transition an issue whose workflow state is known.
+
+        :param issue_key: The key of the issue to transition.
+        :type issue_key: str
+        :param state: Project, issue type, and status IDs of the issue.
+        :type state: tuple
+        :param name: Transition or target status name.
+        :type name: str
+        :param fresh: The cached transitions were just requested, so a
+            rejected transition is not retried.
+        :type fresh: bool, optional
+        :return: Decoded API response, or ``None`` when Jira returns no body.
+        :rtype: dict or None
+        :raises ValueError: If the issue has no transition with this name.
+        """
+        transition_id = self._cached_transition_id(state, name)
+        if transition_id is not None:
+            try:
+                return self.issue_transition(issue_key, transition_id)
+            except APIError as e:
+                if fresh or e.code != 400:
+                    raise
+        elif fresh:
+            raise self._unknown_transition(issue_key, state, name)
+        self._load_transitions(issue_key, state)
+        transition_id = self._cached_transition_id(state, name)
+        if transition_id is None:
+            raise self._unknown_transition(issue_key, state, name)
+        return self.issue_transition(issue_key, transition_id)
+
+    def _try_transition(
+        self, issue_key: str, state: tuple, name: str, fresh: bool
+    ) -> Any:
+        """Call :meth:`_transition_in_state`, returning a ``ValueError``."""
+        try:
+            return self._transition_in_state(issue_key, state, name, fresh)
+        except ValueError as e:
+            return e
+
+    @staticmethod
+    def _checked_issue(issue_key: str, response: Any) -> dict:
+        """Return an issue response, or raise if Jira sent no issue.
+
+        :param issue_key: The requested issue key.
+        :type issue_key: str
+        :param response: Decoded response of the issue request.
+        :type response: object
+        :return: The issue.
+        :rtype: dict
+        :raises ValueError: If the response is empty or not a JSON object.
+        """
+        if not isinstance(response, dict):
+            raise ValueError(f"Jira returned no issue data for {issue_key}")
+        return response
+
+    def _load_transitions(self, issue_key: str, state: tuple) -> None:
+        """Request the transitions of an issue and cache them for its state.
+
+        :param issue_key: The key of an issue in ``state``.
+        :type issue_key: str
+        :param state: Project, issue type, and status IDs of the issue.
+        :type state: tuple
+        """
+        url = f"/rest/api/2/issue/{issue_key}/transitions"
+        response = self.get(url, response_format="dict") or {}
+        self._remember_transitions(state, response.get("transitions") or [])
+
+    def _issue_states(self, keys: list[str]) -> dict[str, dict]:
+        """Return the issues with the given keys and their workflow fields.
+
+        :param keys: Issue keys.
+        :type keys: list[str]
+        :return: Issues by key. Keys that do not exist are missing.
+        :rtype: dict[str, dict]
+        """
+        response = self.post(
+            "/rest/api/2/search", json=self._issue_states_payload(keys)
+        )
+        return {issue["key"]: issue for issue in (response or {}).get("issues") or []}
+
+    @staticmethod
+    def _issue_states_payload(keys: list[str]) -> dict:
+        """Build the search that returns the workflow fields of issues.
+
+        Unknown keys are reported as warnings instead of failing the search.
+        Keys are quoted, so they cannot change the query.
+
+        :param keys: Issue keys.
+        :type keys: list[str]
+        :return: Search request payload.
+        :rtype: dict
+        """
+        return {
+            "jql": f"key in ({', '.join(_jql_string(key) for key in keys)})",
+            "startAt": 0,
+            "maxResults": len(keys),
+            "fields": list(_WORKFLOW_FIELDS),
+            "validateQuery": "warn",
+        }
+
+    def _transition_lookup_chunks(self, issues: list) -> list[list[str]]:
+        """Split the upper-case keys of ``issues`` without fields into chunks.
+
+        :param issues: Issue keys or issues.
+        :type issues: list
+        :return: Chunks of at most :attr:`transition_lookup_chunk_size` keys.
+        :rtype: list[list[str]]
+        """
+        keys = list(dict.fromkeys(i.upper() for i in issues if not isinstance(i, dict)))
+        size = max(self.transition_lookup_chunk_size, 1)
+        return [keys[i : i + size] for i in range(0, len(keys), size)]
+
+    @classmethod
+    def _transition_targets(
+        cls, issues: list, chunks: list[list[str]], lookups: list
+    ) -> list:
+        """Pair every issue with its workflow state.
+
+        :param issues: Issue keys or issues.
+        :type issues: list
+        :param chunks: Key chunks passed to :meth:`_issue_states`.
+        :type chunks: list[list[str]]
+        :param lookups: Result or ``APIError`` of each chunk.
+        :type lookups: list
+        :return: ``(issue_key, state)`` or ``APIError`` per issue.
+        :rtype: list
+        """
+        found: dict[str, Any] = {}
+        for chunk, lookup in zip(chunks, lookups):
+            for key in chunk:
+                if isinstance(lookup, APIError):
+                    found[key] = lookup
+                elif key in lookup:
+                    found[key] = lookup[key]
+                else:
+                    found[key] = APIError(404, f"Issue {key} does not exist")
+        targets: list = []
+        for issue in issues:
+            if not isinstance(issue, dict):
+                issue = found[issue.upper()]
+            if isinstance(issue, APIError):
+                targets.append(issue)
+            else:
+                targets.append((issue["key"], cls._workflow_state(issue)))
+        return targets
+
+    def _unknown_states(self, targets: list) -> list[tuple[str, tuple]]:
+        """Return one ``(issue_key, state)`` per state without cached transitions.
+
+        :param targets: Result of :meth:`_transition_targets`.
+        :type targets: list
+        :return: Issue to request the transitions of, per unknown state.
+        :rtype: list[tuple[str, tuple]]
+        """
+        unknown: dict[tuple, str] = {}
+        with self._transitions_lock:
+            for target in targets:
+                if isinstance(target, tuple) and target[1] not in self._transitions:
+                    unknown.setdefault(target[1], target[0])
+        return [(key, state) for state, key in unknown.items()]
+
+    def _transition_calls(
+        self, targets: list, name: str, loaded: list[tuple[str, tuple]]
+    ) -> list[tuple[str, tuple, str, bool]]:
+        """Return the :meth:`_try_transition` arguments of the targets.
+
+        :param targets: Result of :meth:`_transition_targets`.
+        :type targets: list
+        :param name: Transition or target status name.
+        :type name: str
+        :param loaded: States whose transitions were just requested; their
+            transitions are not requested again.
+        :type loaded: list[tuple[str, tuple]]
+        :return: Arguments per ``(issue_key, state)`` target.
+        :rtype: list[tuple[str, tuple, str, bool]]
+        """
+        with self._transitions_lock:
+            fresh = {state for _, state in loaded if state in self._transitions}
+        return [
+            (key, state, name, state in fresh)
+            for key, state in (t for t in targets if isinstance(t, tuple))
+        ]
+
+    @staticmethod
+    def _transition_results(targets: list, responses: list) -> list:
+        """Merge transition responses with lookup errors in input order.
+
+        :param targets: Result of :meth:`_transition_targets`.
+        :type targets: list
+        :param responses: Transition results of the ``(key, state)`` targets.
+        :type responses: list
+        :return: One result per issue.
+        :rtype: list
+        """
+        remaining = iter(responses)
+        return [
+            next(remaining) if isinstance(target, tuple) else target
+            for target in targets
+        ]
+
+    @staticmethod
+    def _workflow_state(issue: dict) -> tuple:
+        """Return the project, issue type, and status IDs of an issue.
+
+        :param issue: Issue with ``project``, ``issuetype``, and ``status``
+            fields.
+        :type issue: dict
+        :return: Workflow state used as transition cache key.
+        :rtype: tuple
+        """
+        fields = issue.get("fields") or {}
+        return tuple((fields.get(name) or {}).get("id") for name in _WORKFLOW_FIELDS)
+
+    def _cached_transition_id(self, state: tuple, name: str) -> str | None:
+        """Return the cached ID of a transition, or ``None`` if unknown.
+
+        :param state: Project, issue type, and status IDs.
+        :type state: tuple
+        :param name: Transition or target status name.
+        :type name: str
+        :return: Transition ID, or ``None``.
+        :rtype: str or None
+        """
+        with self._transitions_lock:
+            return self._transitions.get(state, {}).get(name.casefold())
+
+    def _remember_transitions(self, state: tuple, transitions: list[dict]) -> None:
+        """Cache the transitions available in a workflow state.
+
+        Transitions are indexed by their name and by the name of their
+        target status; transition names win over status names.
+
+        :param state: Project, issue type, and status IDs.
+        :type state: tuple
+        :param transitions: Transitions returned by Jira.
+        :type transitions: list[dict]
+        """
+        ids = {
+            str((t.get("to") or {}).get("name", "")).casefold(): t["id"]
+            for t in transitions
+        }
+        ids.update({str(t.get("name", "")).casefold(): t["id"] for t in transitions})
+        with self._transitions_lock:
+            self._transitions[state] = ids
+
+    def _unknown_transition(
+        self, issue_key: str, state: tuple, name: str
+    ) -> ValueError:
+        """Build the error for a transition that is not available.
+
+        :param issue_key: The key of the issue.
+        :type issue_key: str
+        :param state: Project, issue type, and status IDs of the issue.
+        :type state: tuple
+        :param name: Requested transition name.
+        :type name: str
+        :return: Error listing the available transition and status names.
+        :rtype: ValueError
+        """
+        with self._transitions_lock:
+            available = sorted(self._transitions.get(state, {}))
+        return ValueError(
+            f"Transition {name!r} is not available for {issue_key}; "
+            f"available: {', '.join(available) or 'none'}"
+        )
+
     def search_issue_with_jql(
         self,
         jql: str,
         max_result: int = 1000,
         fields: list[str] | None = None,
+        concurrency: int = 1,
     ) -> list:
         """Search issues using JQL.
 
+        All pages are collected into one list. Use
+        :meth:`iter_issues_with_jql` to process large result sets page by page.
+
         :param jql: The JQL query string.
         :type jql: str
         :param max_result: Page size requested from Jira for each API call.
         :type max_result: int, optional
-        :param fields: List of field names to return for each issue. When
-            ``None`` (the default), all fields are returned. Pass an explicit
-            list to restrict the response, for example
-            ``["summary", "status", "assignee"]``.
+        :param fields: List of field IDs or names to return for each issue.
+            When ``None`` (the default), all fields are returned. Pass an
+            explicit list to restrict the response, for example
+            ``["summary", "status", "Story Points"]``. Names are resolved
+            with :meth:`field_registry`.
         :type fields: list[str], optional
-        :return: Issues matching the query.
+        :param concurrency: Number of pages fetched in parallel after the
+            first page. See :meth:`iter_issues_with_jql`.
+        :type concurrency: int, optional
+        :return: Issues matching the query, in search order.
         :rtype: list
         """
-        url = "/rest/api/2/search"
-        start_at = 0
-        issues: list[str] = []
-        payload: dict = {
-            "jql": jql,
-            "startAt": start_at,
-            "maxResults": max_result,
-        }
+        return list(
+            self.iter_issues_with_jql(jql, max_result, fields, concurrency=concurrency)
+        )
+
+    def iter_issues_with_jql(
+        self,
+        jql: str,
+        max_result: int = 1000,
+        fields: list[str] | None = None,
+        pages: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True,
+    ) -> Iterator:
+        """Iterate over the issues matching a JQL query.
+
+        By default each page is requested only when the previous one has been
+        consumed, so memory use stays bounded by the page size. With
+        ``concurrency`` greater than one, the remaining pages are requested
+        from a thread pool as soon as the first page reports the ``total``;
+        at most ``concurrency`` pages are in flight or waiting to be consumed.
+
+        .. code-block:: python
+
+            for issue in jira.iter_issues_with_jql("project = TEST", fields=["summary"]):
+                print(issue["key"], issue["fields"]["summary"])
+
+        :param jql: The JQL query string.
+        :type jql: str
+        :param max_result: Page size requested from Jira for each API call.
+        :type max_result: int, optional
+        :param fields: List of field IDs or names to return for each issue,
+            or ``None`` for all fields. Names are resolved with
+            :meth:`field_registry`.
+        :type fields: list[str], optional
+        :param pages: Yield one list of issues per page instead of single
+            issues.
+        :type pages: bool, optional
+        :param concurrency: Maximum number of pages fetched in parallel.
+        :type concurrency: int, optional
+        :param ordered: Deliver pages in search order. When ``False``, pages
+            are delivered as soon as they arrive, which keeps the pool busy
+            when some pages are slow.
+        :type ordered: bool, optional
+        :return: Iterator over issues, or over pages when ``pages`` is true.
+        :rtype: Iterator
+        :raises ValueError: If ``concurrency`` is less than 1. Raised by the
+            call, before iteration starts.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        return self._iter_issues_with_jql(
+            jql, max_result, fields, pages, concurrency, ordered
+        )
+
+    def _iter_issues_with_jql(
+        self,
+        jql: str,
+        max_result: int,
+        fields: list[str] | None,
+        pages: bool,
+        concurrency: int,
+        ordered: bool,
+    ) -> Iterator:
+        """Iterate over the issues matching a JQL query.
+
+        See :meth:`iter_issues_with_jql`, which validates the arguments.
+        """
+        fields = self._search_fields(fields)
+        response = self._search_page(jql, 0, max_result, fields)
+        if "total" not in response:
+            return
+        total = response["total"]
+        max_results = response["maxResults"]
+        offsets = range(max_results, total, max_results) if max_results else range(0)
+        if concurrency == 1:
+            responses: Generator[dict, None, None] = (
+                self._search_page(jql, start_at, max_result, fields)
+                for start_at in offsets
+            )
+        else:
+            responses = self._search_pages_concurrently(
+                jql, offsets, max_result, fields, concurrency, ordered
+            )
+        try:
+            for response in itertools.chain([response], responses):
+                issues = response.get("issues") or []
+                if pages:
+                    yield issues
+                else:
+                    yield from issues
+        finally:
+            responses.close()
+
+    def _search_page(
+        self, jql: str, start_at: int, max_result: int, fields: list[str] | None
+    ) -> dict:
+        """Request one page of a JQL search.
+
+        :param jql: The JQL query string.
+        :type jql: str
+        :param start_at: Index of the first issue to return.
+        :type start_at: int
+        :param max_result: Page size requested from Jira.
+        :type max_result: int
+        :param fields: Field names to return, or ``None`` for all fields.
+        :type fields: list[str] or None
+        :return: Search response, or an empty dict for empty responses.
+        :rtype: dict
+        """
+        payload = self._jql_payload(jql, start_at, max_result, fields)
+        return self.post("/rest/api/2/search", json=payload) or {}
+
+    def _search_pages_concurrently(
+        self,
+        jql: str,
+        offsets: Iterable[int],
+        max_result: int,
+        fields: list[str] | None,
+        concurrency: int,
+        ordered: bool,
+    ) -> Generator[dict, None, None]:
+        """Request search pages from a thread pool.
+
+        :param jql: The JQL query string.
+        :type jql: str
+        :param offsets: ``startAt`` values of the pages to request.
+        :type offsets: Iterable[int]
+        :param max_result: Page size requested from Jira.
+        :type max_result: int
+        :param fields: Field names to return, or ``None`` for all fields.
+        :type fields: list[str] or None
+        :param concurrency: Maximum number of pages in flight.
+        :type concurrency: int
+        :param ordered: Deliver pages in ``offsets`` order.
+        :type ordered: bool
+        :return: Generator over search responses. Closing it cancels pages
+            that have not started yet.
+        :rtype: Generator[dict, None, None]
+        """
+        remaining = iter(offsets)
+        pending: deque[Future] = deque()
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="jira-search"
+        ) as executor:
+
+            def submit() -> None:
+                start_at = next(remaining, None)
+                if start_at is not None:
+                    pending.append(
+                        executor.submit(
+                            self._search_page, jql, start_at, max_result, fields
+                        )
+                    )
+
+            try:
+                for _ in range(concurrency):
+                    submit()
+                while pending:
+                    if ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        future = done.pop()
+                        pending.remove(future)
+                    response = future.result()
+                    submit()
+                    yield response
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _jql_payload(
+        jql: str, start_at: int, max_result: int, fields: list[str] | None
+    ) -> dict:
+        """Build the request body for one page of a JQL search.
+
+        :param jql: The JQL query string.
+        :type jql: str
+        :param start_at: Index of the first issue to return.
+        :type start_at: int
+        :param max_result: Page size requested from Jira.
+        :type max_result: int
+        :param fields: Field names to return, or ``None`` for all fields.
+        :type fields: list[str] or None
+        :return: Search request payload.
+        :rtype: dict
+        """
+        payload: dict = {"jql": jql, "startAt": start_at, "maxResults": max_result}
         if fields is not None:
             payload["fields"] = fields
-        response = self.post(url, json=payload) or {}
-        try:
-            total = response["total"]
-        except KeyError:
-            return issues
-        max_results = response["maxResults"]
-        for issue in response["issues"]:
-            issues.append(issue)
-
-        while total > max_results:
-            start_at = start_at + max_results
-            payload = {
-                "jql": jql,
-                "startAt": start_at,
-                "maxResults": max_result,
-            }
-            if fields is not None:
-                payload["fields"] = fields
-            response = self.post(url, json=payload) or {}
-            total = total - max_results
-            for issue in response["issues"]:
-                issues.append(issue)
-        return issues
+        return payload
+
+    def sync(
+        self,
+        jql: str,
+        state_path: str | os.PathLike | None = None,
+        fields: list[str] | None = None,
+        overlap: float = 60,
+        page_size: int = 100,
+    ) -> JiraSync:
+        """Return the issues of a JQL query that changed since the last run.
 
+        The greatest ``updated`` timestamp of the returned issues is kept in
+        ``state_path``; the next run only searches issues updated since then:
+
+        .. code-block:: python
+
+            sync = jira.sync("project = PROJ", state_path="proj.sync.json")
+            for issue in sync.issues():
+                store(issue)
+
+        See :class:`atlassian.sync.JiraSync` for the parameters.
+
+        :param jql: JQL query without ``ORDER BY``.
+        :type jql: str
+        :param state_path: JSON file that keeps the mark between runs.
+        :type state_path: str, optional
+        :param fields: Field IDs or names to return; ``updated`` is added.
+        :type fields: list[str], optional
+        :param overlap: Seconds re-read before the mark.
+        :type overlap: float, optional
+        :param page_size: Issues requested per search.
+        :type page_size: int, optional
+        :return: Incremental sync.
+        :rtype: JiraSync
+        """
+        return JiraSync(self, jql, state_path, fields, overlap, page_size)
+
+    def mirror(
+        self,
+        path: str | os.PathLike,
+        jql: str,
+        fields: list[str] | None = None,
+        **sync_options: Any,
+    ) -> JiraMirror:
+        """Return a local SQLite copy of the issues of a JQL query.
+
+        :meth:`JiraMirror.refresh` stores the issues changed since the last
+        refresh; reports then filter the copy without contacting Jira:
+
+        .. code-block:: python
+
+            mirror = jira.mirror("~/jira.sqlite3", "project = PROJ")
+            mirror.refresh()
+            open_bugs = mirror.count(issuetype="Bug", status="Open")
+            for issue in mirror.issues(assignee="jdoe", label="urgent"):
+                print(issue["key"])
+
+        See :class:`atlassian.mirror.JiraMirror` for the parameters.
+
+        :param path: Database file. Created when missing.
+        :type path: str or os.PathLike
+        :param jql: JQL query of the mirrored issues.
+        :type jql: str
+        :param fields: Field IDs or names to store. Defaults to all fields.
+        :type fields: list[str], optional
+        :return: Issue mirror.
+        :rtype: JiraMirror
+        """
+        return JiraMirror(self, path, jql, fields, **sync_options)
+
+    def _search_fields(self, fields: list[str] | None) -> list[str] | None:
+        """Resolve the field names of a JQL search to field IDs.
+
+        Entries that look like field IDs are sent unchanged and never looked
+        up, so the result does not depend on whether field metadata has been
+        loaded. Field metadata is loaded only for the other entries.
+
+        :param fields: Field IDs or names, or ``None`` for all fields.
+        :type fields: list[str] or None
+        :return: Field IDs, or ``None`` for all fields.
+        :rtype: list[str] or None
+        """
+        if fields is None or not self._needs_field_registry(fields):
+            return fields
+        return self._resolve_search_fields(fields, self.field_registry())
+
+    @staticmethod
+    def _needs_field_registry(fields: list[str]) -> bool:
+        """Return whether resolving ``fields`` needs field metadata.
+
+        :param fields: Field IDs or names.
+        :type fields: list[str]
+        :return: ``True`` if some entry does not look like a field ID.
+        :rtype: bool
+        """
+        return not all(_FIELD_ID.fullmatch(field) for field in fields)
+
+    @staticmethod
+    def _resolve_search_fields(fields: list[str], registry: FieldRegistry) -> list[str]:
+        """Resolve the entries of ``fields`` that do not look like field IDs.
+
+        :param fields: Field IDs or names.
+        :type fields: list[str]
+        :param registry: Field metadata.
+        :type registry: FieldRegistry
+        :return: Field IDs.
+        :rtype: list[str]
+        """
+        return [
+            field if _FIELD_ID.fullmatch(field) else registry.search_fields([field])[0]
+            for field in fields
+        ]
+
+    @memoize
+    def get_fields(self) -> SimpleNamespace | str | None:
+        """Return the system and custom fields defined in Jira.
+
+        :return: Field list with ``id``, ``name``, ``custom``, and ``schema``
+            of every field, raw response text for non-JSON responses, or
+            ``None`` for an empty body.
+        :rtype: SimpleNamespace or str or None
+        """
+        return self.get("/rest/api/2/field")
+
+    def field_registry(self, refresh: bool = False) -> FieldRegistry:
+        """Return the field metadata of this Jira, indexed by ID and name.
+
+        Field metadata is read with :meth:`get_fields`, so a configured
+        ``metadata_cache`` is shared with it, and kept per client until
+        ``refresh`` is passed or :meth:`clear_field_registry` is called:
+
+        .. code-block:: python
+
+            fields = jira.field_registry()
+            points = fields.field_id("Story Points")  # "customfield_10002"
+
+        :param refresh: Request the field metadata again, for example after
+            a custom field was added.
+        :type refresh: bool, optional
+        :return: Field registry.
+        :rtype: FieldRegistry
+        """
+        with self._field_registry_lock:
+            if self._field_registry is None or refresh:
+                if refresh and self.metadata_cache is not None:
+                    self.metadata_cache.invalidate("get_fields")
+                self._field_registry = FieldRegistry(_plain(self.get_fields()))
+            return self._field_registry
+
+    def clear_field_registry(self) -> None:
+        """Drop the field metadata loaded by :meth:`field_registry`."""
+        with self._field_registry_lock:
+            self._field_registry = None
+
+    def field_id(self, name: str) -> str:
+        """Return the ID of a field given its ID or name.
+
+        :param name: Field ID, or field name such as ``Story Points``. Names
+            are matched case-insensitively.
+        :type name: str
+        :return: Field ID, for example ``customfield_10002``.
+        :rtype: str
+        :raises ValueError: If no field or several fields have this name.
+        """
+        return self.field_registry().field_id(name)
+
+    def resolve_fields(self, fields: dict) -> dict:
+        """Return a ``fields`` payload keyed by field IDs.
+
+        Use it to build payloads for :meth:`create_issue` or
+        :meth:`update_custom_field` from field names:
+
+        .. code-block:: python
+
+            jira.create_issue(
+                jira.resolve_fields(
+                    {"project": {"key": "TEST"}, "Summary": "New", "Story Points": 3}
+                )
+            )
+
+        :param fields: Field values keyed by field ID or name.
+        :type fields: dict
+        :return: Field values keyed by field ID.
+        :rtype: dict
+        :raises ValueError: If a key names no field or several fields.
+        """
+        return self.field_registry().resolve(fields)
+
+    @memoize
     def get_project_components(self, project_id: str) -> SimpleNamespace | str | None:
         """Return components configured for a Jira project.
 
@@ -532,6 +1480,7 @@ class Jira(AtlassianAPI):
         url = f"/rest/api/2/project/{project_id}/components"
         return self.get(url)
 
+    @memoize
     def user(self, username: str) -> SimpleNamespace | str | None:
         """Return Jira user information by username.
 
@@ -588,6 +1537,7 @@ class Jira(AtlassianAPI):
         url = f"/rest/api/2/project/{project_key}"
         return self.get(url)
 
+    @memoize
     def get_projects(self) -> SimpleNamespace | str | None:
         """Return projects visible to the current user.
 
@@ -640,6 +1590,7 @@ class Jira(AtlassianAPI):
         url = f"/rest/api/2/issue/{issue_key}/watchers"
         return self.get(url)
 
+    @memoize
     def get_versions(self, project_key: str) -> SimpleNamespace | str | None:
         """Return versions configured for a Jira project.
 
@@ -652,6 +1603,7 @@ class Jira(AtlassianAPI):
         url = f"/rest/api/2/project/{project_key}/versions"
         return self.get(url)
 
+    @invalidates("get_versions")
     def create_version(
         self,
         project_key: str,
@@ -687,3 +1639,470 @@ class Jira(AtlassianAPI):
         if release_date is not None:
             payload["releaseDate"] = release_date
         return self.post(url, json=payload)
+
+
+def _bulk_error_message(error: dict) -> str:
+    """Return a readable message for a failed bulk create element.
+
+    :param error: Entry of the ``errors`` list of a bulk create response.
+    :type error: dict
+    :return: Error messages and field errors joined by ``; ``.
+    :rtype: str
+    """
+    details = error.get("elementErrors") or {}
+    messages = list(details.get("errorMessages") or [])
+    messages.extend(
+        f"{field}: {message}"
+        for field, message in (details.get("errors") or {}).items()
+    )
+    return "; ".join(messages)
+
+
+def _merge_edit(target: dict, payload: dict) -> None:
+    """Merge a Jira edit payload into ``target`` in place.
+
+    ``fields`` values replace earlier values and ``update`` operations are
+    appended. Jira rejects a field that appears in both ``fields`` and
+    ``update``, so such a field is expressed as ``set`` and the following
+    operations, applied in order.
+
+    :param target: Merged payload.
+    :type target: dict
+    :param payload: Payload to add.
+    :type payload: dict
+    """
+    fields = target.setdefault("fields", {})
+    update = target.setdefault("update", {})
+    for field, value in payload.get("fields", {}).items():
+        if field in update:
+            update[field].append({"set": value})
+        else:
+            fields[field] = value
+    for field, operations in payload.get("update", {}).items():
+        if field in fields:
+            update[field] = [{"set": fields.pop(field)}]
+        update.setdefault(field, []).extend(operations)
+
+
+class IssueEditBuffer:
+    """Buffer of issue edits that sends one ``PUT`` per issue.
+
+    The buffer offers the issue edit methods of :class:`Jira` with the same
+    arguments. Instead of sending a request, each call merges its payload into
+    the pending edit of the issue. :meth:`flush` sends the merged edits of all
+    issues concurrently with :meth:`Jira.map`. Used as a context manager, the
+    buffer flushes when the block completes and discards the pending edits
+    when it raises. Async clients use ``async with`` or ``await flush()``.
+
+    Create buffers with :meth:`Jira.buffered_edits`. The buffer is thread-safe.
+
+    :param jira: Client used to send the edits.
+    :type jira: Jira
+    :param max_workers: Number of issues updated concurrently. Defaults to the
+        connection pool size.
+    :type max_workers: int, optional
+    """
+
+    def __init__(self, jira: Jira, max_workers: int | None = None) -> None:
+        """Create an empty buffer."""
+        self.jira = jira
+        self.max_workers = max_workers
+        self._pending: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def add(self, issue_key: str, payload: dict) -> None:
+        """Merge an edit payload into the pending edit of an issue.
+
+        :param issue_key: The key of the issue to update.
+        :type issue_key: str
+        :param payload: Jira edit payload with ``fields`` and/or ``update``.
+        :type payload: dict
+        """
+        with self._lock:
+            _merge_edit(self._pending.setdefault(issue_key, {}), payload)
+
+    def update_issue_label(
+        self,
+        issue_key: str,
+        add_labels: list[str] | None = None,
+        remove_labels: list[str] | None = None,
+    ) -> None:
+        """Buffer :meth:`Jira.update_issue_label`."""
+        self.add(issue_key, Jira._label_payload(add_labels, remove_labels))
+
+    def update_issue_component(
+        self,
+        issue_key: str,
+        add_components: list[str] | None = None,
+        remove_components: list[str] | None = None,
+    ) -> None:
+        """Buffer :meth:`Jira.update_issue_component`."""
+        self.add(issue_key, Jira._component_payload(add_components, remove_components))
+
+    def update_issue_description(self, issue_key: str, new_description: str) -> None:
+        """Buffer :meth:`Jira.update_issue_description`."""
+        self.add(issue_key, {"fields": {"description": new_description}})
+
+    def update_field(
+        self,
+        issue_key: str,
+        field_name: str,
+        add: str | None = None,
+        remove: str | None = None,
+    ) -> None:
+        """Buffer :meth:`Jira.update_field`."""
+        self.add(issue_key, Jira._field_payload(field_name, add, remove))
+
+    def update_custom_field(
+        self, issue_key: str, field_id: str, *field_args: object
+    ) -> None:
+        """Buffer :meth:`Jira.update_custom_field`.
+
+        :raises AttributeError: If more than two ``field_args`` are provided.
+        """
+        self.add(issue_key, Jira._custom_field_payload(field_id, *field_args))
+
+    def set_field(self, issue_key: str, field_id: str, value: object) -> None:
+        """Buffer setting a field to ``value``.
+
+        :param issue_key: The key of the issue to update.
+        :type issue_key: str
+        :param field_id: Jira field ID, for example ``priority`` or
+            ``customfield_10002``.
+        :type field_id: str
+        :param value: New field value.
+        :type value: object
+        """
+        self.add(issue_key, {"fields": {field_id: value}})
+
+    def pending(self) -> dict[str, dict]:
+        """Return the merged payloads that :meth:`flush` would send.
+
+        :return: Edit payload per issue key, in first-edit order.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                key: _compact_edit(payload) for key, payload in self._pending.items()
+            }
+
+    def discard(self) -> None:
+        """Drop the pending edits without sending them."""
+        with self._lock:
+            self._pending.clear()
+
+    def flush(self) -> Any:
+        """Send the pending edits, one ``PUT`` per issue, concurrently.
+
+        :return: Decoded API response or ``APIError`` per issue key. Async
+            clients return a coroutine.
+        :rtype: dict
+        """
+        with self._lock:
+            edits = [
+                (key, _compact_edit(payload)) for key, payload in self._pending.items()
+            ]
+            self._pending.clear()
+        keys = [key for key, _ in edits]
+        results = self.jira.map(self.jira._edit_issue, edits, self.max_workers)
+        if inspect.isawaitable(results):
+            return _zip_awaited(keys, results)
+        return dict(zip(keys, results))
+
+    def __len__(self) -> int:
+        """Return the number of issues with pending edits.
+
+        :return: Issue count.
+        :rtype: int
+        """
+        return len(self._pending)
+
+    def __enter__(self) -> IssueEditBuffer:
+        """Return the buffer for ``with`` statement usage."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Flush the edits, or discard them when the block raised."""
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+    async def __aenter__(self) -> IssueEditBuffer:
+        """Return the buffer for ``async with`` statement usage."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Flush the edits, or discard them when the block raised."""
+        if exc_type is None:
+            await self.flush()
+        else:
+            self.discard()
+
+
+class IssueEdit:
+    """Edits of one issue collected into a single ``PUT``.
+
+    The methods mirror the issue edit methods of :class:`Jira` without the
+    ``issue_key`` argument. Create it with :meth:`Jira.edit`; see
+    :class:`IssueEditBuffer` for the flushing rules.
+
+    :param jira: Client used to send the edit.
+    :type jira: Jira
+    :param issue_key: The key of the issue to update.
+    :type issue_key: str
+    """
+
+    def __init__(self, jira: Jira, issue_key: str) -> None:
+        """Create an empty edit."""
+        self.jira = jira
+        self.issue_key = issue_key
+        self.payload: dict = {}
+        self.response: dict | None = None
+
+    def update_issue_label(
+        self,
+        add_labels: list[str] | None = None,
+        remove_labels: list[str] | None = None,
+    ) -> None:
+        """Buffer :meth:`Jira.update_issue_label`."""
+        _merge_edit(self.payload, Jira._label_payload(add_labels, remove_labels))
+
+    def update_issue_component(
+        self,
+        add_components: list[str] | None = None,
+        remove_components: list[str] | None = None,
+    ) -> None:
+        """Buffer :meth:`Jira.update_issue_component`."""
+        _merge_edit(
+            self.payload, Jira._component_payload(add_components, remove_components)
+        )
+
+    def update_issue_description(self, new_description: str) -> None:
+        """Buffer :meth:`Jira.update_issue_description`."""
+        _merge_edit(self.payload, {"fields": {"description": new_description}})
+
+    def update_field(
+        self, field_name: str, add: str | None = None, remove: str | None = None
+    ) -> None:
+        """Buffer :meth:`Jira.update_field`."""
+        _merge_edit(self.payload, Jira._field_payload(field_name, add, remove))
+
+    def update_custom_field(self, field_id: str, *field_args: object) -> None:
+        """Buffer :meth:`Jira.update_custom_field`."""
+        _merge_edit(self.payload, Jira._custom_field_payload(field_id, *field_args))
+
+    def set_field(self, field_id: str, value: object) -> None:
+        """Buffer setting a field to ``value``."""
+        _merge_edit(self.payload, {"fields": {field_id: value}})
+
+    def flush(self) -> Any:
+        """Send the pending edit in one ``PUT``.
+
+        Nothing is sent when no edit is pending.
+
+        :return: Decoded API response, or ``None``. Async clients return a
+            coroutine.
+        :rtype: dict or None
+        :raises APIError: If Jira rejects the edit.
+        """
+        payload, self.payload = _compact_edit(self.payload), {}
+        if not payload:
+            return _ready(None) if inspect.iscoroutinefunction(self.jira.put) else None
+        return self.jira._edit_issue(self.issue_key, payload)
+
+    def __enter__(self) -> IssueEdit:
+        """Return the edit for ``with`` statement usage."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Send the edit, or discard it when the block raised."""
+        if exc_type is None:
+            self.response = self.flush()
+        else:
+            self.payload = {}
+
+    async def __aenter__(self) -> IssueEdit:
+        """Return the edit for ``async with`` statement usage."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Send the edit, or discard it when the block raised."""
+        if exc_type is None:
+            self.response = await self.flush()
+        else:
+            self.payload = {}
+
+
+def _jql_string(value: str) -> str:
+    """Return ``value`` as a quoted JQL string literal.
+
+    :param value: Text such as an issue key.
+    :type value: str
+    :return: Double-quoted literal with quotes and backslashes escaped.
+    :rtype: str
+    """
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _plain(value: Any) -> Any:
+    """Return decoded JSON as plain dictionaries and lists.
+
+    :param value: Response in any ``response_format``.
+    :type value: object
+    :return: The same data without namespaces; an empty list for a body
+        that is not JSON.
+    :rtype: object
+    """
+    if isinstance(value, bytes):
+        try:
+            value = jsonlib.loads(value)
+        except ValueError:
+            return []
+    elif isinstance(value, str) or value is None:
+        return []
+    return _unwrap(value)
+
+
+def _unwrap(value: Any) -> Any:
+    """Convert namespaces nested in decoded JSON to dictionaries."""
+    if isinstance(value, SimpleNamespace):
+        return {key: _unwrap(item) for key, item in vars(value).items()}
+    if isinstance(value, LazyNamespace):
+        return value._asdict()
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    return value
+
+
+def _compact_edit(payload: dict) -> dict:
+    """Return a copy of a merged payload without empty sections."""
+    return {key: dict(value) for key, value in payload.items() if value}
+
+
+async def _ready(value: Any) -> Any:
+    """Return ``value`` from a coroutine for async callers."""
+    return value
+
+
+async def _zip_awaited(keys: list[str], results: Awaitable[list]) -> dict:
+    """Await batch results and key them by issue."""
+    return dict(zip(keys, await results))
+
+
+class FieldRegistry:
+    """Jira field metadata indexed by field ID and by name.
+
+    Built from the response of ``/rest/api/2/field`` by
+    :meth:`Jira.field_registry`. Lookups are dictionary lookups; names are
+    matched case-insensitively. Several custom fields may share a name, in
+    which case the name cannot be resolved and the ID must be used.
+
+    :param fields: Field metadata with at least ``id`` and ``name``.
+    :type fields: Iterable[dict]
+    """
+
+    def __init__(self, fields: Iterable[dict]) -> None:
+        """Index the field metadata."""
+        self.fields: dict[str, dict] = {}
+        self._ids_by_name: dict[str, list[str]] = {}
+        for field in fields:
+            self.fields[field["id"]] = field
+            name = str(field.get("name", "")).casefold()
+            self._ids_by_name.setdefault(name, []).append(field["id"])
+
+    def field_id(self, name: str) -> str:
+        """Return the ID of a field given its ID or name.
+
+        :param name: Field ID or name.
+        :type name: str
+        :return: Field ID.
+        :rtype: str
+        :raises ValueError: If no field or several fields have this name.
+        """
+        if name in self.fields:
+            return name
+        ids = self._ids_by_name.get(name.casefold())
+        if not ids:
+            raise ValueError(f"Unknown Jira field: {name!r}")
+        if len(ids) > 1:
+            raise ValueError(f"Jira field name {name!r} is ambiguous: {', '.join(ids)}")
+        return ids[0]
+
+    def get(self, name: str) -> dict | None:
+        """Return the metadata of a field given its ID or name.
+
+        :param name: Field ID or name.
+        :type name: str
+        :return: Field metadata, or ``None`` if the name does not resolve.
+        :rtype: dict or None
+        """
+        try:
+            return self.fields[self.field_id(name)]
+        except ValueError:
+            return None
+
+    def resolve(self, fields: dict) -> dict:
+        """Return a ``fields`` payload keyed by field IDs.
+
+        :param fields: Field values keyed by field ID or name.
+        :type fields: dict
+        :return: Field values keyed by field ID.
+        :rtype: dict
+        :raises ValueError: If a key names no field or several fields.
+        """
+        return {self.field_id(name): value for name, value in fields.items()}
+
+    def search_fields(self, fields: Iterable[str]) -> list[str]:
+        """Resolve the ``fields`` argument of a JQL search.
+
+        Entries that do not resolve, such as ``*all`` or fields hidden from
+        the current user, are passed on unchanged. A ``-`` prefix, which
+        excludes a field, is kept.
+
+        :param fields: Field IDs or names.
+        :type fields: Iterable[str]
+        :return: Field IDs.
+        :rtype: list[str]
+        """
+        resolved = []
+        for field in fields:
+            prefix, name = ("-", field[1:]) if field.startswith("-") else ("", field)
+            try:
+                resolved.append(prefix + self.field_id(name))
+            except ValueError:
+                resolved.append(field)
+        return resolved
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether ``name`` is a field ID or resolves to one."""
+        return isinstance(name, str) and self.get(name) is not None
+
+    def __len__(self) -> int:
+        """Return the number of fields.
+
+        :return: Field count.
+        :rtype: int
+        """
+        return len(self.fields)
@@ -0,0 +1,149 @@
+"""JSON encoding and decoding with an optional fast backend.
+
+``AtlassianAPI`` serializes ``json=`` payloads and parses ``GET`` responses
+through this module. When `orjson <https://pypi.org/project/orjson/>`_ or
+`ujson <https://pypi.org/project/ujson/>`_ is installed it is used
+automatically, otherwise the standard library ``json`` module is used. Install
+the ``fast`` extra to get ``orjson``:
+
+.. code-block:: bash
+
+    pip install "atlassian-api-py[fast]"
+
+Decoding with an ``object_hook`` (the default ``namespace`` response format)
+always uses the standard library: building ``SimpleNamespace`` objects after a
+fast decode is slower than letting ``json`` call the hook while parsing.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import math
+from typing import Any, Callable
+
+BACKENDS = ("orjson", "ujson", "json")
+
+BACKEND = "json"
+
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[str | bytes], Any]
+
+
+def _std_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` with the standard library like ``requests`` does.
+
+    :param obj: JSON-serializable object.
+    :type obj: object
+    :return: UTF-8 encoded JSON.
+    :rtype: bytes
+    """
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+def _is_plain(obj: Any) -> bool:
+    """Return whether every backend encodes ``obj`` like the standard library.
+
+    Only ``dict`` with string keys, ``list``, ``tuple``, ``str``, ``int``,
+    ``bool``, ``None``, and finite ``float`` values qualify. Fast backends
+    encode other values differently, for example ``NaN`` as ``null`` or
+    ``datetime`` as a string, where the standard library raises.
+
+    :param obj: Value to check.
+    :type obj: object
+    :return: ``True`` if ``obj`` contains only plain JSON values.
+    :rtype: bool
+    """
+    kind = type(obj)
+    if kind is str or kind is int or kind is bool or obj is None:
+        return True
+    if kind is float:
+        return math.isfinite(obj)
+    if kind is dict:
+        return all(type(k) is str and _is_plain(v) for k, v in obj.items())
+    if kind is list or kind is tuple:
+        return all(_is_plain(v) for v in obj)
+    return False
+
+
+def use_backend(name: str | None = None) -> str:
+    """Select the JSON backend.
+
+    :param name: ``orjson``, ``ujson``, or ``json``. When omitted, the first
+        installed backend of :data:`BACKENDS` is used.
+    :type name: str, optional
+    :return: Name of the selected backend.
+    :rtype: str
+    :raises ValueError: If ``name`` is not a supported backend.
+    :raises ImportError: If the requested backend is not installed.
+    """
+    global BACKEND, _dumps, _loads
+    if name is None:
+        for candidate in BACKENDS[:-1]:
+            try:
+                return use_backend(candidate)
+            except ImportError:
+                continue
+        name = "json"
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unsupported JSON backend {name!r}; expected one of {', '.join(BACKENDS)}"
+        )
+    if name == "json":
+        _dumps, _loads = _std_dumps, json.loads
+    else:
+        module = importlib.import_module(name)
+        if name == "orjson":
+            _dumps = module.dumps
+        else:
+
+            def _encoded_dumps(obj: Any) -> bytes:
+                return module.dumps(obj).encode("utf-8")
+
+            _dumps = _encoded_dumps
+        _loads = module.loads
+    BACKEND = name
+    return name
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as JSON.
+
+    Objects that are not plain JSON values, such as dictionaries with
+    non-string keys, ``NaN``, or ``datetime`` values, are encoded with the
+    standard library instead, so the result and the errors raised do not
+    depend on the installed backend.
+
+    :param obj: JSON-serializable object.
+    :type obj: object
+    :return: UTF-8 encoded JSON.
+    :rtype: bytes
+    :raises TypeError: If ``obj`` is not JSON serializable.
+    :raises ValueError: If ``obj`` contains ``NaN`` or infinite floats.
+    """
+    if _dumps is _std_dumps or not _is_plain(obj):
+        return _std_dumps(obj)
+    try:
+        return _dumps(obj)
+    except (TypeError, OverflowError):
+        return _std_dumps(obj)
+
+
+def loads(s: str | bytes, object_hook: Callable[[dict], Any] | None = None) -> Any:
+    """Decode a JSON document.
+
+    :param s: JSON document.
+    :type s: str or bytes
+    :param object_hook: Called with every decoded object, as in
+        ``json.loads``. Decoding with a hook uses the standard library.
+    :type object_hook: callable, optional
+    :return: Decoded value.
+    :rtype: object
+    :raises ValueError: If ``s`` is not valid JSON.
+    """
+    if object_hook is not None:
+        return json.loads(s, object_hook=object_hook)
+    return _loads(s)
+
+
+use_backend()
@@ -0,0 +1,152 @@
+"""Lazy, read-only attribute views over decoded JSON.
+
+``AtlassianAPI.get()`` builds a ``SimpleNamespace`` for every JSON object in a
+response by default. Scripts usually read only a handful of fields, so for
+large responses most of those objects are never used. ``LazyNamespace`` wraps
+the decoded dictionary instead and creates child views only when an attribute
+is read, keeping the familiar dot notation:
+
+.. code-block:: python
+
+    pr = bitbucket.get(path, response_format="lazy")
+    print(pr.toRef.displayId)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class LazyNamespace:
+    """Read-only attribute view over a decoded JSON object.
+
+    Nested objects are wrapped on first access and cached. Lists are returned
+    as plain lists whose object items are wrapped, so indexing, iteration,
+    slicing, and ``len()`` behave as with ``SimpleNamespace`` responses.
+
+    :param data: Decoded JSON object.
+    :type data: dict
+    """
+
+    __slots__ = ("_data", "_cache")
+
+    def __init__(self, data: dict) -> None:
+        """Wrap a decoded JSON object."""
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_cache", {})
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the wrapped value of a JSON key.
+
+        :param name: JSON key.
+        :type name: str
+        :return: Child view, list, or scalar value.
+        :rtype: object
+        :raises AttributeError: If the key does not exist.
+        """
+        if name in self.__slots__ or (name.startswith("__") and name.endswith("__")):
+            # Slots are unset on instances created without __init__, for
+            # example by copy and pickle; looking them up would recurse.
+            raise AttributeError(name)
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        try:
+            value = self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        if isinstance(value, (dict, list)):
+            value = wrap(value)
+            cache[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject attribute assignment.
+
+        :raises AttributeError: Always; views are read-only.
+        """
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion.
+
+        :raises AttributeError: Always; views are read-only.
+        """
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    @property
+    def __dict__(self) -> dict:  # type: ignore[override]
+        """Return the wrapped top-level values, like ``vars()`` on a namespace.
+
+        :return: Mapping of JSON keys to wrapped values.
+        :rtype: dict
+        """
+        return {key: getattr(self, key) for key in self._data}
+
+    def __dir__(self) -> list[str]:
+        """Return the JSON keys of the object.
+
+        :return: Attribute names.
+        :rtype: list[str]
+        """
+        return list(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the underlying JSON with another view.
+
+        Views never compare equal to ``SimpleNamespace`` objects.
+
+        :param other: Object to compare with.
+        :type other: object
+        :return: ``True`` when both views hold the same data.
+        :rtype: bool
+        """
+        if isinstance(other, LazyNamespace):
+            return self._data == other._data
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple:
+        """Rebuild the view from its data when copied or pickled.
+
+        :return: Constructor and arguments for ``copy`` and ``pickle``.
+        :rtype: tuple
+        """
+        return type(self), (self._data,)
+
+    def __repr__(self) -> str:
+        """Return a ``SimpleNamespace``-style representation.
+
+        :return: Representation listing the top-level keys and values.
+        :rtype: str
+        """
+        items = ", ".join(f"{key}={value!r}" for key, value in self._data.items())
+        return f"{type(self).__name__}({items})"
+
+    def _asdict(self) -> dict:
+        """Return the underlying decoded JSON object.
+
+        :return: The wrapped dictionary. It is shared with the view; do not
+            modify it.
+        :rtype: dict
+        """
+        return self._data
+
+
+def wrap(value: Any) -> Any:
+    """Wrap decoded JSON for lazy attribute access.
+
+    :param value: Decoded JSON value.
+    :type value: object
+    :return: ``LazyNamespace`` for objects, a list of wrapped items for
+        arrays, or the value itself for scalars.
+    :rtype: object
+    """
+    if isinstance(value, dict):
+        return LazyNamespace(value)
+    if isinstance(value, list):
+        return [
+            wrap(item) if isinstance(item, (dict, list)) else item for item in value
+        ]
+    return value
@@ -0,0 +1,355 @@
+"""Local SQLite mirror of Jira issues.
+
+``JiraMirror`` copies the issues of a JQL query into a SQLite database and
+keeps them up to date with :class:`atlassian.sync.JiraSync`, so reports that
+filter by project, status, assignee, label, or update time run locally
+instead of sending JQL to the server. Each issue is stored as JSON next to
+indexed columns for those filters.
+
+Example:
+
+.. code-block:: python
+
+    from atlassian import Jira
+
+    jira = Jira(url="https://jira.company.com", token="token")
+    mirror = jira.mirror("~/jira.sqlite3", "project in (PROJ, OPS)")
+    mirror.refresh()
+    for issue in mirror.issues(project="PROJ", status="In Progress", label="urgent"):
+        print(issue["key"], issue["fields"]["summary"])
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterator
+
+from atlassian.sync import JiraSync, parse_jira_time
+
+if TYPE_CHECKING:
+    from atlassian.jira import Jira
+
+#: Fields the mirror needs for its indexed columns.
+MIRROR_FIELDS = ("project", "issuetype", "status", "assignee", "labels", "updated")
+
+
+class _MirrorSync(JiraSync):
+    """``JiraSync`` that keeps its state in the mirror database."""
+
+    def __init__(self, mirror: JiraMirror, *args: Any, **kwargs: Any) -> None:
+        """Create a sync whose state is stored by ``mirror``."""
+        self.mirror = mirror
+        super().__init__(*args, **kwargs)
+
+    def _read_state(self) -> dict | None:
+        """Return the state stored in the ``sync_state`` table."""
+        row = (
+            self.mirror._connect()
+            .execute("SELECT state FROM sync_state WHERE id = 1")
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    def _write_state(self, state: dict | None) -> None:
+        """Store the state in the ``sync_state`` table."""
+        db = self.mirror._connect()
+        if state is None:
+            db.execute("DELETE FROM sync_state")
+        else:
+            db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (1, ?)", (json.dumps(state),)
+            )
+
+
+class JiraMirror:
+    """Issues of a JQL query stored in a local SQLite database.
+
+    :meth:`refresh` fetches the issues changed since the previous refresh and
+    stores them in one transaction, together with the sync mark, so an
+    interrupted refresh leaves the previous copy intact. Incremental
+    refreshes cannot see issues that were deleted or no longer match the
+    query; ``refresh(full=True)`` downloads the query again and removes them.
+
+    Reads use one connection per thread and the database uses write-ahead
+    logging, so reports may query the mirror while it is refreshed. Create
+    mirrors with :meth:`atlassian.jira.Jira.mirror`. Use a synchronous client.
+
+    :param jira: Client used to fetch issues.
+    :type jira: Jira
+    :param path: Database file. Created when missing.
+    :type path: str or os.PathLike
+    :param jql: JQL query of the mirrored issues.
+    :type jql: str
+    :param fields: Field IDs or names to store. The fields of the indexed
+        columns are always stored. Defaults to all fields.
+    :type fields: list[str], optional
+    :param timeout: Seconds to wait for a lock held by another connection.
+    :type timeout: float, optional
+    :param sync_options: Further :class:`atlassian.sync.JiraSync` arguments,
+        such as ``overlap``, ``page_size``, or ``time_zone``.
+    """
+
+    def __init__(
+        self,
+        jira: Jira,
+        path: str | os.PathLike,
+        jql: str,
+        fields: list[str] | None = None,
+        timeout: float = 30,
+        **sync_options: Any,
+    ) -> None:
+        """Open or create the database."""
+        self.path = os.path.expanduser(os.fspath(path))
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS issues ("
+                "id TEXT PRIMARY KEY, key TEXT NOT NULL UNIQUE, project TEXT, "
+                "issuetype TEXT, status TEXT, assignee TEXT, updated TEXT, "
+                "data TEXT NOT NULL)"
+            )
+            for column in ("project", "status", "assignee", "updated"):
+                db.execute(
+                    f"CREATE INDEX IF NOT EXISTS issues_{column} ON issues ({column})"
+                )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS labels ("
+                "issue_id TEXT NOT NULL REFERENCES issues (id) ON DELETE CASCADE, "
+                "label TEXT NOT NULL, PRIMARY KEY (issue_id, label))"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS labels_label ON labels (label)")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "id INTEGER PRIMARY KEY, state TEXT NOT NULL)"
+            )
+        if fields is not None:
+            fields = [*fields, *(f for f in MIRROR_FIELDS if f not in fields)]
+        self.sync = _MirrorSync(self, jira, jql, fields=fields, **sync_options)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current thread and process.
+
+        :return: Open connection in autocommit mode.
+        :rtype: sqlite3.Connection
+        """
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA foreign_keys=ON")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def refresh(self, full: bool = False) -> int:
+        """Store the issues changed since the previous refresh.
+
+        :param full: Download every issue of the query and delete stored
+            issues that no longer match it.
+        :type full: bool, optional
+        :return: Number of issues stored.
+        :rtype: int
+        """
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            if full:
+                self.sync.reset()
+                db.execute("CREATE TEMP TABLE IF NOT EXISTS fetched (id TEXT)")
+                db.execute("DELETE FROM fetched")
+            count = 0
+            for issue in self.sync.issues():
+                self._store(db, issue)
+                if full:
+                    db.execute("INSERT INTO fetched VALUES (?)", (issue["id"],))
+                count += 1
+            if full:
+                db.execute(
+                    "DELETE FROM issues WHERE id NOT IN (SELECT id FROM fetched)"
+                )
+                db.execute("DROP TABLE fetched")
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            self.sync.watermark, self.sync.seen = None, {}
+            self.sync.load()
+            raise
+        return count
+
+    @staticmethod
+    def _store(db: sqlite3.Connection, issue: dict) -> None:
+        """Insert or replace one issue and its labels.
+
+        :param db: Connection inside a transaction.
+        :type db: sqlite3.Connection
+        :param issue: Issue returned by the search.
+        :type issue: dict
+        """
+        fields = issue.get("fields") or {}
+        assignee = fields.get("assignee") or {}
+        db.execute("DELETE FROM labels WHERE issue_id = ?", (issue["id"],))
+        db.execute(
+            "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                issue["id"],
+                issue["key"],
+                (fields.get("project") or {}).get("key"),
+                (fields.get("issuetype") or {}).get("name"),
+                (fields.get("status") or {}).get("name"),
+                assignee.get("name") or assignee.get("accountId"),
+                _utc(fields["updated"]),
+                json.dumps(issue),
+            ),
+        )
+        db.executemany(
+            "INSERT OR IGNORE INTO labels VALUES (?, ?)",
+            [(issue["id"], label) for label in fields.get("labels") or []],
+        )
+
+    def issues(
+        self,
+        project: str | None = None,
+        status: str | None = None,
+        assignee: str | None = None,
+        label: str | None = None,
+        issuetype: str | None = None,
+        updated_since: datetime | str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield stored issues matching all given filters.
+
+        Issues are yielded most recently updated first.
+
+        :param project: Project key.
+        :type project: str, optional
+        :param status: Status name.
+        :type status: str, optional
+        :param assignee: Assignee user name, or account ID on Jira Cloud.
+        :type assignee: str, optional
+        :param label: Label the issue carries.
+        :type label: str, optional
+        :param issuetype: Issue type name.
+        :type issuetype: str, optional
+        :param updated_since: Only issues updated at or after this time. Naive
+            datetimes are taken as UTC; strings use the Jira timestamp format.
+        :type updated_since: datetime or str, optional
+        :param limit: Maximum number of issues.
+        :type limit: int, optional
+        :return: Iterator over issues as returned by the search.
+        :rtype: Iterator[dict]
+        """
+        where, params = self._filters(
+            project, status, assignee, label, issuetype, updated_since
+        )
+        sql = f"SELECT data FROM issues{where} ORDER BY updated DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for (data,) in self._connect().execute(sql, params):
+            yield json.loads(data)
+
+    def count(
+        self,
+        project: str | None = None,
+        status: str | None = None,
+        assignee: str | None = None,
+        label: str | None = None,
+        issuetype: str | None = None,
+        updated_since: datetime | str | None = None,
+    ) -> int:
+        """Return the number of stored issues matching all given filters.
+
+        The filters are those of :meth:`issues`.
+
+        :return: Issue count.
+        :rtype: int
+        """
+        where, params = self._filters(
+            project, status, assignee, label, issuetype, updated_since
+        )
+        row = self._connect().execute(f"SELECT COUNT(*) FROM issues{where}", params)
+        return row.fetchone()[0]
+
+    def issue(self, key: str) -> dict | None:
+        """Return a stored issue by key.
+
+        :param key: Issue key.
+        :type key: str
+        :return: Issue, or ``None`` if it is not stored.
+        :rtype: dict or None
+        """
+        row = (
+            self._connect()
+            .execute("SELECT data FROM issues WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    @staticmethod
+    def _filters(
+        project: str | None,
+        status: str | None,
+        assignee: str | None,
+        label: str | None,
+        issuetype: str | None,
+        updated_since: datetime | str | None,
+    ) -> tuple[str, list]:
+        """Build the ``WHERE`` clause of a query.
+
+        :return: Clause, empty without filters, and its parameters.
+        :rtype: tuple[str, list]
+        """
+        conditions, params = [], []
+        columns = {
+            "project": project,
+            "status": status,
+            "assignee": assignee,
+            "issuetype": issuetype,
+        }
+        for column, value in columns.items():
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if label is not None:
+            conditions.append("id IN (SELECT issue_id FROM labels WHERE label = ?)")
+            params.append(label)
+        if updated_since is not None:
+            conditions.append("updated >= ?")
+            params.append(_utc(updated_since))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    def close(self) -> None:
+        """Close the connection of the current thread."""
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def __len__(self) -> int:
+        """Return the number of stored issues.
+
+        :return: Issue count.
+        :rtype: int
+        """
+        return self.count()
+
+
+def _utc(value: datetime | str) -> str:
+    """Return a sortable UTC ISO 8601 form of a time.
+
+    :param value: Datetime, or a Jira timestamp.
+    :type value: datetime or str
+    :return: UTC timestamp such as ``2024-01-02T09:15:30.000000+00:00``.
+    :rtype: str
+    """
+    if isinstance(value, str):
+        value = parse_jira_time(value)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
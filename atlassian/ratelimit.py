@@ -0,0 +1,189 @@
+"""Client-side rate limiting for ``AtlassianAPI.request()``.
+
+``RateLimiter`` keeps a token bucket per client and, optionally, per endpoint
+path prefix. Every request takes one token from the global bucket and from the
+bucket of the longest matching prefix, sleeping when a bucket is empty. One
+limiter can be shared by several clients and threads so that their combined
+traffic stays under the server quota.
+
+Example:
+
+.. code-block:: python
+
+    from atlassian import Bitbucket, Jira
+    from atlassian.ratelimit import RateLimiter
+
+    limiter = RateLimiter(rate=10, burst=20, endpoints={"/rest/api/2/search": 2})
+    jira = Jira(url="https://jira.company.com", token="token", rate_limiter=limiter)
+    jira_bot = Jira(url="https://jira.company.com", token="bot", rate_limiter=limiter)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Mapping, Tuple, Union
+
+EndpointLimit = Union[float, Tuple[float, int]]
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are refilled continuously at ``rate`` per second up to ``burst``.
+    Callers that find the bucket empty reserve a future token and sleep until
+    it becomes available, so waiting threads are served in arrival order.
+
+    :param rate: Tokens added per second.
+    :type rate: float
+    :param burst: Bucket capacity. Defaults to ``max(1, rate)``.
+    :type burst: int, optional
+    :raises ValueError: If ``rate`` or ``burst`` is not positive.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        """Create a full bucket."""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst <= 0:
+            raise ValueError("burst must be positive")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return how long the caller must wait for them.
+
+        The caller is expected to wait for the returned delay before using
+        the tokens. Use :meth:`acquire` to sleep automatically.
+
+        :param tokens: Number of tokens to take.
+        :type tokens: float, optional
+        :return: Delay in seconds until the reserved tokens are available.
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take tokens, sleeping until they are available.
+
+        :param tokens: Number of tokens to take.
+        :type tokens: float, optional
+        :return: Time in seconds spent waiting.
+        :rtype: float
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """Rate limiter consulted by ``AtlassianAPI.request()`` before each request.
+
+    :param rate: Requests per second allowed across all endpoints.
+    :type rate: float
+    :param burst: Number of requests that may be sent back to back before
+        throttling starts. Defaults to ``max(1, rate)``.
+    :type burst: int, optional
+    :param endpoints: Additional limits for endpoint path prefixes, for example
+        ``{"/rest/api/2/search": 2}`` or ``{"/rest/api/2/search": (2, 5)}``
+        to also set the burst.
+    :type endpoints: dict, optional
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        endpoints: Mapping[str, EndpointLimit] | None = None,
+    ) -> None:
+        """Create a rate limiter."""
+        self._bucket = TokenBucket(rate, burst)
+        self._endpoints: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waited_seconds = 0.0
+        for prefix, limit in (endpoints or {}).items():
+            if isinstance(limit, tuple):
+                self.add_endpoint(prefix, limit[0], limit[1])
+            else:
+                self.add_endpoint(prefix, limit)
+
+    def add_endpoint(self, prefix: str, rate: float, burst: int | None = None) -> None:
+        """Add or replace the limit for an endpoint path prefix.
+
+        :param prefix: Path prefix, for example ``/rest/api/2/search``.
+        :type prefix: str
+        :param rate: Requests per second allowed for matching paths.
+        :type rate: float
+        :param burst: Bucket capacity for matching paths.
+        :type burst: int, optional
+        """
+        with self._lock:
+            self._endpoints[prefix] = TokenBucket(rate, burst)
+
+    def _endpoint_bucket(self, path: str) -> TokenBucket | None:
+        """Return the bucket of the longest prefix matching ``path``.
+
+        The prefixes are read under the limiter lock, so endpoints may be added
+        while other threads send requests.
+
+        :param path: Request path.
+        :type path: str
+        :return: Matching bucket, or ``None``.
+        :rtype: TokenBucket or None
+        """
+        match = None
+        with self._lock:
+            for prefix in self._endpoints:
+                if path.startswith(prefix) and (
+                    match is None or len(prefix) > len(match)
+                ):
+                    match = prefix
+            return self._endpoints[match] if match is not None else None
+
+    def reserve(self, path: str = "") -> float:
+        """Reserve a request slot for ``path`` without sleeping.
+
+        Asynchronous clients use this to wait with ``asyncio.sleep()``
+        instead of blocking the event loop.
+
+        :param path: Request path used to select an endpoint limit.
+        :type path: str, optional
+        :return: Delay in seconds before the request may be sent.
+        :rtype: float
+        """
+        delay = self._bucket.reserve()
+        bucket = self._endpoint_bucket(path)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        with self._lock:
+            self.requests += 1
+            self.waited_seconds += delay
+        return delay
+
+    def acquire(self, path: str = "") -> float:
+        """Wait until a request to ``path`` may be sent.
+
+        :param path: Request path used to select an endpoint limit.
+        :type path: str, optional
+        :return: Time in seconds spent waiting.
+        :rtype: float
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,265 @@
+"""Retry policy used by ``AtlassianAPI.request()``.
+
+Atlassian products answer with ``429 Too Many Requests`` when a client exceeds
+its rate limit, and gateways in front of them regularly return ``502``, ``503``
+or ``504`` during deployments. ``RetryPolicy`` decides which of those failures
+are retried, how long to wait before the next attempt, and ``RetryStats``
+records how much time was spent backing off.
+
+Example:
+
+.. code-block:: python
+
+    from atlassian import Jira
+    from atlassian.retry import RetryPolicy
+
+    jira = Jira(
+        url="https://jira.company.com",
+        token="your_token",
+        retry=RetryPolicy(max_attempts=5, backoff_base=1.0),
+    )
+    jira.issue("TEST-1")
+    print(jira.retry_stats.retries, jira.retry_stats.backoff_seconds)
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Mapping
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """Describe when and how failed requests are retried.
+
+    :param max_attempts: Total number of attempts per request, including the
+        first one. ``1`` disables retries.
+    :type max_attempts: int, optional
+    :param backoff_base: Delay in seconds before the first retry. The delay
+        doubles on every following retry.
+    :type backoff_base: float, optional
+    :param backoff_cap: Upper bound in seconds for the computed backoff delay.
+    :type backoff_cap: float, optional
+    :param jitter: Randomize each delay between zero and the computed value
+        ("full jitter") so that concurrent clients do not retry in lockstep.
+    :type jitter: bool, optional
+    :param retry_statuses: HTTP status codes that are retried.
+    :type retry_statuses: collections.abc.Collection[int], optional
+    :param methods: HTTP methods that are retried. Defaults to idempotent
+        methods only, so a ``POST`` that may have been applied is never sent
+        twice.
+    :type methods: collections.abc.Collection[str], optional
+    :param respect_retry_after: Wait for the delay announced in
+        ``Retry-After`` or ``X-RateLimit-Reset`` headers when present.
+    :type respect_retry_after: bool, optional
+    :param max_retry_after: Upper bound in seconds for delays announced by the
+        server. Longer announced delays are not waited for and the error is
+        raised instead.
+    :type max_retry_after: float, optional
+    :param retry_connection_errors: Also retry connection failures and
+        timeouts for the allowed methods.
+    :type retry_connection_errors: bool, optional
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 300.0,
+        retry_connection_errors: bool = True,
+    ) -> None:
+        """Create a retry policy.
+
+        :raises ValueError: If ``max_attempts`` is lower than ``1``.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_connection_errors = retry_connection_errors
+
+    def is_retryable(self, method: str, status_code: int | None, attempt: int) -> bool:
+        """Return whether a failed attempt should be retried.
+
+        :param method: HTTP method of the request.
+        :type method: str
+        :param status_code: Response status code, or ``None`` when the request
+            failed before a response was received.
+        :type status_code: int or None
+        :param attempt: Number of the attempt that just failed, starting at 1.
+        :type attempt: int
+        :return: ``True`` when another attempt is allowed.
+        :rtype: bool
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if method.upper() not in self.methods:
+            return False
+        if status_code is None:
+            return self.retry_connection_errors
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Return the exponential backoff delay after a failed attempt.
+
+        :param attempt: Number of the attempt that just failed, starting at 1.
+        :type attempt: int
+        :return: Delay in seconds.
+        :rtype: float
+        """
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)  # nosec B311 - not used for security
+        return delay
+
+    def server_delay(self, headers: Mapping[str, str]) -> float | None:
+        """Return the delay announced by rate limiting headers, if any.
+
+        ``Retry-After`` may hold a number of seconds or an HTTP date.
+        ``X-RateLimit-Reset`` is only used when ``X-RateLimit-Remaining`` is
+        ``0`` and may hold epoch seconds or an ISO 8601 timestamp.
+
+        :param headers: Response headers.
+        :type headers: collections.abc.Mapping
+        :return: Delay in seconds, or ``None`` when no usable header is found.
+        :rtype: float or None
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            delay = _parse_delay(retry_after, relative_numbers=True)
+            if delay is not None:
+                return delay
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if reset and remaining is not None and remaining.strip() == "0":
+            return _parse_delay(reset, relative_numbers=False)
+        return None
+
+    def wait_time(
+        self, attempt: int, headers: Mapping[str, str] | None = None
+    ) -> float | None:
+        """Return how long to wait before the next attempt.
+
+        :param attempt: Number of the attempt that just failed, starting at 1.
+        :type attempt: int
+        :param headers: Response headers of the failed attempt, if any.
+        :type headers: collections.abc.Mapping, optional
+        :return: Delay in seconds, or ``None`` when the server asks for a
+            longer pause than ``max_retry_after`` allows.
+        :rtype: float or None
+        """
+        if headers is not None and self.respect_retry_after:
+            delay = self.server_delay(headers)
+            if delay is not None:
+                if delay > self.max_retry_after:
+                    return None
+                return delay
+        return self.backoff(attempt)
+
+
+class RetryStats:
+    """Thread-safe counters describing retries performed by a client.
+
+    :ivar retries: Number of retried attempts.
+    :ivar backoff_seconds: Total time spent sleeping between attempts.
+    :ivar exhausted: Number of requests that failed after using every attempt.
+    :ivar by_status: Retries per status code; connection errors use ``None``.
+    """
+
+    def __init__(self) -> None:
+        """Create empty counters."""
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.backoff_seconds = 0.0
+        self.exhausted = 0
+        self.by_status: dict[int | None, int] = {}
+
+    def record_retry(self, status_code: int | None, delay: float) -> None:
+        """Count one retry and the delay waited before it.
+
+        :param status_code: Status code that triggered the retry, or ``None``
+            for connection errors.
+        :type status_code: int or None
+        :param delay: Delay in seconds.
+        :type delay: float
+        """
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.by_status[status_code] = self.by_status.get(status_code, 0) + 1
+
+    def record_exhausted(self) -> None:
+        """Count a request that failed after it was retried."""
+        with self._lock:
+            self.exhausted += 1
+
+    def reset(self) -> None:
+        """Reset every counter to zero."""
+        with self._lock:
+            self.retries = 0
+            self.backoff_seconds = 0.0
+            self.exhausted = 0
+            self.by_status = {}
+
+    def __repr__(self) -> str:
+        """Return a compact summary of the counters.
+
+        :return: Counter summary.
+        :rtype: str
+        """
+        return (
+            f"RetryStats(retries={self.retries}, "
+            f"backoff_seconds={self.backoff_seconds:.3f}, "
+            f"exhausted={self.exhausted})"
+        )
+
+
+def _parse_delay(value: str, relative_numbers: bool) -> float | None:
+    """Convert a rate limiting header value into a delay in seconds.
+
+    :param value: Header value.
+    :type value: str
+    :param relative_numbers: Treat plain numbers as seconds from now instead of
+        epoch seconds.
+    :type relative_numbers: bool
+    :return: Non-negative delay, or ``None`` when the value cannot be parsed.
+    :rtype: float or None
+    """
+    value = value.strip()
+    try:
+        number = float(value)
+    except ValueError:
+        pass
+    else:
+        delay = number if relative_numbers else number - time.time()
+        return max(0.0, delay)
+    moment: datetime | None
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        moment = None
+    if moment is None:
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
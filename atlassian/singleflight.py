@@ -0,0 +1,126 @@
+"""Coalescing of identical concurrent requests.
+
+When several threads request the same resource at the same time, for example
+while a burst of webhook events for one issue is processed, ``SingleFlight``
+lets the first caller send the request and hands its response to the callers
+that arrive while it is in flight. Each caller still decodes the response on
+its own, so results are never shared between callers. Requests that start
+after the response arrived are sent again; nothing is cached.
+
+Example:
+
+.. code-block:: python
+
+    from atlassian import Jira
+    from atlassian.singleflight import SingleFlight
+
+    jira = Jira(url="https://jira.company.com", token="token", single_flight=SingleFlight())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Call:
+    """Result of a call that other callers are waiting for."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    The same instance may be shared by several clients and threads. Async
+    clients use :meth:`do_async`, which coalesces calls within an event loop.
+
+    :ivar calls: Number of calls that were executed.
+    :ivar shared: Number of callers that received the outcome of another
+        caller's call instead of executing their own.
+    """
+
+    def __init__(self) -> None:
+        """Create an instance with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[int, Hashable], asyncio.Future] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call ``func``, or wait for the in-flight call with the same key.
+
+        :param key: Identifies identical calls.
+        :type key: Hashable
+        :param func: Function that performs the call.
+        :type func: callable
+        :return: The result of the call.
+        :rtype: object
+        :raises Exception: Whatever the executed call raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        assert call is not None
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable]) -> Any:
+        """Await ``func()``, or the in-flight call with the same key.
+
+        :param key: Identifies identical calls.
+        :type key: Hashable
+        :param func: Coroutine function that performs the call.
+        :type func: callable
+        :return: The result of the call.
+        :rtype: object
+        :raises Exception: Whatever the executed call raised.
+        """
+        scoped = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            future = self._tasks.get(scoped)
+            if future is None:
+                future = self._tasks[scoped] = asyncio.ensure_future(func())
+                future.add_done_callback(lambda _: self._forget(scoped))
+                self.calls += 1
+            else:
+                self.shared += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, scoped: tuple[int, Hashable]) -> None:
+        """Drop a finished async call."""
+        with self._lock:
+            self._tasks.pop(scoped, None)
+
+    def __repr__(self) -> str:
+        """Return a compact summary of the counters.
+
+        :return: Counter summary.
+        :rtype: str
+        """
+        return f"{type(self).__name__}(calls={self.calls}, shared={self.shared})"
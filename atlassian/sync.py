@@ -0,0 +1,296 @@
+"""Incremental synchronization of Jira issues.
+
+``JiraSync`` returns the issues matching a JQL query that were created or
+updated since its previous run. The greatest ``updated`` timestamp seen is
+kept as a high-water mark, optionally in a JSON state file, and the next run
+only searches ``updated >= mark``. Because JQL compares dates with minute
+precision, every run re-reads a short overlap before the mark; issues already
+returned with the same ``updated`` value are skipped, so each change is
+returned once.
+
+Example:
+
+.. code-block:: python
+
+    from atlassian import Jira
+
+    jira = Jira(url="https://jira.company.com", token="token")
+    sync = jira.sync("project = PROJ", state_path="proj.sync.json")
+    for issue in sync.issues():
+        store(issue)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Iterator
+
+from atlassian.logger import get_logger
+
+if TYPE_CHECKING:
+    from atlassian.jira import Jira
+
+logger = get_logger(__name__)
+
+_ORDER_BY = re.compile(r"\s+order\s+by\s+.*$", re.IGNORECASE | re.DOTALL)
+
+
+def parse_jira_time(value: str) -> datetime:
+    """Parse a Jira timestamp such as ``2024-01-02T10:15:30.000+0100``.
+
+    :param value: Timestamp from an issue field such as ``updated``.
+    :type value: str
+    :return: Timezone-aware datetime.
+    :rtype: datetime
+    """
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+class JiraSync:
+    """Issues of a JQL query that changed since the previous run.
+
+    Pages are requested in ``updated`` order. Instead of paging with growing
+    offsets, which skips issues when others are updated during the run, each
+    page searches from the ``updated`` minute of the last issue received.
+
+    The state is saved to ``state_path`` when :meth:`issues` is exhausted, so
+    an interrupted run is repeated from the previous mark. Call :meth:`save`
+    to keep the progress of a partly consumed run. The state is discarded
+    when it was saved for a different JQL query.
+
+    Create instances with :meth:`atlassian.jira.Jira.sync`. Use a
+    synchronous client.
+
+    :param jira: Client used to search.
+    :type jira: Jira
+    :param jql: JQL query without ``ORDER BY``; an ``ORDER BY`` clause is
+        removed.
+    :type jql: str
+    :param state_path: JSON file that keeps the mark between runs. Without a
+        path the mark is kept in memory for the lifetime of the instance.
+    :type state_path: str, optional
+    :param fields: Field IDs or names to return. ``updated`` is always
+        requested. Defaults to all fields.
+    :type fields: list[str], optional
+    :param overlap: Seconds re-read before the mark, to cover changes
+        committed out of order and clock differences between Jira nodes.
+    :type overlap: float, optional
+    :param page_size: Issues requested per search.
+    :type page_size: int, optional
+    :param time_zone: IANA time zone of the Jira user, used to write dates in
+        JQL. Defaults to the ``timeZone`` of ``/rest/api/2/myself``.
+    :type time_zone: str, optional
+    """
+
+    def __init__(
+        self,
+        jira: Jira,
+        jql: str,
+        state_path: str | os.PathLike | None = None,
+        fields: list[str] | None = None,
+        overlap: float = 60,
+        page_size: int = 100,
+        time_zone: str | None = None,
+    ) -> None:
+        """Create a sync and load its saved state."""
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.jira = jira
+        self.jql = _ORDER_BY.sub("", jql.strip())
+        self.state_path = (
+            os.path.expanduser(state_path) if state_path is not None else None
+        )
+        self.fields = fields
+        self.overlap = timedelta(seconds=overlap)
+        self.page_size = page_size
+        self.time_zone = time_zone
+        self._tz: tzinfo | None = None
+        self.watermark: str | None = None
+        self.seen: dict[str, str] = {}
+        self.load()
+
+    def issues(self) -> Iterator[dict]:
+        """Yield the issues created or updated since the previous run.
+
+        Every issue version is yielded once, oldest change first. The mark
+        advances while the issues are consumed and is saved when the
+        iterator is exhausted.
+
+        :return: Iterator over changed issues.
+        :rtype: Iterator[dict]
+        """
+        fields = self.jira._search_fields(self.fields)
+        if fields is not None and "updated" not in fields:
+            fields = [*fields, "updated"]
+        start = None
+        if self.watermark is not None:
+            start = parse_jira_time(self.watermark) - self.overlap
+        cursor, offset = self._minute(start), 0
+        while True:
+            response = self.jira._search_page(
+                self._page_jql(cursor), offset, self.page_size, fields
+            )
+            issues = response.get("issues") or []
+            for issue in issues:
+                if self._accept(issue):
+                    yield issue
+            if len(issues) < self.page_size or offset + len(issues) >= response.get(
+                "total", 0
+            ):
+                break
+            last = self._minute(parse_jira_time(issues[-1]["fields"]["updated"]))
+            if cursor is not None and last is not None and last <= cursor:
+                offset += len(issues)
+            else:
+                cursor, offset = last, 0
+        self.save()
+
+    def _accept(self, issue: dict) -> bool:
+        """Record an issue and return whether it is a new change.
+
+        :param issue: Issue with the ``updated`` field.
+        :type issue: dict
+        :return: ``False`` if this version of the issue was returned before.
+        :rtype: bool
+        """
+        updated = issue["fields"]["updated"]
+        if self.seen.get(issue["id"]) == updated:
+            return False
+        self.seen[issue["id"]] = updated
+        if self.watermark is None or parse_jira_time(updated) > parse_jira_time(
+            self.watermark
+        ):
+            self.watermark = updated
+        return True
+
+    def _page_jql(self, cursor: datetime | None) -> str:
+        """Return the JQL of a page starting at ``cursor``.
+
+        :param cursor: First ``updated`` minute, or ``None`` for all issues.
+        :type cursor: datetime or None
+        :return: JQL query.
+        :rtype: str
+        """
+        clauses = [f"({self.jql})"] if self.jql else []
+        if cursor is not None:
+            local = cursor.astimezone(self._user_time_zone())
+            clauses.append(f'updated >= "{local:%Y/%m/%d %H:%M}"')
+        return " AND ".join(clauses) + " ORDER BY updated ASC"
+
+    def _user_time_zone(self) -> tzinfo:
+        """Return the time zone Jira uses for dates in JQL.
+
+        :return: Time zone of the Jira user, or UTC if it is unknown.
+        :rtype: tzinfo
+        """
+        if self._tz is None:
+            name = self.time_zone
+            if name is None:
+                myself = self.jira.get("/rest/api/2/myself", response_format="dict")
+                name = (myself or {}).get("timeZone")
+            self._tz = _time_zone(name)
+        return self._tz
+
+    @staticmethod
+    def _minute(value: datetime | None) -> datetime | None:
+        """Round a time down to the minute, the precision of JQL dates."""
+        if value is None:
+            return None
+        return value.replace(second=0, microsecond=0)
+
+    def load(self) -> None:
+        """Load the mark saved by a previous run, if any."""
+        state = self._read_state()
+        if state is None:
+            return
+        if state.get("jql") != self.jql:
+            logger.debug(f"Ignoring sync state of another query: {self.jql!r}")
+            return
+        self.watermark = state.get("watermark")
+        self.seen = dict(state.get("seen") or {})
+
+    def save(self) -> None:
+        """Save the mark for the next run.
+
+        Only issues updated within the overlap before the mark are kept for
+        de-duplication.
+        """
+        if self.watermark is not None:
+            oldest = parse_jira_time(self.watermark) - self.overlap
+            oldest -= timedelta(minutes=1)
+            self.seen = {
+                issue_id: updated
+                for issue_id, updated in self.seen.items()
+                if parse_jira_time(updated) >= oldest
+            }
+        self._write_state(
+            {"jql": self.jql, "watermark": self.watermark, "seen": self.seen}
+        )
+
+    def reset(self) -> None:
+        """Forget the mark so that the next run returns every issue."""
+        self.watermark = None
+        self.seen = {}
+        self._write_state(None)
+
+    def _read_state(self) -> dict | None:
+        """Return the saved state, or ``None`` if there is none.
+
+        Subclasses override this and :meth:`_write_state` to keep the state
+        elsewhere than in ``state_path``.
+
+        :return: State with ``jql``, ``watermark``, and ``seen``.
+        :rtype: dict or None
+        """
+        if self.state_path is None or not os.path.exists(self.state_path):
+            return None
+        with open(self.state_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_state(self, state: dict | None) -> None:
+        """Save the state, or delete it when ``state`` is ``None``.
+
+        The state file is replaced atomically.
+
+        :param state: State with ``jql``, ``watermark``, and ``seen``.
+        :type state: dict or None
+        """
+        if self.state_path is None:
+            return
+        if state is None:
+            if os.path.exists(self.state_path):
+                os.remove(self.state_path)
+            return
+        temporary = f"{self.state_path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temporary, self.state_path)
+
+    def __repr__(self) -> str:
+        """Return the query and mark of the sync.
+
+        :return: Sync summary.
+        :rtype: str
+        """
+        return f"{type(self).__name__}(jql={self.jql!r}, watermark={self.watermark!r})"
+
+
+def _time_zone(name: str | None) -> tzinfo:
+    """Return the time zone with an IANA name, or UTC if it is unknown.
+
+    :param name: IANA time zone name such as ``Europe/Berlin``.
+    :type name: str or None
+    :return: Time zone.
+    :rtype: tzinfo
+    """
+    if name:
+        try:
+            from zoneinfo import ZoneInfo
+
+            return ZoneInfo(name)
+        except (ImportError, KeyError, ValueError):
+            logger.debug(f"Unknown time zone {name!r}, writing JQL dates in UTC")
+    return timezone.utc
@@ -0,0 +1,176 @@
+"""Compare JSON backends on representative Jira and Bitbucket payloads.
+
+Run from the repository root with the package installed (``pip install -e .``):
+
+.. code-block:: bash
+
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --items 2000 --repeat 10
+
+Each installed backend of :mod:`atlassian.jsonlib` decodes a Jira search page
+and a Bitbucket pull request activity page in every ``response_format`` that
+parses JSON, and encodes a Jira bulk create payload. The best time of
+``--repeat`` runs is reported in milliseconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import timeit
+from types import SimpleNamespace
+
+from atlassian import jsonlib
+from atlassian.lazy import wrap
+
+
+def jira_search_page(items: int) -> dict:
+    """Return a ``/rest/api/2/search`` response with ``items`` issues."""
+    return {
+        "startAt": 0,
+        "maxResults": items,
+        "total": items,
+        "issues": [
+            {
+                "id": str(10000 + i),
+                "key": f"PROJ-{i}",
+                "self": f"https://jira.company.com/rest/api/2/issue/{10000 + i}",
+                "fields": {
+                    "summary": f"Issue {i} summary with some descriptive text",
+                    "description": "Steps to reproduce:\n" + "lorem ipsum " * 40,
+                    "status": {
+                        "id": "3",
+                        "name": "In Progress",
+                        "statusCategory": {"id": 4, "key": "indeterminate"},
+                    },
+                    "issuetype": {"id": "1", "name": "Bug", "subtask": False},
+                    "priority": {"id": "2", "name": "High"},
+                    "assignee": {
+                        "name": f"user{i % 20}",
+                        "displayName": f"User {i % 20}",
+                        "emailAddress": f"user{i % 20}@company.com",
+                        "active": True,
+                    },
+                    "labels": ["backend", "regression"],
+                    "components": [{"id": "100", "name": "API"}],
+                    "fixVersions": [{"id": "200", "name": "1.2.0"}],
+                    "customfield_10002": 3.0,
+                    "created": "2024-01-01T10:00:00.000+0000",
+                    "updated": "2024-02-01T10:00:00.000+0000",
+                },
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def bitbucket_activity_page(items: int) -> dict:
+    """Return a pull request ``activities`` page with ``items`` comments."""
+    return {
+        "size": items,
+        "limit": items,
+        "isLastPage": True,
+        "start": 0,
+        "values": [
+            {
+                "id": 500 + i,
+                "createdDate": 1700000000000 + i,
+                "user": {"name": f"user{i % 10}", "slug": f"user{i % 10}", "id": i},
+                "action": "COMMENTED",
+                "commentAction": "ADDED",
+                "comment": {
+                    "id": 900 + i,
+                    "version": i % 3,
+                    "text": f"Please fix the handling of case {i} before merging.",
+                    "severity": "NORMAL",
+                    "state": "OPEN",
+                    "author": {"name": f"user{i % 10}", "emailAddress": "a@b.c"},
+                    "comments": [],
+                    "properties": {"repositoryId": 1},
+                },
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def jira_bulk_payload(items: int) -> dict:
+    """Return a ``/rest/api/2/issue/bulk`` request body with ``items`` issues."""
+    return {
+        "issueUpdates": [
+            {
+                "fields": {
+                    "project": {"key": "PROJ"},
+                    "summary": f"Generated issue {i}",
+                    "description": "Created by a bulk job. " * 10,
+                    "issuetype": {"name": "Task"},
+                    "labels": ["generated"],
+                    "components": [{"name": "API"}],
+                }
+            }
+            for i in range(items)
+        ]
+    }
+
+
+def available_backends() -> list[str]:
+    """Return the installed backends of :mod:`atlassian.jsonlib`."""
+    backends = []
+    for name in jsonlib.BACKENDS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+def best_ms(func, number: int, repeat: int) -> float:
+    """Return the best time of ``repeat`` runs of ``func`` in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print a table of timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500, help="items per payload")
+    parser.add_argument("--number", type=int, default=5, help="calls per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    args = parser.parse_args()
+
+    documents = {
+        "jira search": json.dumps(jira_search_page(args.items)),
+        "bitbucket activities": json.dumps(bitbucket_activity_page(args.items)),
+    }
+    payload = jira_bulk_payload(args.items)
+    formats = {
+        "dict": lambda text: jsonlib.loads(text),
+        "lazy": lambda text: wrap(jsonlib.loads(text)),
+        "namespace": lambda text: jsonlib.loads(
+            text, object_hook=lambda d: SimpleNamespace(**d)
+        ),
+    }
+
+    backend = jsonlib.BACKEND
+    print(f"{'case':<40}" + "".join(f"{name:>12}" for name in available_backends()))
+    try:
+        rows: dict[str, list[float]] = {}
+        for name in available_backends():
+            jsonlib.use_backend(name)
+            for label, text in documents.items():
+                for response_format, decode in formats.items():
+                    rows.setdefault(f"decode {label} ({response_format})", []).append(
+                        best_ms(lambda: decode(text), args.number, args.repeat)
+                    )
+            rows.setdefault("encode jira bulk create", []).append(
+                best_ms(lambda: jsonlib.dumps(payload), args.number, args.repeat)
+            )
+    finally:
+        jsonlib.use_backend(backend)
+    for case, timings in rows.items():
+        print(f"{case:<40}" + "".join(f"{ms:>10.2f}ms" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,735 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from atlassian.aio import (  # noqa: E402
+    AsyncAtlassianAPI,
+    AsyncBitbucket,
+    AsyncConfluence,
+    AsyncJira,
+)
+from atlassian.cache import HTTPCache, TTLCache  # noqa: E402
+from atlassian.error import APIError  # noqa: E402
+from atlassian.retry import RetryPolicy  # noqa: E402
+from atlassian.singleflight import SingleFlight  # noqa: E402
+
+
+def make_client(cls, handler, **kwargs):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return cls(url="https://example.com/", client=client, **kwargs)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncAtlassianAPI:
+    def test_init(self):
+        api = AsyncAtlassianAPI(url="https://example.com/", token="secret")
+        assert api.url == "https://example.com"
+        assert api._client.headers["Authorization"] == "Bearer secret"
+        run(api.close())
+
+    def test_init_basic_auth(self):
+        api = AsyncAtlassianAPI(
+            url="https://example.com", username="user", password="pass"
+        )
+        assert api._client.auth is not None
+        run(api.close())
+
+    def test_sync_with_rejected(self):
+        api = AsyncAtlassianAPI(url="https://example.com")
+        with pytest.raises(TypeError):
+            with api:
+                pass
+        run(api.close())
+
+    def test_get_namespace(self):
+        def handler(request):
+            assert request.url == "https://example.com/api/test?a=1"
+            return httpx.Response(200, json={"name": "test", "nested": {"x": 1}})
+
+        api = make_client(AsyncAtlassianAPI, handler)
+        result = run(api.get("/api/test", params={"a": 1}))
+        assert isinstance(result, SimpleNamespace)
+        assert result.nested.x == 1
+
+    def test_get_response_format(self):
+        api = make_client(
+            AsyncAtlassianAPI,
+            lambda request: httpx.Response(200, json={"name": "test"}),
+            response_format="dict",
+        )
+        assert run(api.get("/a")) == {"name": "test"}
+        assert run(api.get("/a", response_format="raw")) == b'{"name":"test"}'
+
+    def test_init_invalid_response_format(self):
+        with pytest.raises(ValueError):
+            AsyncAtlassianAPI(url="https://example.com", response_format="xml")
+
+    def test_get_empty_and_text(self):
+        bodies = iter([b"", b"not json"])
+
+        def handler(request):
+            return httpx.Response(200, content=next(bodies))
+
+        api = make_client(AsyncAtlassianAPI, handler)
+        assert run(api.get("/a")) is None
+        assert run(api.get("/b")) == "not json"
+
+    def test_post_put_delete(self):
+        def handler(request):
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            return httpx.Response(
+                200,
+                json={"method": request.method, "body": json.loads(request.content)},
+            )
+
+        api = make_client(AsyncAtlassianAPI, handler)
+        assert run(api.post("/a", json={"k": 1})) == {
+            "method": "POST",
+            "body": {"k": 1},
+        }
+        assert run(api.put("/a", json={"k": 2}))["method"] == "PUT"
+        assert run(api.delete("/a")) is None
+
+    @patch("atlassian.aio.jsonlib.BACKEND", "orjson")
+    def test_post_encodes_json_with_fast_backend(self):
+        def handler(request):
+            assert request.headers["Content-Type"] == "application/json"
+            return httpx.Response(200, json=json.loads(request.content))
+
+        api = make_client(AsyncAtlassianAPI, handler)
+        assert run(api.post("/a", json={"k": "é"})) == {"k": "é"}
+
+    def test_error_raises_api_error(self):
+        api = make_client(
+            AsyncAtlassianAPI, lambda request: httpx.Response(404, text="missing")
+        )
+        with pytest.raises(APIError) as exc_info:
+            run(api.get("/missing"))
+        assert exc_info.value.code == 404
+        assert exc_info.value.message == "missing"
+
+    @patch("atlassian.aio.asyncio.sleep", new_callable=AsyncMock)
+    def test_retry(self, mock_sleep):
+        statuses = iter([429, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), headers={"Retry-After": "1"})
+
+        api = make_client(AsyncAtlassianAPI, handler, retry=RetryPolicy())
+        response = run(api.request("GET", "/a"))
+        assert response.status_code == 200
+        mock_sleep.assert_awaited_once_with(1.0)
+        assert api.retry_stats.retries == 1
+
+    @patch("atlassian.aio.asyncio.sleep", new_callable=AsyncMock)
+    def test_retry_transport_error(self, mock_sleep):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("reset")
+            return httpx.Response(200)
+
+        api = make_client(AsyncAtlassianAPI, handler, retry=RetryPolicy())
+        assert run(api.request("GET", "/a")).status_code == 200
+        assert api.retry_stats.by_status == {None: 1}
+
+    @patch("atlassian.aio.asyncio.sleep", new_callable=AsyncMock)
+    def test_rate_limiter(self, mock_sleep):
+        limiter = SimpleNamespace(reserve=lambda path: 0.5)
+        api = make_client(
+            AsyncAtlassianAPI, lambda r: httpx.Response(200), rate_limiter=limiter
+        )
+        run(api.request("GET", "/a"))
+        mock_sleep.assert_awaited_once_with(0.5)
+
+    def test_get_with_http_cache(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"key": "PROJ"}, headers={"ETag": '"v1"'})
+
+        cache = HTTPCache()
+        api = make_client(AsyncAtlassianAPI, handler, http_cache=cache)
+        assert run(api.get("/project/PROJ")).key == "PROJ"
+        assert run(api.get("/project/PROJ", response_format="dict")) == {"key": "PROJ"}
+        assert "If-None-Match" not in requests[0].headers
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_metadata_cache(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.method == "POST":
+                return httpx.Response(201, json={"id": "2"})
+            return httpx.Response(200, json=[{"name": "1.0"}])
+
+        jira = make_client(AsyncJira, handler, metadata_cache=TTLCache())
+
+        async def use():
+            first = await jira.get_versions("PROJ")
+            second = await jira.get_versions("PROJ")
+            await jira.create_version("PROJ", "2.0")
+            await jira.get_versions("PROJ")
+            return first, second
+
+        first, second = run(use())
+        assert first is second
+        assert [r.method for r in requests] == ["GET", "POST", "GET"]
+
+    def test_single_flight(self):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"key": "PROJ-1"})
+
+        flight = SingleFlight()
+        api = make_client(AsyncAtlassianAPI, handler, single_flight=flight)
+
+        async def use():
+            return await asyncio.gather(*(api.get("/issue/PROJ-1") for _ in range(3)))
+
+        results = run(use())
+        assert [r.key for r in results] == ["PROJ-1"] * 3
+        assert results[0] is not results[1]
+        assert len(requests) == 1
+        assert flight.shared == 2
+
+    def test_map(self):
+        active = [0, 0]
+
+        async def handler(request):
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            if request.url.path.endswith("TEST-2"):
+                return httpx.Response(404, text="missing")
+            return httpx.Response(200, json={"key": request.url.path[-6:]})
+
+        jira = make_client(AsyncJira, handler)
+        keys = [f"TEST-{i}" for i in range(1, 7)]
+        results = run(jira.map("issue", keys, max_workers=2))
+
+        assert [r.key for i, r in enumerate(results) if i != 1] == [
+            k for k in keys if k != "TEST-2"
+        ]
+        assert isinstance(results[1], APIError)
+        assert active[1] == 2
+
+    def test_map_creates_tasks_as_slots_free(self):
+        tasks = []
+
+        async def handler(request):
+            tasks.append(len(asyncio.all_tasks()))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={})
+
+        jira = make_client(AsyncJira, handler)
+        keys = [f"TEST-{i}" for i in range(6)]
+        assert len(run(jira.map("issue", keys, max_workers=2))) == 6
+        assert max(tasks) <= 3
+
+    def test_map_defaults_to_pool_maxsize(self):
+        active = [0, 0]
+
+        async def handler(request):
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            return httpx.Response(200, json={})
+
+        jira = make_client(AsyncJira, handler, max_connections=3)
+        assert jira.pool_maxsize == 3
+        assert len(run(jira.map("issue", [f"TEST-{i}" for i in range(9)]))) == 9
+        assert active[1] == 3
+
+    def test_sync_only_helpers_raise(self):
+        jira = make_client(AsyncJira, lambda r: httpx.Response(200))
+        bitbucket = make_client(AsyncBitbucket, lambda r: httpx.Response(200))
+        with pytest.raises(TypeError):
+            jira.sync("project = P")
+        with pytest.raises(TypeError):
+            jira.mirror("jira.sqlite3", "project = P")
+        with pytest.raises(TypeError):
+            bitbucket.crawl_repositories()
+
+    def test_async_context_manager(self):
+        api = make_client(AsyncAtlassianAPI, lambda r: httpx.Response(200))
+
+        async def use():
+            async with api as context_api:
+                assert context_api is api
+
+        run(use())
+        assert api._client.is_closed
+
+
+class TestAsyncJira:
+    def test_inherited_method(self):
+        def handler(request):
+            assert request.url.path == "/rest/api/2/issue/TEST-1"
+            return httpx.Response(200, json={"key": "TEST-1"})
+
+        jira = make_client(AsyncJira, handler)
+        assert run(jira.issue("TEST-1")).key == "TEST-1"
+
+    def test_search_issue_with_jql(self):
+        def handler(request):
+            payload = json.loads(request.content)
+            start = payload["startAt"]
+            return httpx.Response(
+                200,
+                json={
+                    "total": 3,
+                    "maxResults": 2,
+                    "issues": [
+                        {"key": f"T-{i}"} for i in range(start, min(start + 2, 3))
+                    ],
+                },
+            )
+
+        jira = make_client(AsyncJira, handler)
+        issues = run(jira.search_issue_with_jql("project = T", max_result=2))
+        assert [issue["key"] for issue in issues] == ["T-0", "T-1", "T-2"]
+
+    def test_iter_issues_with_jql_pages(self):
+        def handler(request):
+            start = json.loads(request.content)["startAt"]
+            issues = [{"key": f"T-{i}"} for i in range(start, min(start + 2, 3))]
+            return httpx.Response(
+                200, json={"total": 3, "maxResults": 2, "issues": issues}
+            )
+
+        jira = make_client(AsyncJira, handler)
+
+        async def collect():
+            return [
+                page
+                async for page in jira.iter_issues_with_jql("project = T", pages=True)
+            ]
+
+        assert [len(page) for page in run(collect())] == [2, 1]
+
+    def test_iter_issues_with_jql_invalid_concurrency(self):
+        jira = make_client(AsyncJira, lambda r: httpx.Response(200))
+        with pytest.raises(ValueError):
+            jira.iter_issues_with_jql("project = T", concurrency=0)
+
+    def test_search_issue_with_jql_concurrent(self):
+        in_flight = []
+        peak = []
+
+        async def handler(request):
+            start = json.loads(request.content)["startAt"]
+            in_flight.append(start)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01 if start == 2 else 0)
+            in_flight.remove(start)
+            issues = [{"key": f"T-{i}"} for i in range(start, min(start + 2, 9))]
+            return httpx.Response(
+                200, json={"total": 9, "maxResults": 2, "issues": issues}
+            )
+
+        jira = make_client(AsyncJira, handler)
+        issues = run(jira.search_issue_with_jql("project = T", concurrency=3))
+        assert [issue["key"] for issue in issues] == [f"T-{i}" for i in range(9)]
+        assert max(peak) == 3
+
+    def test_search_issue_with_jql_no_total(self):
+        jira = make_client(AsyncJira, lambda r: httpx.Response(200, json={}))
+        assert run(jira.search_issue_with_jql("project = T")) == []
+
+    def test_concurrent_calls(self):
+        jira = make_client(
+            AsyncJira,
+            lambda r: httpx.Response(200, json={"key": r.url.path.split("/")[-1]}),
+        )
+
+        async def fetch():
+            return await asyncio.gather(*(jira.issue(f"T-{i}") for i in range(20)))
+
+        results = run(fetch())
+        assert [r.key for r in results] == [f"T-{i}" for i in range(20)]
+
+    def test_create_issues_bulk(self):
+        def handler(request):
+            updates = json.loads(request.content)["issueUpdates"]
+            return httpx.Response(
+                201,
+                json={
+                    "issues": [
+                        {"key": f"P-{u['fields']['summary']}"} for u in updates[1:]
+                    ],
+                    "errors": [
+                        {
+                            "status": 400,
+                            "failedElementNumber": 0,
+                            "elementErrors": {"errorMessages": ["no"]},
+                        }
+                    ],
+                },
+            )
+
+        jira = make_client(AsyncJira, handler)
+        results = run(
+            jira.create_issues_bulk(
+                [{"summary": str(i)} for i in range(5)], chunk_size=3
+            )
+        )
+        assert [getattr(r, "message", None) for r in results] == [
+            "no",
+            None,
+            None,
+            "no",
+            None,
+        ]
+        assert results[4] == {"key": "P-4"}
+
+    def test_field_names(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            if request.url.path == "/rest/api/2/field":
+                return httpx.Response(
+                    200, json=[{"id": "customfield_1", "name": "Story Points"}]
+                )
+            assert json.loads(request.content)["fields"] == ["customfield_1"]
+            return httpx.Response(200, json={"total": 0, "maxResults": 50})
+
+        jira = make_client(AsyncJira, handler)
+
+        async def main():
+            await jira.search_issue_with_jql("x", fields=["Story Points"])
+            assert await jira.field_id("story points") == "customfield_1"
+            assert await jira.resolve_fields({"Story Points": 1}) == {
+                "customfield_1": 1
+            }
+
+        run(main())
+        assert requests == ["/rest/api/2/field", "/rest/api/2/search"]
+
+    def test_transition_issues_by_name(self):
+        requests = []
+
+        def handler(request):
+            requests.append((request.method, request.url.path))
+            if request.url.path == "/rest/api/2/search":
+                keys = ["TEST-1", "TEST-2"]
+                return httpx.Response(
+                    200,
+                    json={
+                        "issues": [
+                            {"key": k, "fields": {"status": {"id": "1"}}} for k in keys
+                        ]
+                    },
+                )
+            if request.method == "GET":
+                return httpx.Response(
+                    200, json={"transitions": [{"id": "31", "name": "Done"}]}
+                )
+            assert json.loads(request.content) == {"transition": {"id": "31"}}
+            return httpx.Response(204)
+
+        jira = make_client(AsyncJira, handler)
+        results = run(jira.transition_issues_by_name(["TEST-1", "TEST-2"], "done"))
+        assert results == [None, None]
+        assert sorted(requests) == [
+            ("GET", "/rest/api/2/issue/TEST-1/transitions"),
+            ("POST", "/rest/api/2/issue/TEST-1/transitions"),
+            ("POST", "/rest/api/2/issue/TEST-2/transitions"),
+            ("POST", "/rest/api/2/search"),
+        ]
+
+    def test_edits(self):
+        requests = []
+
+        def handler(request):
+            requests.append((request.url.path, json.loads(request.content)))
+            return httpx.Response(204)
+
+        jira = make_client(AsyncJira, handler)
+
+        async def main():
+            async with jira.edit("TEST-1") as edit:
+                edit.update_issue_label(add_labels=["a"])
+                edit.update_issue_description("new")
+            async with jira.buffered_edits() as edits:
+                edits.update_issue_label("TEST-2", add_labels=["b"])
+                edits.update_issue_label("TEST-3", remove_labels=["c"])
+                edits.update_issue_label("TEST-2", add_labels=["d"])
+
+        run(main())
+        assert sorted(requests) == [
+            (
+                "/rest/api/2/issue/TEST-1",
+                {
+                    "fields": {"description": "new"},
+                    "update": {"labels": [{"add": "a"}]},
+                },
+            ),
+            (
+                "/rest/api/2/issue/TEST-2",
+                {"update": {"labels": [{"add": "b"}, {"add": "d"}]}},
+            ),
+            ("/rest/api/2/issue/TEST-3", {"update": {"labels": [{"remove": "c"}]}}),
+        ]
+
+
+class TestAsyncBitbucket:
+    def test_get_paged(self):
+        def handler(request):
+            if request.url.params.get("start") == "1":
+                return httpx.Response(
+                    200, json={"values": [{"name": "b"}], "isLastPage": True}
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "values": [{"name": "a"}],
+                    "isLastPage": False,
+                    "nextPageStart": 1,
+                },
+            )
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+        assert run(bitbucket.get_project_repo_name("PROJ")) == ["a", "b"]
+
+    def test_iter_commits(self):
+        def handler(request):
+            start = int(request.url.params.get("start", 0))
+            return httpx.Response(
+                200,
+                json={
+                    "values": [{"id": start}],
+                    "isLastPage": start == 2,
+                    "nextPageStart": start + 1,
+                },
+            )
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+
+        async def collect():
+            return [c.id async for c in bitbucket.iter_branch_commits("P", "r", "main")]
+
+        assert run(collect()) == [0, 1, 2]
+
+    def test_get_paged_no_values(self):
+        bitbucket = make_client(AsyncBitbucket, lambda r: httpx.Response(200))
+        assert run(bitbucket.get_project_repo("PROJ")) == []
+
+    def test_pull_request_branches_and_jira_key(self):
+        pr = {
+            "id": 7,
+            "fromRef": {"displayId": "feature/TEST-12-x"},
+            "toRef": {"displayId": "main"},
+        }
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path.endswith("/pull-requests/7"):
+                return httpx.Response(200, json=pr)
+            return httpx.Response(200, json={"values": [pr], "isLastPage": True})
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+        assert run(bitbucket.get_pull_request_source_branch_name("P", "r", 7)) == (
+            "feature/TEST-12-x"
+        )
+        assert run(bitbucket.get_pull_request_destination_branch_name("P", "r", 7)) == (
+            "main"
+        )
+        assert run(bitbucket.get_pull_request_jira_key("P", "r", 7)) == "TEST-12"
+        assert run(bitbucket.get_pull_request_id("P", "r")) == [7]
+        assert len(requests) == 2
+
+    def test_find_pull_request_not_found(self):
+        bitbucket = make_client(AsyncBitbucket, lambda r: httpx.Response(404))
+        assert run(bitbucket.get_pull_request_source_branch_name("P", "r", 7)) is None
+
+    def test_resolve_pull_request_comment(self):
+        requests = []
+        activity = {
+            "comment": {
+                "id": 5,
+                "version": 1,
+                "text": "Fix this",
+                "severity": "BLOCKER",
+                "state": "OPEN",
+            }
+        }
+
+        def handler(request):
+            requests.append(request)
+            if request.method == "GET":
+                return httpx.Response(
+                    200, json={"values": [activity], "isLastPage": True}
+                )
+            return httpx.Response(200, json=json.loads(request.content))
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+        result = run(bitbucket.resolve_pull_request_comment("P", "r", 1, "Fix"))
+        assert result["state"] == "RESOLVED"
+        assert requests[-1].url.path.endswith("/comments/5")
+
+    def test_delete_pull_request_comment(self):
+        activity = {"comment": {"id": 5, "version": 3, "text": "Fix this"}}
+
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(
+                    200, json={"values": [activity], "isLastPage": True}
+                )
+            assert request.url.params["version"] == "3"
+            return httpx.Response(204)
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+        assert run(bitbucket.delete_pull_request_comment("P", "r", 1, "Fix")) is None
+
+    def test_edit_pull_request_comments(self):
+        requests = []
+        activities = [
+            {"id": 11, "comment": {"id": 6, "version": 0, "text": "Coverage: 81%"}},
+            {"id": 10, "comment": {"id": 5, "version": 2, "text": "Fix this"}},
+        ]
+
+        def handler(request):
+            requests.append(request)
+            if request.method == "GET":
+                return httpx.Response(
+                    200, json={"values": activities, "isLastPage": True}
+                )
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            body = json.loads(request.content)
+            return httpx.Response(200, json={**body, "version": body["version"] + 1})
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+        results = run(
+            bitbucket.edit_pull_request_comments(
+                "P",
+                "r",
+                1,
+                [
+                    {"comment": "Coverage", "text": "Coverage: 84%"},
+                    {"comment": "Fix this", "delete": True},
+                    {"comment": "Missing", "text": "x"},
+                ],
+            )
+        )
+        assert results[0]["text"] == "Coverage: 84%"
+        assert results[1:] == [None, None]
+        assert [r.method for r in requests] == ["GET", "PUT", "DELETE"]
+        assert requests[2].url.params["version"] == "2"
+
+    def test_comment_index_rebuilds_after_edit_elsewhere(self):
+        activities = [{"id": 10, "comment": {"id": 5, "version": 0, "text": "Old"}}]
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"values": activities, "isLastPage": True})
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+
+        async def main():
+            await bitbucket._find_comment_in_activities("P", "r", 1, "Old")
+            activities[0]["comment"] = {"id": 5, "version": 1, "text": "New"}
+            return await bitbucket._find_comment_in_activities("P", "r", 1, "New")
+
+        assert run(main())["version"] == 1
+        assert len(requests) == 3
+
+    def test_update_pull_request_title(self):
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, json={"version": 4})
+            return httpx.Response(200, json=json.loads(request.content))
+
+        bitbucket = make_client(AsyncBitbucket, handler)
+        result = run(bitbucket.update_pull_request_title("P", "r", 1, "New"))
+        assert result == {"version": 4, "title": "New"}
+
+
+class TestAsyncConfluence:
+    def test_update_content_fetches_version(self):
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, json={"version": {"number": 3}})
+            return httpx.Response(200, json=json.loads(request.content))
+
+        confluence = make_client(AsyncConfluence, handler)
+        result = run(confluence.update_content(1, "Title", "<p>x</p>"))
+        assert result["version"] == {"number": 4}
+
+    def test_upload_attachment(self):
+        def handler(request):
+            assert request.headers["X-Atlassian-Token"] == "nocheck"
+            assert b"file-bytes" in request.content
+            return httpx.Response(200, json={"results": []})
+
+        confluence = make_client(AsyncConfluence, handler)
+        assert run(confluence.upload_attachment(1, "a.txt", b"file-bytes")) == {
+            "results": []
+        }
+
+    def test_upload_attachment_error(self):
+        confluence = make_client(AsyncConfluence, lambda r: httpx.Response(403))
+        with pytest.raises(APIError):
+            run(confluence.upload_attachment(1, "a.txt", b"x"))
+
+    def test_walk_page_tree(self):
+        tree = {"1": ["2", "3"], "2": ["4"]}
+
+        def handler(request):
+            parts = request.url.path.strip("/").split("/")
+            expand = request.url.params["expand"]
+            assert expand == "body.storage,children.page"
+            if parts[-1] != "page":
+                return httpx.Response(
+                    200, json={"id": parts[-1], "children": {"page": {"size": 1}}}
+                )
+            start = int(request.url.params["start"])
+            children = tree.get(parts[-3], [])[start:][:1]
+            results = [
+                {
+                    "id": c,
+                    "body": {"storage": {"value": c}},
+                    "children": {"page": {"size": int(c in tree)}},
+                }
+                for c in children
+            ]
+            links = {"next": "/next"} if results else {}
+            return httpx.Response(200, json={"results": results, "_links": links})
+
+        confluence = make_client(AsyncConfluence, handler)
+
+        async def collect():
+            return [
+                (depth, page["id"])
+                async for depth, page in confluence.walk_page_tree(
+                    "1", expand="body.storage", max_workers=2
+                )
+            ]
+
+        walked = run(collect())
+        assert walked[0] == (0, "1")
+        assert sorted(walked) == [(0, "1"), (1, "2"), (1, "3"), (2, "4")]
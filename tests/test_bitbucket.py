@@ -2,6 +2,8 @@ import pytest
 from unittest.mock import MagicMock
 from types import SimpleNamespace
 from atlassian.bitbucket import Bitbucket
+from atlassian.error import APIError
+from atlassian.lazy import wrap
 
 
 class TestBitbucket:
@@ -26,6 +28,35 @@ class TestBitbucket:
         assert len(result) == 2
         assert result[0]["key"] == "val1"
 
+    def test_get_paged_dict_pages(self, bitbucket):
+        responses = [
+            {"values": [{"key": "val1"}], "isLastPage": False, "nextPageStart": 1},
+            {"values": [{"key": "val2"}], "isLastPage": True},
+        ]
+        bitbucket.get = MagicMock(side_effect=responses)
+
+        result = bitbucket._get_paged("/test/url", {}, response_format="dict")
+        assert result == [{"key": "val1"}, {"key": "val2"}]
+        assert bitbucket.get.call_args.kwargs["response_format"] == "dict"
+        assert bitbucket.get.call_args.kwargs["params"]["start"] == 1
+
+    def test_get_paged_lazy_pages(self, bitbucket):
+        responses = [
+            wrap(
+                {"values": [{"key": "val1"}], "isLastPage": False, "nextPageStart": 1}
+            ),
+            wrap({"values": [{"key": "val2"}], "isLastPage": True}),
+        ]
+        bitbucket.get = MagicMock(side_effect=responses)
+
+        result = bitbucket._get_paged("/test/url", {}, response_format="lazy")
+        assert [value.key for value in result] == ["val1", "val2"]
+
+    def test_get_paged_not_a_page(self, bitbucket):
+        bitbucket.get = MagicMock(return_value="error text")
+
+        assert bitbucket._get_paged("/test/url", {}) == []
+
     def test_get_paged_no_values(self, bitbucket):
         mock_response = SimpleNamespace(values=None, isLastPage=True)
         bitbucket.get = MagicMock(return_value=mock_response)
@@ -93,6 +124,80 @@ class TestBitbucket:
         result = bitbucket._get_paged("/test/url", {})
         assert result == []
 
+    def test_iter_paged_stops_when_consumer_breaks(self, bitbucket):
+        responses = [
+            SimpleNamespace(values=[1, 2], isLastPage=False, nextPageStart=2),
+            SimpleNamespace(values=[3, 4], isLastPage=False, nextPageStart=4),
+            SimpleNamespace(values=[5], isLastPage=True),
+        ]
+        bitbucket.get = MagicMock(side_effect=responses)
+
+        values = bitbucket.iter_paged("/test/url")
+        assert bitbucket.get.call_count == 0
+        for value in values:
+            if value == 3:
+                break
+        assert bitbucket.get.call_count == 2
+
+    def test_iter_paged_pages(self, bitbucket):
+        responses = [
+            {"values": [1, 2], "isLastPage": False, "nextPageStart": 2},
+            {"values": [], "isLastPage": False, "nextPageStart": 2},
+            {"values": [3], "isLastPage": True},
+        ]
+        bitbucket.get = MagicMock(side_effect=responses)
+
+        params = {"limit": 10}
+        pages = list(
+            bitbucket.iter_paged(
+                "/test/url", params, response_format="dict", pages=True
+            )
+        )
+        assert pages == [[1, 2], [], [3]]
+        assert params == {"limit": 10}
+        assert bitbucket.get.call_args.kwargs["params"] == {"limit": 8, "start": 2}
+
+    def test_iter_paged_empty_first_page(self, bitbucket):
+        bitbucket.get = MagicMock(
+            return_value=SimpleNamespace(values=[], isLastPage=False, nextPageStart=1)
+        )
+        assert list(bitbucket.iter_paged("/test/url")) == []
+        assert bitbucket.get.call_count == 1
+
+    def test_iter_listing_methods(self, bitbucket):
+        bitbucket.iter_paged = MagicMock(return_value=iter([]))
+        base = "/rest/api/latest/projects/PROJ/repos"
+        calls = [
+            (bitbucket.iter_project_repo, ("PROJ",), f"{base}/"),
+            (bitbucket.iter_repo_branch, ("PROJ", "repo"), f"{base}/repo/branches"),
+            (
+                bitbucket.iter_branch_commits,
+                ("PROJ", "repo", "main"),
+                f"{base}/repo/commits/?until=main",
+            ),
+            (
+                bitbucket.iter_pull_request,
+                ("PROJ", "repo", "OPEN"),
+                f"{base}/repo/pull-requests?state=OPEN",
+            ),
+            (
+                bitbucket.iter_pull_request_activities,
+                ("PROJ", "repo", 1),
+                f"{base}/repo/pull-requests/1/activities",
+            ),
+            (bitbucket.iter_tags, ("PROJ", "repo"), f"{base}/repo/tags"),
+        ]
+        for method, args, url in calls:
+            method(*args, start=5, limit=10, response_format="lazy")
+            bitbucket.iter_paged.assert_called_with(
+                url, {"start": 5, "limit": 10}, response_format="lazy"
+            )
+
+        bitbucket.iter_file_change_history("PROJ", "repo", "main", "a.py")
+        args, kwargs = bitbucket.iter_paged.call_args
+        assert "path=a.py" in args[0]
+        assert args[1] == {}
+
     def test_get_project_repo(self, bitbucket):
         bitbucket._get_paged = MagicMock(return_value=[])
         bitbucket.get_project_repo("PROJ")
@@ -236,18 +341,137 @@ class TestBitbucket:
 
     def test_get_pull_request_destination_branch_name(self, bitbucket):
         mock_pr = SimpleNamespace(id=123, toRef=SimpleNamespace(displayId="master"))
-        bitbucket.get_pull_request = MagicMock(return_value=[mock_pr])
+        bitbucket.get_pull_request_overview = MagicMock(return_value=mock_pr)
 
         result = bitbucket.get_pull_request_destination_branch_name("PROJ", "repo", 123)
         assert result == "master"
+        bitbucket.get_pull_request_overview.assert_called_once_with("PROJ", "repo", 123)
 
     def test_get_pull_request_source_branch_name(self, bitbucket):
         mock_pr = SimpleNamespace(id=456, fromRef=SimpleNamespace(displayId="feature"))
-        bitbucket.get_pull_request = MagicMock(return_value=[mock_pr])
+        bitbucket.get_pull_request_overview = MagicMock(return_value=mock_pr)
 
         result = bitbucket.get_pull_request_source_branch_name("PROJ", "repo", 456)
         assert result == "feature"
 
+    def test_find_pull_request_is_cached(self, bitbucket):
+        mock_pr = SimpleNamespace(
+            id=7,
+            fromRef=SimpleNamespace(displayId="feature/TEST-1-x"),
+            toRef=SimpleNamespace(displayId="main"),
+        )
+        bitbucket.get_pull_request_overview = MagicMock(return_value=mock_pr)
+
+        assert bitbucket.get_pull_request_source_branch_name("P", "r", 7) == (
+            "feature/TEST-1-x"
+        )
+        assert bitbucket.get_pull_request_destination_branch_name("P", "r", "7") == (
+            "main"
+        )
+        assert bitbucket.get_pull_request_jira_key("P", "r", 7) == "TEST-1"
+        assert bitbucket.get_pull_request_overview.call_count == 1
+
+    def test_find_pull_request_not_found(self, bitbucket):
+        bitbucket.get_pull_request_overview = MagicMock(
+            side_effect=APIError(404, "missing")
+        )
+        assert bitbucket.get_pull_request_source_branch_name("P", "r", 1) is None
+
+    def test_find_pull_request_error(self, bitbucket):
+        bitbucket.get_pull_request_overview = MagicMock(
+            side_effect=APIError(500, "boom")
+        )
+        with pytest.raises(APIError):
+            bitbucket.get_pull_request_source_branch_name("P", "r", 1)
+
+    def test_find_pull_request_not_a_pull_request(self, bitbucket):
+        bitbucket.get_pull_request_overview = MagicMock(return_value="error text")
+        assert bitbucket._find_pull_request("P", "r", 1) is None
+        assert bitbucket._cached_pull_request("P", "r", 1) is None
+
+    def test_pull_request_cache_eviction(self, bitbucket):
+        bitbucket.pull_request_cache_size = 2
+        bitbucket.get_pull_request_overview = MagicMock(
+            side_effect=lambda project, repo, pr_id: SimpleNamespace(id=pr_id)
+        )
+        for pr_id in (1, 2, 1, 3):
+            bitbucket._find_pull_request("P", "r", pr_id)
+
+        assert bitbucket._cached_pull_request("P", "r", 1) is not None
+        assert bitbucket._cached_pull_request("P", "r", 2) is None
+        assert bitbucket._cached_pull_request("P", "r", 3) is not None
+
+    def test_pull_request_cache_disabled(self, bitbucket):
+        bitbucket.pull_request_cache_size = 0
+        bitbucket.get_pull_request_overview = MagicMock(
+            return_value=SimpleNamespace(id=1)
+        )
+        bitbucket._find_pull_request("P", "r", 1)
+        bitbucket._find_pull_request("P", "r", 1)
+        assert bitbucket.get_pull_request_overview.call_count == 2
+
+    def test_clear_pull_request_cache(self, bitbucket):
+        bitbucket.get_pull_request_overview = MagicMock(
+            side_effect=lambda project, repo, pr_id: SimpleNamespace(id=pr_id)
+        )
+        for project, repo, pr_id in (("P", "a", 1), ("P", "b", 1), ("Q", "a", 2)):
+            bitbucket._find_pull_request(project, repo, pr_id)
+
+        bitbucket.clear_pull_request_cache("P", "a")
+        assert bitbucket._cached_pull_request("P", "a", 1) is None
+        assert bitbucket._cached_pull_request("P", "b", 1) is not None
+
+        bitbucket.clear_pull_request_cache()
+        assert bitbucket._cached_pull_request("Q", "a", 2) is None
+
+    def test_pull_request_cache_ttl(self, bitbucket, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("atlassian.bitbucket.time.monotonic", lambda: now[0])
+        bitbucket.pull_request_cache_ttl = 60
+        bitbucket.get_pull_request_overview = MagicMock(
+            return_value=SimpleNamespace(id=1, toRef=SimpleNamespace(displayId="a"))
+        )
+        bitbucket._find_pull_request("P", "r", 1)
+        now[0] += 59
+        assert bitbucket._cached_pull_request("P", "r", 1) is not None
+        now[0] += 1
+        assert bitbucket._cached_pull_request("P", "r", 1) is None
+        bitbucket._find_pull_request("P", "r", 1)
+        assert bitbucket.get_pull_request_overview.call_count == 2
+
+    @pytest.mark.parametrize("convert", [lambda pr: pr, wrap])
+    def test_branch_names_with_dict_and_lazy_results(self, bitbucket, convert):
+        pr = {
+            "id": 7,
+            "fromRef": {"displayId": "feature"},
+            "toRef": {"displayId": "main"},
+        }
+        bitbucket.get_pull_request_overview = MagicMock(return_value=convert(pr))
+        assert bitbucket.get_pull_request_source_branch_name("P", "r", 7) == "feature"
+        assert bitbucket.get_pull_request_destination_branch_name("P", "r", 7) == "main"
+        assert bitbucket.get_pull_request_overview.call_count == 1
+
+    def test_branch_name_limit_is_deprecated(self, bitbucket):
+        bitbucket.get_pull_request_overview = MagicMock(
+            return_value=SimpleNamespace(id=1, toRef=SimpleNamespace(displayId="a"))
+        )
+        with pytest.warns(DeprecationWarning):
+            bitbucket.get_pull_request_destination_branch_name("P", "r", 1, 100)
+
+    def test_pull_request_lock_per_client(self):
+        first, second = Bitbucket(url="https://a"), Bitbucket(url="https://b")
+        assert first._pull_request_lock is not second._pull_request_lock
+
+    def test_update_pull_request_clears_cache(self, bitbucket):
+        bitbucket.get_pull_request_overview = MagicMock(
+            return_value=SimpleNamespace(id=1, version=3)
+        )
+        bitbucket._find_pull_request("P", "r", 1)
+
+        bitbucket.update_pull_request_destination("P", "r", 1, "release")
+
+        assert bitbucket._cached_pull_request("P", "r", 1) is None
+
     def test_get_pull_request_jira_key(self, bitbucket):
         bitbucket.get_pull_request_source_branch_name = MagicMock(
             return_value="feature/TEST-123-description"
@@ -508,6 +732,176 @@ class TestBitbucket:
         result = bitbucket._find_comment_in_activities("PROJ", "repo", 1, "text")
         assert result is None
 
+    @staticmethod
+    def _comment_activity(activity_id, comment_id, text, version=0):
+        return SimpleNamespace(
+            id=activity_id,
+            comment=SimpleNamespace(
+                id=comment_id,
+                version=version,
+                text=text,
+                severity="NORMAL",
+                state="OPEN",
+            ),
+        )
+
+    def test_comment_index_reused_across_edits(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(
+            return_value=[
+                self._comment_activity(11, 2, "Coverage: 81%"),
+                self._comment_activity(10, 1, "Build failed"),
+            ]
+        )
+        bitbucket.put = MagicMock(
+            side_effect=lambda url, json: {**json, "id": int(url.rsplit("/", 1)[1])}
+        )
+
+        bitbucket.update_pull_request_comment("PROJ", "repo", 1, "Coverage", "84%")
+        bitbucket.resolve_pull_request_comment("PROJ", "repo", 1, "Build failed")
+        bitbucket.update_pull_request_comment("PROJ", "repo", 1, "84%", "85%")
+
+        bitbucket.get_pull_request_activities.assert_called_once()
+        urls = [call.args[0] for call in bitbucket.put.call_args_list]
+        assert urls[0].endswith("/comments/2")
+        assert urls[1].endswith("/comments/1")
+        assert urls[2].endswith("/comments/2")
+
+    def test_comment_index_reads_only_new_activities(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(
+            return_value=[self._comment_activity(10, 1, "Build failed")]
+        )
+        bitbucket._find_comment_in_activities("PROJ", "repo", 1, "Build")
+
+        consumed = []
+
+        def activities(*args, **kwargs):
+            for activity in [
+                self._comment_activity(12, 3, "Please rebase"),
+                SimpleNamespace(id=11, action="RESCOPED"),
+                self._comment_activity(10, 1, "Build failed"),
+                self._comment_activity(9, 0, "Never read"),
+            ]:
+                consumed.append(activity.id)
+                yield activity
+
+        bitbucket.iter_pull_request_activities = MagicMock(side_effect=activities)
+
+        found = bitbucket._find_comment_in_activities("PROJ", "repo", 1, "rebase")
+        assert found["id"] == 3
+        assert consumed == [12, 11, 10]
+        assert (
+            bitbucket._find_comment_in_activities("PROJ", "repo", 1, "Build")["id"] == 1
+        )
+        bitbucket.get_pull_request_activities.assert_called_once()
+
+    def test_comment_index_rebuilds_after_edit_elsewhere(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(
+            side_effect=[
+                [self._comment_activity(10, 1, "Coverage: 81%")],
+                [self._comment_activity(10, 1, "Coverage: 90%", version=1)],
+            ]
+        )
+        bitbucket.iter_pull_request_activities = MagicMock(
+            side_effect=lambda *args: iter([self._comment_activity(10, 1, "x")])
+        )
+        bitbucket._find_comment_in_activities("PROJ", "repo", 1, "Coverage")
+
+        found = bitbucket._find_comment_in_activities("PROJ", "repo", 1, "90%")
+        assert (found["id"], found["version"]) == (1, 1)
+        assert bitbucket.get_pull_request_activities.call_count == 2
+        bitbucket.iter_pull_request_activities.assert_called_once()
+
+    def test_edit_pull_request_comments_rebuilds_for_missing_comment(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(
+            side_effect=[
+                [self._comment_activity(10, 1, "Coverage: 81%")],
+                [self._comment_activity(10, 1, "Coverage: 90%", version=1)],
+            ]
+        )
+        bitbucket.iter_pull_request_activities = MagicMock(return_value=iter([]))
+        bitbucket.put = MagicMock(side_effect=lambda url, json: json)
+        bitbucket._find_comment_in_activities("PROJ", "repo", 1, "Coverage")
+
+        results = bitbucket.edit_pull_request_comments(
+            "PROJ", "repo", 1, [{"comment": "Coverage: 90%", "text": "Coverage: 95%"}]
+        )
+        assert results == [
+            {
+                "version": 1,
+                "text": "Coverage: 95%",
+                "severity": "NORMAL",
+                "state": "OPEN",
+            }
+        ]
+        assert bitbucket.get_pull_request_activities.call_count == 2
+
+    def test_comment_edit_rebuilds_index_on_conflict(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(
+            side_effect=[
+                [self._comment_activity(10, 1, "Build failed", version=0)],
+                [self._comment_activity(11, 1, "Build failed", version=1)],
+            ]
+        )
+        bitbucket.put = MagicMock(side_effect=[APIError(409, "stale"), {"version": 2}])
+
+        result = bitbucket.resolve_pull_request_comment("PROJ", "repo", 1, "Build")
+        assert result == {"version": 2}
+        assert bitbucket.put.call_args_list[1].kwargs["json"]["version"] == 1
+        assert bitbucket.get_pull_request_activities.call_count == 2
+
+    def test_comment_edit_conflict_raised_after_retry(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(
+            return_value=[self._comment_activity(10, 1, "Build failed")]
+        )
+        bitbucket.put = MagicMock(side_effect=APIError(409, "stale"))
+
+        with pytest.raises(APIError):
+            bitbucket.resolve_pull_request_comment("PROJ", "repo", 1, "Build")
+        assert bitbucket.put.call_count == 2
+
+    def test_edit_pull_request_comments(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(
+            return_value=[
+                self._comment_activity(12, 3, "Outdated note"),
+                self._comment_activity(11, 2, "Coverage: 81%"),
+                self._comment_activity(10, 1, "Build failed"),
+            ]
+        )
+        bitbucket.iter_pull_request_activities = MagicMock(return_value=iter([]))
+        bitbucket.put = MagicMock(side_effect=lambda url, json: json)
+        bitbucket.delete = MagicMock(return_value=None)
+
+        results = bitbucket.edit_pull_request_comments(
+            "PROJ",
+            "repo",
+            1,
+            [
+                {"comment": "Coverage", "text": "Coverage: 84%"},
+                {"comment": "Build failed", "state": "RESOLVED"},
+                {"comment": "Outdated note", "delete": True},
+                {"comment": "Outdated", "delete": True},
+                {"comment": "Missing", "text": "x"},
+            ],
+        )
+
+        assert results[0]["text"] == "Coverage: 84%"
+        assert results[1]["state"] == "RESOLVED"
+        assert results[2:] == [None, None, None]
+        assert "/comments/3?version=0" in bitbucket.delete.call_args.args[0]
+        bitbucket.delete.assert_called_once()
+        bitbucket.get_pull_request_activities.assert_called_once()
+        bitbucket.iter_pull_request_activities.assert_not_called()
+
+    def test_clear_comment_index(self, bitbucket):
+        bitbucket.get_pull_request_activities = MagicMock(return_value=[])
+        bitbucket._find_comment_in_activities("PROJ", "repo", 1, "x")
+        bitbucket._find_comment_in_activities("PROJ", "other", 1, "x")
+
+        bitbucket.clear_comment_index("PROJ", "repo")
+        assert list(bitbucket._comment_indexes) == [("PROJ", "other", 1)]
+        bitbucket.clear_comment_index()
+        assert not bitbucket._comment_indexes
+
     def test_resolve_pull_request_comment(self, bitbucket):
         mock_activity = SimpleNamespace(
             comment=SimpleNamespace(
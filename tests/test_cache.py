@@ -0,0 +1,362 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from atlassian.bitbucket import Bitbucket
+from atlassian.cache import (
+    CachedResponse,
+    CacheStats,
+    HTTPCache,
+    SQLiteCache,
+    TTLCache,
+)
+from atlassian.confluence import Confluence
+from atlassian.error import APIError
+from atlassian.jira import Jira
+from atlassian.lazy import wrap
+
+
+def response(status_code=200, headers=None, content=b'{"key": "PROJ"}'):
+    return SimpleNamespace(
+        status_code=status_code, headers=headers or {}, content=content
+    )
+
+
+class TestHTTPCache:
+    def test_key_ignores_param_order_and_none(self):
+        assert HTTPCache.key("u", {"a": 1, "b": "x", "c": None}) == HTTPCache.key(
+            "u", {"b": "x", "a": "1"}
+        )
+        assert HTTPCache.key("u", identity="alice") != HTTPCache.key(
+            "u", identity="bob"
+        )
+
+    def test_store_and_revalidate(self):
+        cache = HTTPCache()
+        key = cache.key("https://jira/rest/api/2/project/PROJ")
+        assert cache.validators(key) == {}
+
+        assert cache.store(
+            key,
+            response(
+                headers={
+                    "ETag": '"v1"',
+                    "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                }
+            ),
+        )
+        assert cache.validators(key) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+        cached = cache.revalidated(key, response(304, {"ETag": '"v2"'}, b""))
+        assert isinstance(cached, CachedResponse)
+        assert cached.text == '{"key": "PROJ"}'
+        assert cache.validators(key)["If-None-Match"] == '"v2"'
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.bytes_saved == len(cached.content)
+
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            response(headers={}),
+            response(404, {"ETag": '"v1"'}),
+            response(headers={"ETag": '"v1"', "Cache-Control": "private, no-store"}),
+        ],
+    )
+    def test_store_skips_uncacheable_responses(self, stored):
+        cache = HTTPCache()
+        assert not cache.store(cache.key("u"), stored)
+        assert len(cache) == 0
+        assert cache.stats.misses == 1
+
+    def test_store_replaces_entry_without_validators(self):
+        cache = HTTPCache()
+        key = cache.key("u")
+        cache.store(key, response(headers={"ETag": '"v1"'}))
+        cache.store(key, response(headers={}))
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_lru_eviction_by_entries(self):
+        cache = HTTPCache(max_entries=2)
+        for name in ("a", "b"):
+            cache.store(cache.key(name), response(headers={"ETag": name}))
+        cache.revalidated(cache.key("a"), response(304))
+        cache.store(cache.key("c"), response(headers={"ETag": "c"}))
+
+        assert cache.validators(cache.key("a"))
+        assert cache.validators(cache.key("b")) == {}
+        assert cache.stats.evictions == 1
+
+    def test_lru_eviction_by_bytes(self):
+        cache = HTTPCache(max_bytes=10)
+        cache.store(cache.key("a"), response(headers={"ETag": "a"}, content=b"x" * 6))
+        cache.store(cache.key("b"), response(headers={"ETag": "b"}, content=b"y" * 6))
+        assert len(cache) == 1
+        assert cache.size == 6
+        assert not cache.store(
+            cache.key("c"), response(headers={"ETag": "c"}, content=b"z" * 11)
+        )
+
+    def test_revalidated_after_eviction(self):
+        cache = HTTPCache()
+        assert cache.revalidated(cache.key("u"), response(304)) is None
+        assert cache.stats.hits == 0
+
+    def test_invalidate_and_clear(self):
+        cache = HTTPCache()
+        cache.store(cache.key("https://x/a/1"), response(headers={"ETag": "1"}))
+        cache.store(cache.key("https://x/b/1"), response(headers={"ETag": "2"}))
+        assert cache.invalidate("https://x/a") == 1
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats.misses == 0
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            HTTPCache(max_entries=0)
+        with pytest.raises(ValueError):
+            HTTPCache(max_bytes=0)
+
+
+class TestCacheStats:
+    def test_hit_rate_and_reset(self):
+        stats = CacheStats()
+        assert stats.hit_rate == 0.0
+        stats.record_hit(10)
+        stats.record_miss()
+        stats.record_eviction()
+        assert stats.hit_rate == 0.5
+        assert "hits=1" in repr(stats)
+        stats.reset()
+        assert (stats.hits, stats.misses, stats.evictions, stats.bytes_saved) == (
+            0,
+            0,
+            0,
+            0,
+        )
+
+
+class TestTTLCache:
+    @pytest.fixture
+    def clock(self):
+        now = [100.0]
+        with patch("atlassian.cache.time.monotonic", side_effect=lambda: now[0]):
+            yield now
+
+    def key(self, method, *args):
+        return (method, "identity", "https://jira", "namespace", args, ())
+
+    def test_lookup_respects_ttl(self, clock):
+        cache = TTLCache(ttl=10, ttls={"get_projects": 60, "user": 0})
+        cache.store(self.key("get_versions", "PROJ"), ["1.0"])
+        cache.store(self.key("get_projects"), ["PROJ"])
+        cache.store(self.key("user", "alice"), "alice")
+
+        assert cache.lookup(self.key("get_versions", "PROJ")) == (True, ["1.0"])
+        assert cache.lookup(self.key("user", "alice")) == (False, None)
+        clock[0] += 30
+        assert cache.lookup(self.key("get_versions", "PROJ")) == (False, None)
+        assert cache.lookup(self.key("get_projects")) == (True, ["PROJ"])
+        assert len(cache) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+    def test_lru_eviction(self, clock):
+        cache = TTLCache(max_entries=2)
+        cache.store(self.key("user", "a"), "a")
+        cache.store(self.key("user", "b"), "b")
+        cache.lookup(self.key("user", "a"))
+        cache.store(self.key("user", "c"), "c")
+        assert cache.lookup(self.key("user", "b")) == (False, None)
+        assert cache.lookup(self.key("user", "a")) == (True, "a")
+        assert cache.stats.evictions == 1
+
+    def test_invalidate(self, clock):
+        cache = TTLCache()
+        cache.store(self.key("get_versions", "A"), 1)
+        cache.store(self.key("get_versions", "B"), 2)
+        cache.store(self.key("get_projects"), 3)
+        assert cache.invalidate("get_versions", "A") == 1
+        assert cache.invalidate("get_versions") == 1
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            TTLCache(max_entries=0)
+        with pytest.raises(ValueError):
+            TTLCache(ttl=-1)
+        with pytest.raises(ValueError):
+            TTLCache(ttls={"user": -1})
+
+    def test_thread_safety(self):
+        cache = TTLCache(max_entries=50)
+
+        def work(worker):
+            for i in range(200):
+                cache.store(self.key("user", worker, i), i)
+                cache.lookup(self.key("user", worker, i - 1))
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(cache) == 50
+
+
+class TestMemoize:
+    @pytest.fixture
+    def jira(self):
+        jira = Jira(url="https://jira", token="t", metadata_cache=TTLCache())
+        jira.get = MagicMock(side_effect=lambda url: SimpleNamespace(url=url))
+        jira.post = MagicMock(return_value={"id": "1"})
+        return jira
+
+    def test_repeated_lookups_use_cache(self, jira):
+        first = jira.get_versions("PROJ")
+        assert jira.get_versions("PROJ") is first
+        jira.get_versions("OTHER")
+        jira.get_projects()
+        jira.get_projects()
+        assert jira.get.call_count == 3
+
+    def test_without_cache(self):
+        jira = Jira(url="https://jira")
+        jira.get = MagicMock()
+        jira.user("alice")
+        jira.user("alice")
+        assert jira.get.call_count == 2
+
+    def test_keyed_by_client_identity(self, jira):
+        other = Jira(url="https://jira", token="u", metadata_cache=jira.metadata_cache)
+        other.get = MagicMock()
+        jira.user("alice")
+        other.user("alice")
+        other.get.assert_called_once()
+
+    def test_create_version_invalidates_versions(self, jira):
+        jira.get_versions("PROJ")
+        jira.get_versions("OTHER")
+        jira.create_version("PROJ", "2.0")
+        jira.get_versions("PROJ")
+        jira.get_versions("OTHER")
+        assert jira.get.call_count == 3
+
+    def test_errors_are_not_cached(self, jira):
+        jira.get = MagicMock(side_effect=[APIError(503, "down"), "ok"])
+        with pytest.raises(APIError):
+            jira.user("alice")
+        assert jira.user("alice") == "ok"
+
+    def test_other_clients(self):
+        cache = TTLCache()
+        bitbucket = Bitbucket(url="https://bb", metadata_cache=cache)
+        confluence = Confluence(url="https://wiki", metadata_cache=cache)
+        bitbucket.get = MagicMock()
+        confluence.get = MagicMock()
+        for _ in range(2):
+            bitbucket.get_user("alice")
+            confluence.get_space("DOCS")
+        bitbucket.get.assert_called_once()
+        confluence.get.assert_called_once()
+
+
+class TestSQLiteCache:
+    def key(self, method, *args, response_format="namespace"):
+        return (method, "identity", "https://jira", response_format, args, ())
+
+    def test_results_survive_reopen(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        cache = SQLiteCache(path)
+        value = [SimpleNamespace(name="1.0", released=True)]
+        cache.store(self.key("get_versions", "PROJ"), value)
+        cache.close()
+
+        reopened = SQLiteCache(path)
+        found, restored = reopened.lookup(self.key("get_versions", "PROJ"))
+        assert found
+        assert restored == value
+        assert reopened.lookup(self.key("get_versions", "OTHER")) == (False, None)
+        assert (reopened.stats.hits, reopened.stats.misses) == (1, 1)
+
+    def test_decodes_in_requested_format(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3")
+        data = {"key": "DOCS", "homepage": {"id": "1"}}
+        cache.store(self.key("get_space", "DOCS", response_format="lazy"), wrap(data))
+        cache.store(self.key("get_space", "DOCS", response_format="dict"), data)
+
+        _, lazy = cache.lookup(self.key("get_space", "DOCS", response_format="lazy"))
+        _, plain = cache.lookup(self.key("get_space", "DOCS", response_format="dict"))
+        assert lazy.homepage.id == "1"
+        assert plain == data
+
+    def test_skips_values_that_are_not_json(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3")
+        cache.store(self.key("user", "alice", response_format="raw"), b"{}")
+        assert len(cache) == 0
+
+    def test_ttl_and_eviction(self, tmp_path):
+        now = [1000.0]
+        with patch("atlassian.cache.time.time", side_effect=lambda: now[0]):
+            cache = SQLiteCache(
+                tmp_path / "cache.sqlite3",
+                ttl=10,
+                max_entries=2,
+                ttls={"get_projects": 100, "user": 0},
+            )
+            cache.store(self.key("get_versions", "A"), 1)
+            cache.store(self.key("user", "alice"), "alice")
+            now[0] += 1
+            cache.store(self.key("get_projects"), 2)
+            assert cache.lookup(self.key("user", "alice")) == (False, None)
+            now[0] += 1
+            cache.lookup(self.key("get_versions", "A"))
+            now[0] += 1
+            cache.store(self.key("get_versions", "B"), 3)
+            assert cache.lookup(self.key("get_projects")) == (False, None)
+            assert cache.stats.evictions == 1
+            now[0] += 20
+            assert cache.lookup(self.key("get_versions", "A")) == (False, None)
+
+    def test_invalidate(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.sqlite3")
+        cache.store(self.key("get_versions", "A"), 1)
+        cache.store(self.key("get_versions", "B"), 2)
+        cache.store(self.key("get_projects"), 3)
+        assert cache.invalidate("get_versions", "A") == 1
+        assert cache.invalidate("get_versions") == 1
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_shared_between_connections_and_threads(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        caches = [SQLiteCache(path), SQLiteCache(path)]
+
+        def work(worker):
+            cache = caches[worker % 2]
+            for i in range(50):
+                cache.store(self.key("user", worker, i), i)
+                assert cache.lookup(self.key("user", worker, i)) == (True, i)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(caches[0]) == 200
+
+    def test_as_metadata_cache(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        for _ in range(2):
+            jira = Jira(url="https://jira", token="t", metadata_cache=SQLiteCache(path))
+            jira.get = MagicMock(return_value=[SimpleNamespace(key="PROJ")])
+            assert jira.get_projects()[0].key == "PROJ"
+        jira.get.assert_not_called()
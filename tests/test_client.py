@@ -1,9 +1,15 @@
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch, Mock
 import requests
 from types import SimpleNamespace
+from atlassian.cache import HTTPCache
 from atlassian.client import AtlassianAPI
 from atlassian.error import APIError
+from atlassian.lazy import LazyNamespace
+from atlassian.retry import RetryPolicy
 
 
 class TestAtlassianAPI:
@@ -182,6 +188,39 @@ class TestAtlassianAPI:
             timeout=60,
         )
 
+    @patch("atlassian.client.jsonlib.BACKEND", "orjson")
+    @patch("atlassian.client.jsonlib.dumps", return_value=b'{"k":1}')
+    def test_request_encodes_json_with_fast_backend(self, mock_dumps):
+        api = AtlassianAPI(url="https://example.com")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        api._session.request = MagicMock(return_value=mock_response)
+
+        api.request(method="POST", path="/api/test", json={"k": 1})
+
+        mock_dumps.assert_called_once_with({"k": 1})
+        api._session.request.assert_called_once_with(
+            method="POST",
+            url="https://example.com/api/test",
+            data=b'{"k":1}',
+            json=None,
+            headers={"Content-Type": "application/json"},
+            params=None,
+            timeout=60,
+        )
+
+    @patch("atlassian.client.jsonlib.BACKEND", "json")
+    def test_request_passes_json_with_stdlib_backend(self):
+        api = AtlassianAPI(url="https://example.com")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        api._session.request = MagicMock(return_value=mock_response)
+
+        api.request(method="POST", path="/api/test", json={"k": 1})
+
+        assert api._session.request.call_args.kwargs["json"] == {"k": 1}
+        assert "headers" not in api._session.request.call_args.kwargs
+
     def test_get_with_response(self):
         api = AtlassianAPI(url="https://example.com")
         mock_response = MagicMock()
@@ -375,3 +414,340 @@ class TestAtlassianAPI:
 
         assert exc_info.value.code == 403
         assert '{"message": "You do not have permission"}' in exc_info.value.message
+
+    def _response(self, status_code, headers=None, text=""):
+        response = MagicMock()
+        response.status_code = status_code
+        response.reason = "reason"
+        response.headers = headers or {}
+        response.text = text
+        return response
+
+    def test_init_retry_default_none(self):
+        api = AtlassianAPI(url="https://example.com")
+        assert api.retry is None
+        assert api.retry_stats.retries == 0
+
+    @patch("atlassian.client.time.sleep")
+    def test_request_retries_on_429(self, mock_sleep):
+        api = AtlassianAPI(url="https://example.com", retry=RetryPolicy(max_attempts=3))
+        api._session.request = MagicMock(
+            side_effect=[
+                self._response(429, {"Retry-After": "2"}),
+                self._response(200),
+            ]
+        )
+
+        result = api.request(method="GET", path="/api/test")
+
+        assert result.status_code == 200
+        assert api._session.request.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+        assert api.retry_stats.retries == 1
+        assert api.retry_stats.backoff_seconds == 2.0
+        assert api.retry_stats.by_status == {429: 1}
+
+    @patch("atlassian.client.time.sleep")
+    def test_request_retry_exhausted(self, mock_sleep):
+        api = AtlassianAPI(
+            url="https://example.com",
+            retry=RetryPolicy(max_attempts=3, jitter=False, backoff_base=1.0),
+        )
+        api._session.request = MagicMock(return_value=self._response(503))
+
+        with pytest.raises(APIError) as exc_info:
+            api.request(method="GET", path="/api/test")
+
+        assert exc_info.value.code == 503
+        assert api._session.request.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+        assert api.retry_stats.exhausted == 1
+
+    @patch("atlassian.client.time.sleep")
+    def test_request_does_not_retry_post(self, mock_sleep):
+        api = AtlassianAPI(url="https://example.com", retry=RetryPolicy())
+        api._session.request = MagicMock(return_value=self._response(503))
+
+        with pytest.raises(APIError):
+            api.request(method="POST", path="/api/test")
+
+        assert api._session.request.call_count == 1
+        mock_sleep.assert_not_called()
+        assert api.retry_stats.exhausted == 0
+
+    @patch("atlassian.client.time.sleep")
+    def test_request_does_not_retry_404(self, mock_sleep):
+        api = AtlassianAPI(url="https://example.com", retry=RetryPolicy())
+        api._session.request = MagicMock(return_value=self._response(404))
+
+        with pytest.raises(APIError):
+            api.request(method="GET", path="/api/test")
+
+        assert api._session.request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("atlassian.client.time.sleep")
+    def test_request_retry_after_too_long(self, mock_sleep):
+        api = AtlassianAPI(
+            url="https://example.com", retry=RetryPolicy(max_retry_after=5)
+        )
+        api._session.request = MagicMock(
+            return_value=self._response(429, {"Retry-After": "600"})
+        )
+
+        with pytest.raises(APIError):
+            api.request(method="GET", path="/api/test")
+
+        assert api._session.request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("atlassian.client.time.sleep")
+    def test_request_retries_connection_error(self, mock_sleep):
+        api = AtlassianAPI(url="https://example.com", retry=RetryPolicy(max_attempts=2))
+        api._session.request = MagicMock(
+            side_effect=[requests.ConnectionError("reset"), self._response(200)]
+        )
+
+        result = api.request(method="GET", path="/api/test")
+
+        assert result.status_code == 200
+        assert api.retry_stats.by_status == {None: 1}
+
+    def test_request_connection_error_without_retry(self):
+        api = AtlassianAPI(url="https://example.com")
+        api._session.request = MagicMock(side_effect=requests.Timeout("slow"))
+
+        with pytest.raises(requests.Timeout):
+            api.request(method="GET", path="/api/test")
+
+    def test_request_consults_rate_limiter(self):
+        limiter = MagicMock()
+        api = AtlassianAPI(url="https://example.com", rate_limiter=limiter)
+        api._session.request = MagicMock(return_value=self._response(200))
+
+        api.request(method="GET", path="/rest/api/2/search")
+
+        limiter.acquire.assert_called_once_with("/rest/api/2/search")
+
+    @patch("atlassian.client.time.sleep")
+    def test_request_rate_limiter_each_attempt(self, mock_sleep):
+        limiter = MagicMock()
+        api = AtlassianAPI(
+            url="https://example.com", retry=RetryPolicy(), rate_limiter=limiter
+        )
+        api._session.request = MagicMock(
+            side_effect=[self._response(503), self._response(200)]
+        )
+
+        api.request(method="GET", path="/api/test")
+
+        assert limiter.acquire.call_count == 2
+
+    def test_init_default_pool(self):
+        api = AtlassianAPI(url="https://example.com")
+        adapter = api._session.get_adapter("https://example.com")
+        assert adapter._pool_connections == AtlassianAPI.default_pool_connections
+        assert adapter._pool_maxsize == AtlassianAPI.default_pool_maxsize
+        assert api.pool_maxsize == AtlassianAPI.default_pool_maxsize
+        assert adapter._pool_block is False
+        assert api._session.get_adapter("http://example.com") is adapter
+
+    def test_init_custom_pool(self):
+        api = AtlassianAPI(
+            url="https://example.com",
+            pool_connections=4,
+            pool_maxsize=64,
+            pool_block=True,
+        )
+        adapter = api._session.get_adapter("https://example.com")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
+        assert api.pool_maxsize == 64
+        assert adapter._pool_block is True
+
+    def test_init_custom_session_keeps_adapters(self):
+        custom_session = requests.Session()
+        adapter = custom_session.get_adapter("https://example.com")
+        api = AtlassianAPI(url="https://example.com", session=custom_session)
+        assert api._session.get_adapter("https://example.com") is adapter
+
+    def test_init_custom_session_with_pool_options(self):
+        custom_session = requests.Session()
+        api = AtlassianAPI(
+            url="https://example.com", session=custom_session, pool_maxsize=50
+        )
+        adapter = api._session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 50
+        assert api.pool_maxsize == 50
+        assert adapter._pool_connections == AtlassianAPI.default_pool_connections
+
+    def test_init_invalid_response_format(self):
+        with pytest.raises(ValueError):
+            AtlassianAPI(url="https://example.com", response_format="xml")
+
+    def test_get_response_format_dict(self):
+        api = AtlassianAPI(url="https://example.com", response_format="dict")
+        mock_response = MagicMock()
+        mock_response.text = '{"name": "test", "nested": {"x": 1}}'
+        api.request = MagicMock(return_value=mock_response)
+
+        result = api.get("/api/test")
+
+        assert result == {"name": "test", "nested": {"x": 1}}
+
+    def test_get_response_format_per_call(self):
+        api = AtlassianAPI(url="https://example.com")
+        mock_response = MagicMock()
+        mock_response.text = '{"name": "test"}'
+        mock_response.content = b'{"name": "test"}'
+        api.request = MagicMock(return_value=mock_response)
+
+        assert api.get("/api/test", response_format="dict") == {"name": "test"}
+        assert api.get("/api/test", response_format="raw") == b'{"name": "test"}'
+        assert isinstance(api.get("/api/test"), SimpleNamespace)
+
+    def test_get_response_format_lazy(self):
+        api = AtlassianAPI(url="https://example.com", response_format="lazy")
+        mock_response = MagicMock()
+        mock_response.text = '{"name": "test", "nested": {"x": [{"y": 1}]}}'
+        api.request = MagicMock(return_value=mock_response)
+
+        result = api.get("/api/test")
+
+        assert isinstance(result, LazyNamespace)
+        assert result.name == "test"
+        assert result.nested.x[0].y == 1
+
+    def test_get_response_format_raw_empty(self):
+        api = AtlassianAPI(url="https://example.com")
+        mock_response = MagicMock()
+        mock_response.content = b""
+        api.request = MagicMock(return_value=mock_response)
+
+        assert api.get("/api/test", response_format="raw") is None
+
+    def test_get_response_format_dict_not_json(self):
+        api = AtlassianAPI(url="https://example.com")
+        mock_response = MagicMock()
+        mock_response.text = "not json"
+        api.request = MagicMock(return_value=mock_response)
+
+        assert api.get("/api/test", response_format="dict") == "not json"
+
+    def test_get_invalid_response_format(self):
+        api = AtlassianAPI(url="https://example.com")
+        api.request = MagicMock(return_value=MagicMock())
+
+        with pytest.raises(ValueError):
+            api.get("/api/test", response_format="xml")
+
+    def test_get_with_http_cache_revalidates(self):
+        cache = HTTPCache()
+        api = AtlassianAPI(url="https://example.com", token="t", http_cache=cache)
+        fresh = self._response(200, {"ETag": '"v1"'}, text='{"key": "PROJ"}')
+        fresh.content = b'{"key": "PROJ"}'
+        api._session.request = MagicMock(
+            side_effect=[fresh, self._response(304, {}), self._response(304, {})]
+        )
+
+        first = api.get("/rest/api/2/project/PROJ", params={"expand": "lead"})
+        second = api.get(
+            "/rest/api/2/project/PROJ",
+            params={"expand": "lead"},
+            response_format="dict",
+        )
+        third = api.get("/rest/api/2/project/PROJ", params={"expand": "lead"})
+
+        assert first.key == third.key == "PROJ"
+        assert first is not third
+        assert second == {"key": "PROJ"}
+        calls = api._session.request.call_args_list
+        assert "headers" not in calls[0].kwargs
+        assert calls[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+    def test_get_with_http_cache_refetches_evicted_entry(self):
+        cache = HTTPCache()
+        api = AtlassianAPI(url="https://example.com", http_cache=cache)
+        fresh = self._response(200, {}, text='{"a": 1}')
+        api._session.request = MagicMock(side_effect=[self._response(304, {}), fresh])
+
+        assert api.get("/x", response_format="dict") == {"a": 1}
+        assert api._session.request.call_count == 2
+
+    def test_get_with_http_cache_keyed_by_identity(self):
+        cache = HTTPCache()
+        alice = AtlassianAPI(url="https://example.com", token="a", http_cache=cache)
+        bob = AtlassianAPI(url="https://example.com", token="b", http_cache=cache)
+        basic = AtlassianAPI(
+            url="https://example.com", username="u", password="p", http_cache=cache
+        )
+        assert len({alice._cache_identity(), bob._cache_identity()}) == 2
+        assert basic._cache_identity() != alice._cache_identity()
+
+    def test_map_preserves_order_and_collects_errors(self):
+        api = AtlassianAPI(url="https://example.com")
+
+        def lookup(key):
+            time.sleep(0.01 * (5 - int(key[-1])))
+            if key == "TEST-3":
+                raise APIError(404, "missing")
+            return key.lower()
+
+        results = api.map(lookup, [f"TEST-{i}" for i in range(1, 6)], max_workers=3)
+
+        assert results[:2] == ["test-1", "test-2"]
+        assert isinstance(results[2], APIError) and results[2].code == 404
+        assert results[3:] == ["test-4", "test-5"]
+
+    def test_map_by_name_unpacks_tuples(self):
+        api = AtlassianAPI(url="https://example.com")
+        api.post = MagicMock(side_effect=lambda path, json=None: {"path": path})
+
+        results = api.map("post", [("/a",), "/b", ("/c", {"x": 1})])
+
+        assert [r["path"] for r in results] == ["/a", "/b", "/c"]
+        api.post.assert_any_call("/c", {"x": 1})
+
+    def test_map_limits_concurrency(self):
+        api = AtlassianAPI(url="https://example.com", pool_maxsize=4)
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def work(item):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.005)
+            with lock:
+                active[0] -= 1
+            return item
+
+        assert api.pool_maxsize == 4
+        assert api.map(work, range(40)) == list(range(40))
+        assert active[1] <= 4
+
+    def test_map_uses_rate_limiter(self):
+        limiter = MagicMock()
+        api = AtlassianAPI(url="https://example.com", rate_limiter=limiter)
+        api._session.request = MagicMock(
+            return_value=MagicMock(status_code=200, text="{}")
+        )
+
+        api.map("get", ["/a", "/b", "/c"], max_workers=2)
+
+        assert limiter.acquire.call_count == 3
+
+    def test_map_propagates_other_errors(self):
+        api = AtlassianAPI(url="https://example.com")
+
+        def fail(item):
+            raise RuntimeError(item)
+
+        with pytest.raises(RuntimeError):
+            api.map(fail, [1, 2], max_workers=1)
+
+    def test_map_invalid_workers(self):
+        api = AtlassianAPI(url="https://example.com")
+        with pytest.raises(ValueError):
+            api.map(str, [1], max_workers=0)
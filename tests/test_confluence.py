@@ -218,3 +218,91 @@ class TestConfluence:
                 },
             },
         )
+
+
+TREE = {"1": ["2", "3"], "2": ["4", "5", "6"], "3": [], "4": ["7"]}
+
+
+class TestWalkPageTree:
+    @pytest.fixture
+    def confluence(self):
+        confluence = Confluence(url="https://fake_url")
+        confluence.requests = []
+
+        def page(page_id, expand):
+            data = {"id": page_id, "title": f"Page {page_id}"}
+            if "version" in expand.split(","):
+                data["version"] = {"number": 1}
+            if "children.page" in expand.split(","):
+                children = TREE.get(page_id, [])
+                data["children"] = {
+                    "page": {"results": [{"id": c} for c in children[:1]]}
+                }
+            return data
+
+        def get(url, params=None, response_format=None):
+            assert response_format == "dict"
+            confluence.requests.append((url, dict(params)))
+            parts = url.strip("/").split("/")
+            if parts[-1] != "page":
+                return page(parts[-1], params["expand"])
+            children = TREE.get(parts[-3], [])
+            start, limit = params["start"], min(params["limit"], 2)
+            results = [
+                page(c, params.get("expand", "")) for c in children[start:][:limit]
+            ]
+            links = {"next": "/next"} if start + limit < len(children) else {}
+            return {"results": results, "size": len(results), "_links": links}
+
+        confluence.get = MagicMock(side_effect=get)
+        return confluence
+
+    def listed(self, confluence):
+        return sorted(
+            url.split("/")[-3] for url, _ in confluence.requests if "child" in url
+        )
+
+    def test_walk_page_tree(self, confluence):
+        walked = list(confluence.walk_page_tree("1", max_workers=3))
+        depths = {page["id"]: depth for depth, page in walked}
+        assert depths == {"1": 0, "2": 1, "3": 1, "4": 2, "5": 2, "6": 2, "7": 3}
+        assert walked[0][0] == 0
+        order = [page["id"] for _, page in walked]
+        assert order.index("2") < order.index("4") < order.index("7")
+        assert order.index("4") < order.index("5") < order.index("6")
+        assert self.listed(confluence) == ["1", "2", "2", "4"]
+
+    def test_walk_page_tree_expand(self, confluence):
+        walked = list(confluence.walk_page_tree("1", expand=["version"]))
+        assert all(page["version"] == {"number": 1} for _, page in walked)
+        expands = {params.get("expand") for _, params in confluence.requests}
+        assert expands == {"version,children.page"}
+
+    def test_walk_page_tree_max_depth(self, confluence):
+        walked = list(confluence.walk_page_tree(1, max_depth=1, include_root=False))
+        assert sorted(page["id"] for _, page in walked) == ["2", "3"]
+        assert {depth for depth, _ in walked} == {1}
+        assert self.listed(confluence) == ["1"]
+
+    def test_walk_page_tree_leaf_root(self, confluence):
+        assert list(confluence.walk_page_tree("3"))[0][1]["id"] == "3"
+        assert self.listed(confluence) == []
+
+    def test_walk_page_tree_stops_on_close(self, confluence):
+        walk = confluence.walk_page_tree("1", max_workers=1)
+        assert next(walk)[1]["id"] == "1"
+        assert next(walk)[1]["id"] == "2"
+        walk.close()
+        assert self.listed(confluence) == ["1"]
+
+    def test_walk_page_tree_invalid_max_workers(self, confluence):
+        with pytest.raises(ValueError):
+            next(confluence.walk_page_tree("1", max_workers=0))
+
+    def test_iter_child_pages(self, confluence):
+        children = list(confluence.iter_child_pages("2", expand="version"))
+        assert [child["id"] for child in children] == ["4", "5", "6"]
+        assert [params for _, params in confluence.requests] == [
+            {"start": 0, "limit": 100, "expand": "version"},
+            {"start": 2, "limit": 100, "expand": "version"},
+        ]
@@ -0,0 +1,124 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from atlassian.bitbucket import Bitbucket
+from atlassian.crawler import StageStats
+from atlassian.error import APIError
+
+PROJECTS = {"A": ["a1", "a2"], "B": ["b1"], "C": []}
+
+
+def page(values):
+    return {"values": values, "isLastPage": True}
+
+
+class TestRepositoryCrawler:
+    @pytest.fixture
+    def bitbucket(self):
+        bitbucket = Bitbucket(url="https://fake_url")
+        lock = threading.Lock()
+        bitbucket.requests = []
+
+        def get(url, params=None, response_format=None):
+            assert response_format == "dict"
+            with lock:
+                bitbucket.requests.append(url)
+            parts = url.strip("/").split("/")
+            if parts[-1] == "projects":
+                return page([{"key": key} for key in PROJECTS])
+            if parts[-1] == "repos":
+                if parts[-2] not in PROJECTS:
+                    raise APIError(404, "no project")
+                return page([{"slug": slug} for slug in PROJECTS[parts[-2]]])
+            if parts[-2] == "b1" and parts[-1] == "tags":
+                raise APIError(403, "forbidden")
+            return page([{"id": f"{parts[-2]}-{parts[-1]}"}])
+
+        bitbucket.get = MagicMock(side_effect=get)
+        return bitbucket
+
+    def test_crawl(self, bitbucket):
+        crawler = bitbucket.crawl_repositories(max_workers=3)
+        records = {r["slug"]: r for r in crawler}
+        assert set(records) == {"a1", "a2", "b1"}
+        assert records["a1"]["project"] == "A"
+        assert records["a1"]["repo"] == {"slug": "a1"}
+        assert records["a1"]["branches"] == [{"id": "a1-branches"}]
+        assert records["a1"]["tags"] == [{"id": "a1-tags"}]
+        assert records["b1"]["tags"] == []
+        assert records["b1"]["errors"]["tags"].code == 403
+        assert len(bitbucket.requests) == 1 + 3 + 3 * 2
+        stats = crawler.stats
+        assert (stats["projects"].calls, stats["projects"].items) == (1, 3)
+        assert (stats["repos"].calls, stats["repos"].items) == (3, 3)
+        assert (stats["tags"].calls, stats["tags"].errors) == (3, 1)
+        assert "throughput" in repr(stats["branches"])
+
+    def test_crawl_without_listings(self, bitbucket):
+        crawler = bitbucket.crawl_repositories(
+            projects=["A"], branches=False, tags=False
+        )
+        assert sorted(r["slug"] for r in crawler) == ["a1", "a2"]
+        assert bitbucket.requests == ["/rest/api/latest/projects/A/repos/"]
+
+    def test_checkpoint_resume(self, bitbucket, tmp_path):
+        checkpoint = tmp_path / "crawl.jsonl"
+        crawler = bitbucket.crawl_repositories(max_workers=1, checkpoint=checkpoint)
+        consumed = []
+        for record in crawler:
+            consumed.append(record["slug"])
+            if len(consumed) == 2:
+                break
+        entries = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+        assert entries == [{"repo": ["A", consumed[0]]}]
+
+        with open(checkpoint, "a") as f:
+            f.write('{"repo": ["B", "b')
+        crawler = bitbucket.crawl_repositories(checkpoint=checkpoint)
+        resumed = sorted(r["slug"] for r in crawler)
+        assert resumed == sorted({"a1", "a2", "b1"} - {consumed[0]})
+        assert crawler.stats["repos"].calls == 3
+        assert crawler.stats["branches"].calls == 2
+
+        crawler = bitbucket.crawl_repositories(checkpoint=checkpoint)
+        assert list(crawler) == []
+        assert crawler.stats["repos"].calls == 0
+
+    def test_project_listing_error(self, bitbucket):
+        crawler = bitbucket.crawl_repositories(projects=["A", "X"])
+        records = list(crawler)
+        assert sorted(r["slug"] for r in records if r["slug"]) == ["a1", "a2"]
+        (failed,) = [r for r in records if r["slug"] is None]
+        assert failed["project"] == "X" and failed["repo"] is None
+        assert isinstance(failed["errors"]["repos"], APIError)
+        assert crawler.stats["repos"].errors == 1
+
+    def test_project_listing_error_is_not_checkpointed(self, bitbucket, tmp_path):
+        checkpoint = tmp_path / "crawl.jsonl"
+        crawler = bitbucket.crawl_repositories(
+            projects=["A", "X"], checkpoint=checkpoint
+        )
+        list(crawler)
+        entries = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+        assert {"project": "A"} in entries
+        assert {"project": "X"} not in entries
+
+        crawler = bitbucket.crawl_repositories(
+            projects=["A", "X"], checkpoint=checkpoint
+        )
+        assert [r["project"] for r in crawler] == ["X"]
+        assert crawler.stats["repos"].calls == 1
+
+    def test_invalid_max_workers(self, bitbucket):
+        with pytest.raises(ValueError):
+            bitbucket.crawl_repositories(max_workers=0)
+
+    def test_stage_stats(self):
+        stats = StageStats("repos")
+        assert stats.throughput == 0.0
+        stats.record(0.0, 10)
+        assert stats.calls == 1 and stats.items == 10
+        assert stats.throughput > 0
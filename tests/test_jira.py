@@ -1,6 +1,11 @@
+import json as json_module
+import time
+
 import pytest
 from types import SimpleNamespace
 from unittest.mock import MagicMock
+from atlassian.cache import TTLCache
+from atlassian.error import APIError
 from atlassian.jira import Jira
 
 
@@ -146,6 +151,155 @@ class TestJira:
         assert kwargs["json"]["fields"] == fields
         assert kwargs["json"]["update"] == update
 
+    @staticmethod
+    def _bulk_post(path, json):
+        created, errors = [], []
+        for index, update in enumerate(json["issueUpdates"]):
+            summary = update["fields"]["summary"]
+            if summary.startswith("bad"):
+                errors.append(
+                    {
+                        "status": 400,
+                        "failedElementNumber": index,
+                        "elementErrors": {
+                            "errorMessages": [],
+                            "errors": {"summary": f"{summary} is invalid"},
+                        },
+                    }
+                )
+            else:
+                created.append({"id": summary, "key": f"PROJ-{summary}"})
+        if not created:
+            raise APIError(400, json_module.dumps({"issues": [], "errors": errors}))
+        return {"issues": created, "errors": errors}
+
+    def test_create_issues_bulk(self, jira):
+        jira.post = MagicMock(side_effect=self._bulk_post)
+        summaries = ["1", "bad-2", "3", "bad-4", "bad-5", "6", "7"]
+        issues = [{"project": {"key": "PROJ"}, "summary": s} for s in summaries]
+
+        results = jira.create_issues_bulk(issues, chunk_size=2, max_workers=3)
+
+        assert jira.post.call_count == 4
+        assert jira.post.call_args.args[0] == "/rest/api/2/issue/bulk"
+        assert [r["key"] for r in results if isinstance(r, dict)] == [
+            "PROJ-1",
+            "PROJ-3",
+            "PROJ-6",
+            "PROJ-7",
+        ]
+        for index in (1, 3, 4):
+            assert isinstance(results[index], APIError)
+            assert results[index].code == 400
+            assert results[index].message == (f"summary: {summaries[index]} is invalid")
+
+    def test_create_issues_bulk_request_failure(self, jira):
+        jira.post = MagicMock(side_effect=[APIError(503, "down"), {"issues": [{}]}])
+        results = jira.create_issues_bulk(
+            [{"summary": "a"}, {"summary": "b"}, {"summary": "c"}],
+            chunk_size=2,
+            max_workers=1,
+        )
+        assert [getattr(r, "code", None) for r in results] == [503, 503, None]
+        assert results[2] == {}
+
+    def test_create_issues_bulk_with_update(self, jira):
+        jira.post = MagicMock(return_value={"issues": [{"key": "A"}, {"key": "B"}]})
+        update = {"worklog": [{"add": {"timeSpent": "1h"}}]}
+        results = jira.create_issues_bulk(
+            [{"fields": {"summary": "a"}, "update": update}, {"summary": "b"}]
+        )
+        payload = jira.post.call_args.kwargs["json"]["issueUpdates"]
+        assert payload == [
+            {"fields": {"summary": "a"}, "update": update},
+            {"fields": {"summary": "b"}},
+        ]
+        assert results == [{"key": "A"}, {"key": "B"}]
+        assert jira.bulk_create_chunk_size == 50
+
+    def test_create_issues_bulk_invalid_chunk_size(self, jira):
+        with pytest.raises(ValueError):
+            jira.create_issues_bulk([{"summary": "a"}], chunk_size=0)
+
+    def test_edit_merges_into_one_put(self, jira):
+        with jira.edit("TEST-1") as edit:
+            edit.update_issue_label(add_labels=["a"], remove_labels=["b"])
+            edit.update_issue_label(add_labels=["c"])
+            edit.update_issue_component(add_components=["API"])
+            edit.update_issue_description("new")
+            edit.update_custom_field("customfield_1", 3)
+        jira.put.assert_called_once_with(
+            "/rest/api/2/issue/TEST-1",
+            json={
+                "fields": {"description": "new", "customfield_1": 3},
+                "update": {
+                    "labels": [{"remove": "b"}, {"add": "a"}, {"add": "c"}],
+                    "components": [{"add": {"name": "API"}}],
+                },
+            },
+        )
+        assert edit.response is jira.put.return_value
+
+    def test_edit_field_in_fields_and_update(self, jira):
+        with jira.edit("TEST-1") as edit:
+            edit.set_field("labels", ["x"])
+            edit.update_issue_label(add_labels=["y"])
+            edit.set_field("labels", ["z"])
+        assert jira.put.call_args.kwargs["json"] == {
+            "update": {"labels": [{"set": ["x"]}, {"add": "y"}, {"set": ["z"]}]}
+        }
+
+    def test_edit_discarded_on_error(self, jira):
+        with pytest.raises(RuntimeError):
+            with jira.edit("TEST-1") as edit:
+                edit.update_issue_description("new")
+                raise RuntimeError
+        jira.put.assert_not_called()
+
+    def test_edit_without_changes(self, jira):
+        with jira.edit("TEST-1") as edit:
+            pass
+        jira.put.assert_not_called()
+        assert edit.response is None
+
+    def test_buffered_edits(self, jira):
+        def put(path, json):
+            if path.endswith("BAD-1"):
+                raise APIError(400, "rejected")
+            return {"path": path}
+
+        jira.put = MagicMock(side_effect=put)
+        with jira.buffered_edits(max_workers=2) as edits:
+            edits.update_issue_label("TEST-1", add_labels=["a"])
+            edits.update_field("TEST-2", "fixVersions", add="1.0")
+            edits.update_issue_label("TEST-1", add_labels=["b"])
+            edits.update_issue_description("BAD-1", "x")
+            assert len(edits) == 3
+            assert edits.pending()["TEST-1"] == {
+                "update": {"labels": [{"add": "a"}, {"add": "b"}]}
+            }
+        assert jira.put.call_count == 3
+        assert len(edits) == 0
+
+    def test_buffered_edits_flush_results(self, jira):
+        jira.put = MagicMock(side_effect=[{"ok": 1}, APIError(409, "conflict")])
+        edits = jira.buffered_edits(max_workers=1)
+        edits.update_issue_description("TEST-1", "a")
+        edits.update_issue_component("TEST-2", remove_components=["UI"])
+        results = edits.flush()
+        assert list(results) == ["TEST-1", "TEST-2"]
+        assert results["TEST-1"] == {"ok": 1}
+        assert results["TEST-2"].code == 409
+        assert edits.flush() == {}
+
+    def test_buffered_edits_discarded_on_error(self, jira):
+        with pytest.raises(RuntimeError):
+            with jira.buffered_edits() as edits:
+                edits.update_issue_description("TEST-1", "a")
+                raise RuntimeError
+        jira.put.assert_not_called()
+        assert len(edits) == 0
+
     def test_create_task(self, jira):
         with pytest.warns(DeprecationWarning, match="create_task"):
             jira.create_task(
@@ -241,6 +395,116 @@ class TestJira:
         jira.get_transitions("TEST-11")
         jira.get.assert_called_with("/rest/api/2/issue/TEST-11/transitions")
 
+    @staticmethod
+    def _workflow_issue(key, status="1", issuetype="10"):
+        return {
+            "key": key,
+            "fields": {
+                "project": {"id": "100"},
+                "issuetype": {"id": issuetype},
+                "status": {"id": status},
+            },
+        }
+
+    TRANSITIONS = {
+        "transitions": [
+            {"id": "11", "name": "Start", "to": {"name": "In Progress"}},
+            {"id": "31", "name": "Close", "to": {"name": "Done"}},
+        ]
+    }
+
+    def test_transition_issue_by_name(self, jira):
+        jira.get = MagicMock(
+            return_value=dict(self._workflow_issue("TEST-1"), **self.TRANSITIONS)
+        )
+        jira.transition_issue_by_name("TEST-1", "close")
+        jira.get.assert_called_once_with(
+            "/rest/api/2/issue/TEST-1",
+            params={"fields": "project,issuetype,status", "expand": "transitions"},
+            response_format="dict",
+        )
+        jira.post.assert_called_with(
+            "/rest/api/2/issue/TEST-1/transitions", json={"transition": {"id": "31"}}
+        )
+        jira.transition_issue_by_name(self._workflow_issue("TEST-2"), "In Progress")
+        assert jira.get.call_count == 1
+        jira.post.assert_called_with(
+            "/rest/api/2/issue/TEST-2/transitions", json={"transition": {"id": "11"}}
+        )
+
+    def test_transition_issue_by_name_unknown(self, jira):
+        jira.get = MagicMock(
+            return_value=dict(self._workflow_issue("TEST-1"), **self.TRANSITIONS)
+        )
+        with pytest.raises(ValueError, match="available: close, done"):
+            jira.transition_issue_by_name("TEST-1", "Reopen")
+        jira.post.assert_not_called()
+
+    def test_transition_issue_by_name_empty_response(self, jira):
+        jira.get = MagicMock(return_value=None)
+        with pytest.raises(ValueError, match="TEST-1"):
+            jira.transition_issue_by_name("TEST-1", "close")
+        jira.post.assert_not_called()
+
+    def test_transition_issue_by_name_stale_cache(self, jira):
+        jira.get = MagicMock(
+            return_value={"transitions": [{"id": "41", "name": "Close"}]}
+        )
+        jira.post = MagicMock(side_effect=[APIError(400, "invalid"), None])
+        jira._remember_transitions(("100", "10", "1"), self.TRANSITIONS["transitions"])
+        jira.transition_issue_by_name(self._workflow_issue("TEST-1"), "Close")
+        jira.get.assert_called_once_with(
+            "/rest/api/2/issue/TEST-1/transitions", response_format="dict"
+        )
+        assert jira.post.call_args.kwargs["json"] == {"transition": {"id": "41"}}
+        jira.clear_transition_cache()
+        assert jira._cached_transition_id(("100", "10", "1"), "Close") is None
+
+    def test_transition_issues_by_name(self, jira):
+        jira.transition_lookup_chunk_size = 2
+        states = {
+            "TEST-1": self._workflow_issue("TEST-1"),
+            "TEST-2": self._workflow_issue("TEST-2", status="2"),
+            "TEST-3": self._workflow_issue("TEST-3"),
+        }
+
+        def search(path, json):
+            assert json["validateQuery"] == "warn"
+            keys = [k.strip('"') for k in json["jql"][len("key in (") : -1].split(", ")]
+            return {"issues": [states[k] for k in keys if k in states]}
+
+        def post(path, json):
+            if path == "/rest/api/2/search":
+                return search(path, json)
+            if "TEST-3" in path:
+                raise APIError(403, "forbidden")
+            return {"path": path}
+
+        def get(path, response_format):
+            if "TEST-2" in path:
+                return {"transitions": [{"id": "5", "name": "Reopen"}]}
+            return self.TRANSITIONS
+
+        jira.get = MagicMock(side_effect=get)
+        jira.post = MagicMock(side_effect=post)
+        results = jira.transition_issues_by_name(
+            ["test-1", "TEST-2", "TEST-3", "TEST-9", self._workflow_issue("TEST-4")],
+            "Close",
+            max_workers=2,
+        )
+        assert jira.get.call_count == 2
+        assert results[0] == {"path": "/rest/api/2/issue/TEST-1/transitions"}
+        assert isinstance(results[1], ValueError)
+        assert results[2].code == 403
+        assert results[3].code == 404
+        assert results[4] == {"path": "/rest/api/2/issue/TEST-4/transitions"}
+
+    def test_issue_states_payload_quotes_keys(self, jira):
+        payload = jira._issue_states_payload(["TEST-1", 'X") OR key in ("Y', "a\\b"])
+        assert payload["jql"] == (
+            'key in ("TEST-1", "X\\") OR key in (\\"Y", "a\\\\b")'
+        )
+
     def test_search_issue_with_jql(self, jira):
         jira.post = MagicMock(
             return_value={
@@ -271,6 +535,88 @@ class TestJira:
         args, kwargs = jira.post.call_args
         assert kwargs["json"]["fields"] == custom_fields
 
+    FIELDS = [
+        {"id": "summary", "name": "Summary", "custom": False},
+        {"id": "customfield_10002", "name": "Story Points", "custom": True},
+        {"id": "customfield_10100", "name": "Team", "custom": True},
+        {"id": "customfield_10101", "name": "Team", "custom": True},
+    ]
+
+    def test_search_issue_with_jql_field_ids_skip_metadata(self, jira):
+        jira.post = MagicMock(return_value={"total": 0, "maxResults": 50})
+        fields = ["summary", "-fixVersions", "customfield_1", "*navigable"]
+        jira.search_issue_with_jql("project=TEST", fields=fields)
+        jira.get.assert_not_called()
+        assert jira.post.call_args.kwargs["json"]["fields"] == fields
+
+    def test_search_issue_with_jql_field_names(self, jira):
+        jira.get = MagicMock(return_value=self.FIELDS)
+        jira.post = MagicMock(return_value={"total": 0, "maxResults": 50})
+        jira.search_issue_with_jql(
+            "project=TEST", fields=["summary", "story points", "-Summary", "Gone"]
+        )
+        jira.search_issue_with_jql("project=TEST", fields=["Story Points"])
+        jira.get.assert_called_once_with("/rest/api/2/field")
+        assert jira.post.call_args_list[0].kwargs["json"]["fields"] == [
+            "summary",
+            "customfield_10002",
+            "-summary",
+            "Gone",
+        ]
+        assert jira.post.call_args.kwargs["json"]["fields"] == ["customfield_10002"]
+
+    def test_search_issue_with_jql_fields_ignore_loaded_registry(self, jira):
+        jira.get = MagicMock(
+            return_value=self.FIELDS
+            + [{"id": "customfield_10001", "name": "Sprint", "custom": True}]
+        )
+        jira.post = MagicMock(return_value={"total": 0, "maxResults": 50})
+        fields = ["sprint", "Story Points"]
+        jira.search_issue_with_jql("project=TEST", fields=["sprint"])
+        jira.get.assert_not_called()
+        jira.search_issue_with_jql("project=TEST", fields=fields)
+        jira.search_issue_with_jql("project=TEST", fields=["sprint"])
+        sent = [c.kwargs["json"]["fields"] for c in jira.post.call_args_list]
+        assert sent == [["sprint"], ["sprint", "customfield_10002"], ["sprint"]]
+
+    def test_field_registry(self, jira):
+        jira.get = MagicMock(return_value=self.FIELDS)
+        registry = jira.field_registry()
+        assert jira.field_registry() is registry
+        assert len(registry) == 4
+        assert "Story Points" in registry
+        assert registry.get("summary")["name"] == "Summary"
+        assert registry.get("nope") is None
+        assert jira.field_id("customfield_10100") == "customfield_10100"
+        with pytest.raises(ValueError, match="ambiguous"):
+            jira.field_id("Team")
+        with pytest.raises(ValueError, match="Unknown"):
+            jira.field_id("nope")
+        assert jira.resolve_fields({"Summary": "s", "story points": 3}) == {
+            "summary": "s",
+            "customfield_10002": 3,
+        }
+        jira.clear_field_registry()
+        assert jira.field_registry() is not registry
+        jira.field_registry(refresh=True)
+        assert jira.get.call_count == 3
+
+    def test_field_registry_reuses_cached_get_fields(self, jira):
+        jira.metadata_cache = TTLCache()
+        jira.get = MagicMock(
+            return_value=[SimpleNamespace(**field) for field in self.FIELDS]
+        )
+        assert jira.get_fields()[0].name == "Summary"
+        registry = jira.field_registry()
+        assert registry.get("Story Points") == self.FIELDS[1]
+        jira.get.assert_called_once_with("/rest/api/2/field")
+        jira.field_registry(refresh=True)
+        assert jira.get.call_count == 2
+
+    def test_get_fields(self, jira):
+        jira.get_fields()
+        jira.get.assert_called_with("/rest/api/2/field")
+
     def test_search_issue_with_jql_pagination(self, jira):
         # Mock response that requires pagination
         responses = [
@@ -294,6 +640,112 @@ class TestJira:
         result = jira.search_issue_with_jql("project=NONE")
         assert result == []
 
+    def test_iter_issues_with_jql_is_lazy(self, jira):
+        responses = [
+            {"total": 3, "maxResults": 2, "issues": [{"key": "T-0"}, {"key": "T-1"}]},
+            {"total": 3, "maxResults": 2, "issues": [{"key": "T-2"}]},
+        ]
+        jira.post = MagicMock(side_effect=responses)
+
+        issues = jira.iter_issues_with_jql("project=TEST", max_result=2)
+        assert jira.post.call_count == 0
+        assert next(issues) == {"key": "T-0"}
+        assert next(issues) == {"key": "T-1"}
+        assert jira.post.call_count == 1
+        assert list(issues) == [{"key": "T-2"}]
+        assert jira.post.call_args.kwargs["json"]["startAt"] == 2
+
+    def test_iter_issues_with_jql_pages(self, jira):
+        responses = [
+            {"total": 3, "maxResults": 2, "issues": [{"key": "T-0"}, {"key": "T-1"}]},
+            {"total": 3, "maxResults": 2, "issues": [{"key": "T-2"}]},
+        ]
+        jira.post = MagicMock(side_effect=responses)
+
+        pages = list(jira.iter_issues_with_jql("project=TEST", pages=True))
+        assert pages == [[{"key": "T-0"}, {"key": "T-1"}], [{"key": "T-2"}]]
+
+    def test_iter_issues_with_jql_empty_response(self, jira):
+        jira.post = MagicMock(return_value=None)
+        assert list(jira.iter_issues_with_jql("project=NONE")) == []
+
+    def test_iter_issues_with_jql_zero_page_size(self, jira):
+        jira.post = MagicMock(return_value={"total": 5, "maxResults": 0, "issues": []})
+        assert list(jira.iter_issues_with_jql("project=TEST")) == []
+        assert jira.post.call_count == 1
+
+    @staticmethod
+    def _paged_search(total, page_size, delays=None):
+        def post(url, json):
+            start = json["startAt"]
+            if delays:
+                time.sleep(delays.get(start, 0))
+            return {
+                "total": total,
+                "maxResults": page_size,
+                "issues": [
+                    {"key": f"T-{i}"}
+                    for i in range(start, min(start + page_size, total))
+                ],
+            }
+
+        return post
+
+    def test_iter_issues_with_jql_concurrent_ordered(self, jira):
+        jira.post = MagicMock(
+            side_effect=self._paged_search(10, 2, delays={2: 0.05, 4: 0.01})
+        )
+
+        result = list(jira.iter_issues_with_jql("project=TEST", concurrency=4))
+
+        assert [issue["key"] for issue in result] == [f"T-{i}" for i in range(10)]
+        assert jira.post.call_count == 5
+        starts = sorted(c.kwargs["json"]["startAt"] for c in jira.post.call_args_list)
+        assert starts == [0, 2, 4, 6, 8]
+
+    def test_iter_issues_with_jql_concurrent_unordered(self, jira):
+        jira.post = MagicMock(side_effect=self._paged_search(6, 2, delays={2: 0.1}))
+
+        pages = list(
+            jira.iter_issues_with_jql(
+                "project=TEST", pages=True, concurrency=2, ordered=False
+            )
+        )
+
+        assert pages[0] == [{"key": "T-0"}, {"key": "T-1"}]
+        assert pages[-1] == [{"key": "T-2"}, {"key": "T-3"}]
+        assert sorted(i["key"] for page in pages for i in page) == [
+            f"T-{i}" for i in range(6)
+        ]
+
+    def test_iter_issues_with_jql_concurrent_early_close(self, jira):
+        jira.post = MagicMock(side_effect=self._paged_search(100, 1))
+
+        issues = jira.iter_issues_with_jql("project=TEST", concurrency=3)
+        assert next(issues) == {"key": "T-0"}
+        assert next(issues) == {"key": "T-1"}
+        issues.close()
+
+        assert jira.post.call_count <= 5
+
+    def test_iter_issues_with_jql_concurrent_error(self, jira):
+        search = self._paged_search(6, 2)
+
+        def post(url, json):
+            if json["startAt"] == 4:
+                raise APIError(500, "boom")
+            return search(url, json)
+
+        jira.post = MagicMock(side_effect=post)
+
+        with pytest.raises(APIError):
+            jira.search_issue_with_jql("project=TEST", concurrency=2)
+
+    def test_iter_issues_with_jql_invalid_concurrency(self, jira):
+        with pytest.raises(ValueError):
+            jira.iter_issues_with_jql("project=TEST", concurrency=0)
+        jira.post.assert_not_called()
+
     def test_get_project_components(self, jira):
         jira.get_project_components("PROJ")
         jira.get.assert_called_with("/rest/api/2/project/PROJ/components")
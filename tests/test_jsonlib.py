@@ -0,0 +1,80 @@
+import datetime
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from atlassian import jsonlib
+
+
+@pytest.fixture
+def restore_backend():
+    backend = jsonlib.BACKEND
+    yield
+    jsonlib.use_backend(backend)
+
+
+class TestJsonlib:
+    def test_use_backend_stdlib(self, restore_backend):
+        assert jsonlib.use_backend("json") == "json"
+        assert jsonlib.BACKEND == "json"
+        assert jsonlib.dumps({"a": [1, "é"]}) == json.dumps({"a": [1, "é"]}).encode()
+        assert jsonlib.loads('{"a": 1}') == {"a": 1}
+
+    def test_use_backend_orjson(self, restore_backend):
+        pytest.importorskip("orjson")
+        assert jsonlib.use_backend("orjson") == "orjson"
+        assert json.loads(jsonlib.dumps({"a": [1, "é"]})) == {"a": [1, "é"]}
+        assert jsonlib.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_use_backend_autodetect(self, restore_backend):
+        assert jsonlib.use_backend() in jsonlib.BACKENDS
+
+    def test_use_backend_invalid(self, restore_backend):
+        with pytest.raises(ValueError):
+            jsonlib.use_backend("yaml")
+
+    def test_dumps_falls_back_for_unsupported_input(self, restore_backend):
+        jsonlib.use_backend()
+        assert json.loads(jsonlib.dumps({1: "a"})) == {"1": "a"}
+
+    def test_dumps_rejects_nan(self, restore_backend):
+        jsonlib.use_backend("json")
+        with pytest.raises(ValueError):
+            jsonlib.dumps(float("nan"))
+
+    def test_dumps_rejects_nan_on_orjson(self, restore_backend):
+        pytest.importorskip("orjson")
+        jsonlib.use_backend("orjson")
+        with pytest.raises(ValueError):
+            jsonlib.dumps({"a": float("nan")})
+        with pytest.raises(ValueError):
+            jsonlib.dumps([1, float("inf")])
+
+    def test_dumps_rejects_datetime_on_orjson(self, restore_backend):
+        pytest.importorskip("orjson")
+        jsonlib.use_backend("orjson")
+        with pytest.raises(TypeError):
+            jsonlib.dumps({"due": datetime.date(2024, 1, 2)})
+        with pytest.raises(TypeError):
+            jsonlib.dumps([datetime.datetime(2024, 1, 2, 3, 4)])
+
+    def test_dumps_matches_stdlib_on_orjson(self, restore_backend):
+        pytest.importorskip("orjson")
+        jsonlib.use_backend("orjson")
+        payload = {"a": [1, 2.5, True, None, ("x", "é")], "b": {"c": 10**30}}
+        assert json.loads(jsonlib.dumps(payload)) == json.loads(json.dumps(payload))
+
+    def test_dumps_not_serializable(self):
+        with pytest.raises(TypeError):
+            jsonlib.dumps(object())
+
+    def test_loads_object_hook(self):
+        result = jsonlib.loads(
+            '{"a": {"b": 1}}', object_hook=lambda d: SimpleNamespace(**d)
+        )
+        assert result.a.b == 1
+
+    def test_loads_invalid(self):
+        with pytest.raises(ValueError):
+            jsonlib.loads("not json")
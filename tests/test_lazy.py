@@ -0,0 +1,93 @@
+import copy
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from atlassian.lazy import LazyNamespace, wrap
+
+
+class TestLazyNamespace:
+    @pytest.fixture
+    def view(self):
+        return wrap(
+            {
+                "id": 1,
+                "toRef": {"displayId": "main", "repository": {"slug": "repo"}},
+                "reviewers": [{"user": {"name": "alice"}}, "bot"],
+                "labels": ["a", "b"],
+            }
+        )
+
+    def test_attribute_access(self, view):
+        assert isinstance(view, LazyNamespace)
+        assert view.id == 1
+        assert view.toRef.displayId == "main"
+        assert view.toRef.repository.slug == "repo"
+
+    def test_lists(self, view):
+        assert view.reviewers[0].user.name == "alice"
+        assert view.reviewers[1] == "bot"
+        assert view.labels == ["a", "b"]
+
+    def test_children_are_cached(self, view):
+        assert view.toRef is view.toRef
+        assert view.reviewers is view.reviewers
+
+    def test_children_built_on_access(self, view):
+        assert object.__getattribute__(view, "_cache") == {}
+        view.toRef
+        assert list(object.__getattribute__(view, "_cache")) == ["toRef"]
+
+    def test_missing_attribute(self, view):
+        with pytest.raises(AttributeError):
+            view.missing
+        assert getattr(view, "missing", None) is None
+        assert not hasattr(view, "missing")
+
+    def test_read_only(self, view):
+        with pytest.raises(AttributeError):
+            view.id = 2
+        with pytest.raises(AttributeError):
+            del view.id
+
+    def test_dir_and_vars(self, view):
+        assert dir(view) == ["id", "labels", "reviewers", "toRef"]
+        attributes = vars(view)
+        assert attributes["id"] == 1
+        assert attributes["toRef"].displayId == "main"
+
+    def test_equality_and_repr(self, view):
+        assert wrap({"a": 1}) == wrap({"a": 1})
+        assert wrap({"a": 1}) != wrap({"a": 2})
+        assert repr(wrap({"a": 1})) == "LazyNamespace(a=1)"
+
+    def test_not_equal_to_namespace(self):
+        assert wrap({"a": 1}) != SimpleNamespace(a=1)
+
+    def test_copy_and_pickle(self, view):
+        shallow = copy.copy(view)
+        assert shallow == view and shallow._asdict() is view._asdict()
+        deep = copy.deepcopy(view)
+        assert deep == view and deep._asdict() is not view._asdict()
+        assert deep.toRef.repository.slug == "repo"
+        restored = pickle.loads(pickle.dumps(view))
+        assert restored == view
+        assert restored.reviewers[0].user.name == "alice"
+
+    def test_underscore_keys(self):
+        view = wrap({"_links": {"next": "/next"}})
+        assert view._links.next == "/next"
+        with pytest.raises(AttributeError):
+            view.__missing__
+
+    def test_asdict(self):
+        data = {"a": {"b": 1}}
+        assert wrap(data)._asdict() is data
+
+    def test_wrap_scalars_and_lists(self):
+        assert wrap(3) == 3
+        assert wrap(None) is None
+        items = wrap([{"a": 1}, [{"b": 2}]])
+        assert items[0].a == 1
+        assert items[1][0].b == 2
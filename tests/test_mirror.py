@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from atlassian.jira import Jira
+
+
+def issue(issue_id, updated, status="Open", labels=(), assignee="alice"):
+    return {
+        "id": issue_id,
+        "key": f"P-{issue_id}",
+        "fields": {
+            "project": {"key": "P"},
+            "issuetype": {"name": "Bug"},
+            "status": {"name": status},
+            "assignee": {"name": assignee} if assignee else None,
+            "labels": list(labels),
+            "updated": updated,
+        },
+    }
+
+
+class TestJiraMirror:
+    @pytest.fixture
+    def jira(self):
+        jira = Jira(url="https://fake_url")
+        jira.issues = [
+            issue("1", "2024-01-01T10:00:00.000+0000", labels=["urgent"]),
+            issue("2", "2024-01-01T10:50:00.000+0100", status="Done", assignee=None),
+            issue("3", "2024-01-01T10:30:00.000+0000", labels=["urgent", "ui"]),
+        ]
+
+        def post(path, json):
+            jira.queries.append(json)
+            issues = jira.issues
+            if "updated >=" in json["jql"]:
+                issues = [i for i in issues if i["fields"]["updated"] > "2024-01-02"]
+            return {"total": len(issues), "issues": issues}
+
+        jira.queries = []
+        jira.post = MagicMock(side_effect=post)
+        return jira
+
+    @pytest.fixture
+    def mirror(self, jira, tmp_path):
+        mirror = jira.mirror(tmp_path / "jira.sqlite3", "project = P", time_zone="UTC")
+        yield mirror
+        mirror.close()
+
+    def test_refresh_and_query(self, mirror):
+        assert mirror.refresh() == 3
+        assert len(mirror) == 3
+        assert [i["key"] for i in mirror.issues()] == ["P-3", "P-1", "P-2"]
+        assert [i["key"] for i in mirror.issues(label="urgent", status="Open")] == [
+            "P-3",
+            "P-1",
+        ]
+        assert mirror.count(assignee="alice") == 2
+        assert mirror.count(issuetype="Bug", project="P") == 3
+        since = datetime(2024, 1, 1, 10, 15, tzinfo=timezone.utc)
+        assert [i["key"] for i in mirror.issues(updated_since=since)] == ["P-3"]
+        assert [i["key"] for i in mirror.issues(limit=1)] == ["P-3"]
+        assert mirror.issue("P-2")["fields"]["status"]["name"] == "Done"
+        assert mirror.issue("P-9") is None
+
+    def test_incremental_refresh(self, jira, mirror, tmp_path):
+        mirror.refresh()
+        jira.issues[0] = issue("1", "2024-01-02T09:00:00.000+0000", labels=["ui"])
+        assert mirror.refresh() == 1
+        assert "updated >=" in jira.queries[-1]["jql"]
+        assert mirror.count(label="urgent") == 1
+        assert mirror.count(label="ui") == 2
+
+        reopened = jira.mirror(tmp_path / "jira.sqlite3", "project = P")
+        assert reopened.sync.watermark == "2024-01-02T09:00:00.000+0000"
+        reopened.close()
+
+    def test_full_refresh_removes_missing_issues(self, jira, mirror):
+        mirror.refresh()
+        del jira.issues[1]
+        assert mirror.refresh(full=True) == 2
+        assert mirror.issue("P-2") is None
+        assert mirror.count() == 2
+
+    def test_failed_refresh_rolls_back(self, jira, mirror):
+        mirror.refresh()
+        jira.issues.append(issue("4", "2024-01-03T00:00:00.000+0000"))
+        jira.issues.append({"id": "5", "key": "P-5", "fields": {}})
+        with pytest.raises(KeyError):
+            mirror.refresh()
+        assert mirror.issue("P-4") is None
+        assert mirror.sync.watermark == "2024-01-01T10:30:00.000+0000"
+
+    def test_fields_include_indexed_columns(self, jira, tmp_path):
+        mirror = jira.mirror(tmp_path / "m.sqlite3", "", fields=["summary"])
+        assert mirror.sync.fields == [
+            "summary",
+            "project",
+            "issuetype",
+            "status",
+            "assignee",
+            "labels",
+            "updated",
+        ]
+        mirror.close()
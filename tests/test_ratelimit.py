@@ -0,0 +1,115 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from atlassian.ratelimit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("atlassian.ratelimit.time") as mock_time:
+        mock_time.monotonic.side_effect = fake.monotonic
+        mock_time.sleep.side_effect = fake.sleep
+        yield fake
+
+
+class TestTokenBucket:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_invalid_burst(self):
+        with pytest.raises(ValueError):
+            TokenBucket(1, burst=0)
+
+    def test_default_burst(self):
+        assert TokenBucket(5).burst == 5
+        assert TokenBucket(0.5).burst == 1
+
+    def test_burst_then_throttle(self, clock):
+        bucket = TokenBucket(rate=2, burst=2)
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.5
+        assert bucket.acquire() == 1.0
+        assert clock.sleeps == [0.5, 1.0]
+
+    def test_refill_over_time(self, clock):
+        bucket = TokenBucket(rate=1, burst=1)
+        bucket.acquire()
+        clock.now = 1.0
+        assert bucket.acquire() == 0.0
+
+    def test_refill_capped_at_burst(self, clock):
+        bucket = TokenBucket(rate=1, burst=2)
+        clock.now = 100.0
+        bucket.acquire()
+        bucket.acquire()
+        assert bucket.acquire() == 1.0
+
+    def test_thread_safety(self, clock):
+        bucket = TokenBucket(rate=10, burst=10)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(30)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(clock.sleeps) == 20
+        assert max(clock.sleeps) == pytest.approx(2.0)
+
+
+class TestRateLimiter:
+    def test_global_limit(self, clock):
+        limiter = RateLimiter(rate=1, burst=1)
+        assert limiter.acquire("/rest/api/2/issue/A-1") == 0.0
+        assert limiter.acquire("/rest/api/2/issue/A-2") == 1.0
+        assert limiter.requests == 2
+        assert limiter.waited_seconds == 1.0
+
+    def test_endpoint_limit(self, clock):
+        limiter = RateLimiter(rate=100, endpoints={"/rest/api/2/search": 1})
+        assert limiter.acquire("/rest/api/2/search") == 0.0
+        assert limiter.acquire("/rest/api/2/search") == 1.0
+        assert limiter.acquire("/rest/api/2/issue/A-1") == 0.0
+
+    def test_endpoint_limit_with_burst(self, clock):
+        limiter = RateLimiter(rate=100, endpoints={"/rest/api/2/search": (1, 2)})
+        assert limiter.acquire("/rest/api/2/search") == 0.0
+        assert limiter.acquire("/rest/api/2/search") == 0.0
+        assert limiter.acquire("/rest/api/2/search") == 1.0
+
+    def test_longest_prefix_wins(self, clock):
+        limiter = RateLimiter(rate=100)
+        limiter.add_endpoint("/rest/api", 100)
+        limiter.add_endpoint("/rest/api/2/search", 1)
+        limiter.acquire("/rest/api/2/search")
+        assert limiter.acquire("/rest/api/2/search") == 1.0
+
+    def test_endpoint_lookup_holds_lock(self, clock):
+        limiter = RateLimiter(rate=100)
+
+        class CheckedEndpoints(dict):
+            def __iter__(self):
+                assert limiter._lock.locked()
+                return super().__iter__()
+
+        limiter._endpoints = CheckedEndpoints()
+        limiter.add_endpoint("/rest/api/2/search", 1)
+        assert limiter.acquire("/rest/api/2/search") == 0.0
+        assert limiter.acquire("/rest/api/2/search") == 1.0
@@ -0,0 +1,114 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from atlassian.retry import RetryPolicy, RetryStats
+
+
+class TestRetryPolicy:
+    def test_invalid_max_attempts(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    def test_is_retryable_status(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable("GET", 429, 1)
+        assert policy.is_retryable("GET", 503, 1)
+        assert not policy.is_retryable("GET", 500, 1)
+        assert not policy.is_retryable("GET", 404, 1)
+
+    def test_is_retryable_idempotent_methods_only(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable("put", 503, 1)
+        assert not policy.is_retryable("POST", 503, 1)
+
+    def test_is_retryable_custom_methods(self):
+        policy = RetryPolicy(methods=["POST"])
+        assert policy.is_retryable("POST", 429, 1)
+        assert not policy.is_retryable("GET", 429, 1)
+
+    def test_is_retryable_stops_at_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.is_retryable("GET", 429, 2)
+        assert not policy.is_retryable("GET", 429, 3)
+
+    def test_is_retryable_connection_error(self):
+        assert RetryPolicy().is_retryable("GET", None, 1)
+        assert not RetryPolicy(retry_connection_errors=False).is_retryable(
+            "GET", None, 1
+        )
+
+    def test_backoff_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_cap=5.0, jitter=False)
+        assert policy.backoff(1) == 1.0
+        assert policy.backoff(2) == 2.0
+        assert policy.backoff(3) == 4.0
+        assert policy.backoff(4) == 5.0
+
+    def test_backoff_with_jitter(self):
+        policy = RetryPolicy(backoff_base=1.0, jitter=True)
+        for _ in range(20):
+            assert 0 <= policy.backoff(3) <= 4.0
+
+    def test_server_delay_retry_after_seconds(self):
+        assert RetryPolicy().server_delay({"Retry-After": "7"}) == 7.0
+
+    def test_server_delay_retry_after_http_date(self):
+        value = formatdate(time.time() + 30, usegmt=True)
+        delay = RetryPolicy().server_delay({"Retry-After": value})
+        assert 25 <= delay <= 30
+
+    def test_server_delay_rate_limit_reset_epoch(self):
+        headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 10),
+        }
+        delay = RetryPolicy().server_delay(headers)
+        assert 8 <= delay <= 10
+
+    def test_server_delay_rate_limit_reset_iso(self):
+        headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "2000-01-01T00:00:00Z",
+        }
+        assert RetryPolicy().server_delay(headers) == 0.0
+
+    def test_server_delay_ignores_reset_when_remaining(self):
+        headers = {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "9999999999"}
+        assert RetryPolicy().server_delay(headers) is None
+
+    def test_server_delay_unparsable(self):
+        assert RetryPolicy().server_delay({"Retry-After": "soon"}) is None
+
+    def test_wait_time_prefers_server_delay(self):
+        policy = RetryPolicy(backoff_base=1.0, jitter=False)
+        assert policy.wait_time(1, {"Retry-After": "3"}) == 3.0
+        assert policy.wait_time(2, {}) == 2.0
+
+    def test_wait_time_ignores_headers_when_disabled(self):
+        policy = RetryPolicy(backoff_base=1.0, jitter=False, respect_retry_after=False)
+        assert policy.wait_time(1, {"Retry-After": "3"}) == 1.0
+
+    def test_wait_time_too_long(self):
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.wait_time(1, {"Retry-After": "60"}) is None
+
+
+class TestRetryStats:
+    def test_record_and_reset(self):
+        stats = RetryStats()
+        stats.record_retry(429, 1.5)
+        stats.record_retry(429, 0.5)
+        stats.record_retry(None, 1.0)
+        stats.record_exhausted()
+        assert stats.retries == 3
+        assert stats.backoff_seconds == 3.0
+        assert stats.by_status == {429: 2, None: 1}
+        assert stats.exhausted == 1
+        assert "retries=3" in repr(stats)
+
+        stats.reset()
+        assert stats.retries == 0
+        assert stats.backoff_seconds == 0.0
+        assert stats.by_status == {}
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+from atlassian.client import AtlassianAPI
+from atlassian.error import APIError
+from atlassian.singleflight import SingleFlight
+
+
+def run_threads(count, target):
+    results = [None] * count
+    errors = [None] * count
+
+    def work(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        def caller():
+            return flight.do("key", slow)
+
+        leader = threading.Thread(target=caller)
+        leader.start()
+        started.wait(5)
+        followers = []
+        thread = threading.Thread(
+            target=lambda: followers.extend(run_threads(4, caller)[0])
+        )
+        thread.start()
+        while flight.shared < 4:
+            time.sleep(0.001)
+        release.set()
+        thread.join()
+        leader.join()
+
+        assert followers == ["value"] * 4
+        assert len(calls) == 1
+        assert (flight.calls, flight.shared) == (1, 4)
+
+    def test_errors_are_shared(self):
+        flight = SingleFlight()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def failing():
+            time.sleep(0.05)
+            raise APIError(503, "down")
+
+        def caller():
+            barrier.wait()
+            return flight.do("key", failing)
+
+        results, errors = run_threads(3, caller)
+        assert all(isinstance(error, APIError) for error in errors)
+        assert flight.calls + flight.shared == 3
+
+    def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight()
+        func = MagicMock(side_effect=[1, 2])
+        assert flight.do("key", func) == 1
+        assert flight.do("key", func) == 2
+        assert "calls=2" in repr(flight)
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.shared == 0
+
+    def test_do_async(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do_async("key", fetch) for _ in range(5)),
+                flight.do_async("other", fetch),
+            )
+
+        assert asyncio.run(main()) == ["value"] * 6
+        assert len(calls) == 2
+        assert (flight.calls, flight.shared) == (2, 4)
+
+    def test_do_async_error(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise APIError(404, "missing")
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do_async("key", fetch) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, APIError) for r in asyncio.run(main()))
+
+
+class TestClientSingleFlight:
+    def test_identical_gets_share_one_request(self):
+        api = AtlassianAPI(url="https://example.com", single_flight=SingleFlight())
+        barrier = threading.Barrier(4, timeout=5)
+        response = MagicMock(status_code=200, text='{"key": "PROJ-123"}')
+
+        def slow_request(**kwargs):
+            time.sleep(0.1)
+            return response
+
+        api._session.request = MagicMock(side_effect=slow_request)
+
+        def caller():
+            barrier.wait()
+            return api.get("/rest/api/2/issue/PROJ-123", params={"expand": "x"})
+
+        results, errors = run_threads(4, caller)
+        assert errors == [None] * 4
+        assert [r.key for r in results] == ["PROJ-123"] * 4
+        assert len({id(r) for r in results}) == 4
+        assert api._session.request.call_count < 4
+
+    def test_requests_with_body_are_not_coalesced(self):
+        flight = SingleFlight()
+        api = AtlassianAPI(url="https://example.com", single_flight=flight)
+        api.request = MagicMock(return_value=MagicMock(text="{}"))
+        api.get("/a", data={"x": 1})
+        api.get("/a")
+        assert flight.calls == 1
+        api.request.assert_called_with("GET", "/a", data=None, params=None)
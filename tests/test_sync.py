@@ -0,0 +1,128 @@
+import json
+import re
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from atlassian.jira import Jira
+from atlassian.sync import JiraSync, parse_jira_time
+
+
+def issue(issue_id, updated):
+    return {"id": issue_id, "key": f"P-{issue_id}", "fields": {"updated": updated}}
+
+
+class FakeSearch:
+    def __init__(self, issues):
+        self.issues = issues
+        self.queries = []
+
+    def __call__(self, path, json):
+        self.queries.append(json)
+        match = re.search(r'updated >= "([^"]+)"', json["jql"])
+        matching = sorted(self.issues, key=lambda i: i["fields"]["updated"])
+        if match:
+            start = datetime.strptime(match.group(1), "%Y/%m/%d %H:%M")
+            start = start.replace(tzinfo=timezone.utc)
+            matching = [
+                i for i in matching if parse_jira_time(i["fields"]["updated"]) >= start
+            ]
+        page = matching[json["startAt"] : json["startAt"] + json["maxResults"]]
+        return {
+            "total": len(matching),
+            "maxResults": json["maxResults"],
+            "issues": page,
+        }
+
+
+class TestJiraSync:
+    @pytest.fixture
+    def jira(self):
+        jira = Jira(url="https://fake_url")
+        jira.get = MagicMock(return_value={"timeZone": "UTC"})
+        return jira
+
+    def test_parse_jira_time(self):
+        value = parse_jira_time("2024-01-02T10:15:30.000+0100")
+        assert value == datetime(2024, 1, 2, 9, 15, 30, tzinfo=timezone.utc)
+
+    def test_incremental_runs(self, jira, tmp_path):
+        search = FakeSearch(
+            [issue(str(i), f"2024-01-01T10:0{i}:00.000+0000") for i in range(5)]
+        )
+        jira.post = MagicMock(side_effect=search)
+        state = tmp_path / "state.json"
+
+        sync = jira.sync("project = P ORDER BY key", state_path=state, page_size=2)
+        assert [i["id"] for i in sync.issues()] == ["0", "1", "2", "3", "4"]
+        assert search.queries[0]["jql"] == "(project = P) ORDER BY updated ASC"
+        assert json.loads(state.read_text())["watermark"] == (
+            "2024-01-01T10:04:00.000+0000"
+        )
+
+        search.issues[1] = issue("1", "2024-01-01T11:00:00.000+0000")
+        search.queries.clear()
+        sync = jira.sync("project = P", state_path=state, page_size=2)
+        assert [i["id"] for i in sync.issues()] == ["1"]
+        assert search.queries[0]["jql"] == (
+            '(project = P) AND updated >= "2024/01/01 10:03" ORDER BY updated ASC'
+        )
+        assert list(sync.issues()) == []
+        jira.get.assert_called_with("/rest/api/2/myself", response_format="dict")
+
+    def test_issues_updated_during_run_are_not_skipped(self, jira):
+        issues = [issue(str(i), f"2024-01-01T10:0{i}:00.000+0000") for i in range(6)]
+        search = FakeSearch(issues)
+
+        def post(path, json):
+            response = search(path, json)
+            if len(search.queries) == 1:
+                issues[0] = issue("0", "2024-01-01T12:00:00.000+0000")
+            return response
+
+        jira.post = MagicMock(side_effect=post)
+        sync = JiraSync(jira, "", page_size=2, time_zone="UTC")
+        seen = [(i["id"], i["fields"]["updated"][11:16]) for i in sync.issues()]
+        assert [i for i, _ in seen] == ["0", "1", "2", "3", "4", "5", "0"]
+        assert seen[-1] == ("0", "12:00")
+        assert search.queries[1]["jql"] == (
+            'updated >= "2024/01/01 10:01" ORDER BY updated ASC'
+        )
+
+    def test_many_issues_in_one_minute(self, jira):
+        issues = [issue(str(i), f"2024-01-01T10:00:0{i}.000+0000") for i in range(5)]
+        search = FakeSearch(issues)
+        jira.post = MagicMock(side_effect=search)
+        sync = JiraSync(jira, "project = P", page_size=2, time_zone="UTC")
+        list(sync.issues())
+        search.queries.clear()
+        assert [i["id"] for i in sync.issues()] == []
+        assert [q["startAt"] for q in search.queries] == [0, 0, 2, 4]
+
+    def test_fields_include_updated(self, jira):
+        jira.post = MagicMock(return_value={"total": 0, "issues": []})
+        sync = JiraSync(jira, "project = P", fields=["summary"], time_zone="UTC")
+        list(sync.issues())
+        assert jira.post.call_args.kwargs["json"]["fields"] == ["summary", "updated"]
+
+    def test_state_of_other_query_ignored(self, jira, tmp_path):
+        state = tmp_path / "state.json"
+        state.write_text(json.dumps({"jql": "project = Q", "watermark": "x"}))
+        sync = JiraSync(jira, "project = P", state_path=state)
+        assert sync.watermark is None
+        sync.watermark = "2024-01-01T10:00:00.000+0000"
+        sync.save()
+        assert JiraSync(jira, "project = P", state_path=state).watermark == (
+            sync.watermark
+        )
+        sync.reset()
+        assert not state.exists()
+
+    def test_unknown_time_zone(self, jira):
+        sync = JiraSync(jira, "", time_zone="Nowhere/Unknown")
+        assert sync._user_time_zone() is timezone.utc
+
+    def test_invalid_page_size(self, jira):
+        with pytest.raises(ValueError):
+            JiraSync(jira, "", page_size=0)